@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+
+import logging
+import typing as t
+from pathlib import Path
+
+import pyperf
+
+from sqlmesh.core.context import Context
+from sqlmesh.core.model.cache import OptimizedQueryCacheEntry
+from sqlmesh.utils.cache import CacheCodec
+from sqlmesh.utils.errors import SQLMeshError
+
+logging.getLogger().setLevel(logging.WARNING)
+
+EXAMPLES_PATH = Path(__file__).parent.parent / "examples"
+PROJECTS = {
+    "sushi": [EXAMPLES_PATH / "sushi"],
+    "sushi_dbt": [EXAMPLES_PATH / "sushi_dbt"],
+    "multi": [EXAMPLES_PATH / "multi" / "repo_1", EXAMPLES_PATH / "multi" / "repo_2"],
+    "wursthall": [EXAMPLES_PATH / "wursthall"],
+}
+
+
+def cache_entries(paths: t.List[Path]) -> t.List[t.Any]:
+    """Returns the values which would be stored in the model and optimized query caches."""
+    context = Context(paths=paths)
+    entries: t.List[t.Any] = []
+    for model in context.models.values():
+        entries.append([model])
+        if model.is_sql:
+            entries.append(
+                OptimizedQueryCacheEntry(
+                    optimized_rendered_query=model.render_query(),
+                    renderer_violations=None,
+                )
+            )
+    return entries
+
+
+def benchmark_decode(loops: int, codec: CacheCodec, entries: t.List[t.Any]) -> float:
+    encoded = [codec.dumps(entry) for entry in entries]
+
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        for data in encoded:
+            codec.loads(data)
+    return pyperf.perf_counter() - t0
+
+
+def benchmark_encode(loops: int, codec: CacheCodec, entries: t.List[t.Any]) -> float:
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        for entry in entries:
+            codec.dumps(entry)
+    return pyperf.perf_counter() - t0
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+
+    codecs = []
+    for codec in CacheCodec:
+        try:
+            codec.ensure_available()
+            codecs.append(codec)
+        except SQLMeshError:
+            pass
+
+    for project, paths in PROJECTS.items():
+        entries = cache_entries(paths)
+        for codec in codecs:
+            size = sum(len(codec.dumps(entry)) for entry in entries)
+            runner.bench_time_func(
+                f"cache_decode_{project}_{codec.value}",
+                benchmark_decode,
+                codec,
+                entries,
+                metadata={"encoded_size_bytes": size},
+            )
+            runner.bench_time_func(
+                f"cache_encode_{project}_{codec.value}", benchmark_encode, codec, entries
+            )
+
+
+if __name__ == "__main__":
+    main()
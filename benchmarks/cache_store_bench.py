@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+
+import tempfile
+from pathlib import Path
+
+import pyperf
+
+from sqlmesh.utils.cache import CacheStore, FileCache
+
+NUM_ENTRIES = 20_000
+# Roughly the size of a small pickled snapshot
+ENTRY = {"name": "db.model", "columns": {f"col_{i}": "INT" for i in range(50)}}
+
+
+def populate(path: Path, store: CacheStore) -> None:
+    cache: FileCache[dict] = FileCache(path, prefix="snapshot", store=store)
+    for i in range(NUM_ENTRIES):
+        cache.put(f"entry_{i}", value=ENTRY)
+
+
+def benchmark_open_and_read(loops: int, store: CacheStore) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp)
+        populate(path, store)
+
+        t0 = pyperf.perf_counter()
+        for _ in range(loops):
+            # Opening the cache evicts stale entries, which used to require a stat per file
+            cache: FileCache[dict] = FileCache(path, prefix="snapshot", store=store)
+            for i in range(NUM_ENTRIES):
+                cache.get(f"entry_{i}")
+        return pyperf.perf_counter() - t0
+
+
+def benchmark_write(loops: int, store: CacheStore) -> float:
+    elapsed = 0.0
+    for _ in range(loops):
+        with tempfile.TemporaryDirectory() as tmp:
+            t0 = pyperf.perf_counter()
+            populate(Path(tmp), store)
+            elapsed += pyperf.perf_counter() - t0
+    return elapsed
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    for store in CacheStore:
+        runner.bench_time_func(
+            f"cache_open_and_read_20k_{store.value}", benchmark_open_and_read, store
+        )
+        runner.bench_time_func(f"cache_write_20k_{store.value}", benchmark_write, store)
+
+
+if __name__ == "__main__":
+    main()
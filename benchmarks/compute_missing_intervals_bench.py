@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+
+import pyperf
+
+from sqlmesh.core.node import IntervalUnit
+from sqlmesh.core.snapshot.definition import compute_missing_intervals, merge_intervals
+from sqlmesh.utils.date import to_timestamp
+
+START_TS = to_timestamp("2024-01-01")
+END_TS = to_timestamp("2025-01-01")
+LOOKBACK = 2
+
+
+def stored_intervals(interval_unit: IntervalUnit) -> tuple:
+    # Every 10th interval is missing to simulate a partially backfilled model
+    unit_ms = interval_unit.milliseconds
+    return tuple(
+        merge_intervals(
+            [
+                (ts, ts + unit_ms)
+                for i, ts in enumerate(range(START_TS, END_TS, unit_ms))
+                if i % 10 != 0
+            ]
+        )
+    )
+
+
+def benchmark_compute_missing_intervals(loops: int, interval_unit: IntervalUnit) -> float:
+    intervals = stored_intervals(interval_unit)
+
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        compute_missing_intervals.cache_clear()
+        compute_missing_intervals(interval_unit, intervals, START_TS, END_TS, LOOKBACK, None)
+    return pyperf.perf_counter() - t0
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    for interval_unit in (IntervalUnit.HOUR, IntervalUnit.QUARTER_HOUR, IntervalUnit.FIVE_MINUTE):
+        runner.bench_time_func(
+            f"compute_missing_intervals_1y_{interval_unit.value}",
+            benchmark_compute_missing_intervals,
+            interval_unit,
+        )
+
+
+if __name__ == "__main__":
+    main()
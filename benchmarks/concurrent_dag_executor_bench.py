@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+
+import pyperf
+
+from sqlmesh.utils.concurrency import concurrent_apply_to_dag, critical_path_priority
+from sqlmesh.utils.dag import DAG
+
+NUM_NODES = 100_000
+# Mimics the scheduler DAG: many short chains of batches which depend on a handful of upstream nodes
+CHAIN_LENGTH = 24
+FAN_IN = 3
+
+
+def build_dag(num_nodes: int) -> DAG[int]:
+    graph = {}
+    for node in range(num_nodes):
+        deps = set()
+        if node % CHAIN_LENGTH:
+            deps.add(node - 1)
+        else:
+            # The first batch of each chain depends on the last batches of the previous chains
+            deps.update(
+                node - i * CHAIN_LENGTH - 1
+                for i in range(FAN_IN)
+                if node - i * CHAIN_LENGTH - 1 >= 0
+            )
+        graph[node] = deps
+    return DAG(graph)
+
+
+def benchmark_executor(loops: int, use_priority: bool) -> float:
+    dag = build_dag(NUM_NODES)
+
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        priority = critical_path_priority(dag) if use_priority else None
+        concurrent_apply_to_dag(dag, lambda _: None, 8, priority=priority)
+    return pyperf.perf_counter() - t0
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    runner.bench_time_func("concurrent_dag_executor_100k", benchmark_executor, False)
+    runner.bench_time_func("concurrent_dag_executor_100k_critical_path", benchmark_executor, True)
+
+
+if __name__ == "__main__":
+    main()
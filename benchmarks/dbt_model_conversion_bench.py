@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+
+import logging
+import shutil
+import tempfile
+from pathlib import Path
+
+import pyperf
+
+from sqlmesh.core import constants as c
+from sqlmesh.core.context import Context
+from sqlmesh.core.loader import Loader
+from sqlmesh.core.macros import macro
+from sqlmesh.utils import UniqueKeyDict
+from sqlmesh.utils.jinja import JinjaMacroRegistry
+
+logging.getLogger().setLevel(logging.WARNING)
+
+NUM_MODELS = 300
+WORKER_COUNTS = (1, 2, 4)
+
+DBT_PROJECT = """
+name: bench
+version: 1.0.0
+config-version: 2
+profile: bench
+
+models:
+  +start: Jan 1 2024
+"""
+
+PROFILES = """
+bench:
+  outputs:
+    in_memory:
+      type: duckdb
+      schema: bench
+  target: in_memory
+"""
+
+CONFIG = """
+from pathlib import Path
+
+from sqlmesh.dbt.loader import sqlmesh_config
+
+config = sqlmesh_config(Path(__file__).parent)
+"""
+
+MACROS = """
+{% macro cents_to_dollars(column) %}({{ column }} / 100)::NUMERIC(16, 2){% endmacro %}
+"""
+
+
+def create_project(root: Path) -> None:
+    """Creates a dbt project in which every model is incremental and references the previous one."""
+    (root / "models").mkdir()
+    (root / "macros").mkdir()
+    (root / "dbt_project.yml").write_text(DBT_PROJECT)
+    (root / "profiles.yml").write_text(PROFILES)
+    (root / "config.py").write_text(CONFIG)
+    (root / "macros" / "macros.sql").write_text(MACROS)
+
+    for i in range(NUM_MODELS):
+        upstream = (
+            f"{{{{ ref('model_{i - 1}') }}}}"
+            if i
+            else "(SELECT 1 AS id, 100 AS amount, CURRENT_DATE AS ds)"
+        )
+        (root / "models" / f"model_{i}.sql").write_text(
+            f"""
+{{{{ config(materialized='incremental', incremental_strategy='delete+insert', unique_key='id') }}}}
+
+SELECT id, {{{{ cents_to_dollars('amount') }}}} AS amount_dollars, amount, ds
+FROM {upstream} AS upstream
+{{% if is_incremental() %}}
+WHERE ds > (SELECT MAX(ds) FROM {{{{ this }}}})
+{{% endif %}}
+"""
+        )
+
+
+def benchmark_load_models(loops: int, context: Context, loader: Loader, workers: int) -> float:
+    elapsed = 0.0
+    c.MAX_FORK_WORKERS = workers
+    for _ in range(loops):
+        shutil.rmtree(context.cache_dir, ignore_errors=True)
+        t0 = pyperf.perf_counter()
+        loader._load_models(
+            macro.get_registry(),
+            JinjaMacroRegistry(),
+            None,
+            UniqueKeyDict("audits"),
+            UniqueKeyDict("signals"),
+        )
+        elapsed += pyperf.perf_counter() - t0
+    return elapsed
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    root = Path(tempfile.mkdtemp())
+    try:
+        create_project(root)
+        context = Context(paths=root)
+        loader = context._loaders[0]
+        for workers in WORKER_COUNTS:
+            runner.bench_time_func(
+                f"dbt_load_{NUM_MODELS}_models_{workers}_workers",
+                benchmark_load_models,
+                context,
+                loader,
+                workers,
+            )
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
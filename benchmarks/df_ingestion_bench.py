@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+
+import tracemalloc
+import typing as t
+
+import duckdb  # noqa: TID253
+import numpy as np  # noqa: TID253
+import pandas as pd  # noqa: TID253
+import pyperf
+from sqlglot import exp
+
+from sqlmesh.core.engine_adapter import DuckDBEngineAdapter, EngineAdapter
+
+NUM_ROWS = 20_000
+COLUMNS_TO_TYPES = {
+    "id": exp.DataType.build("BIGINT"),
+    "value": exp.DataType.build("DOUBLE"),
+    "name": exp.DataType.build("TEXT"),
+    "ts": exp.DataType.build("TIMESTAMP"),
+}
+
+
+def make_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "id": np.arange(NUM_ROWS),
+            "value": np.random.default_rng(0).random(NUM_ROWS),
+            "name": [f"name_{i}" for i in range(NUM_ROWS)],
+            "ts": pd.date_range("2024-01-01", periods=NUM_ROWS, freq="s"),
+        }
+    )
+
+
+class ValuesDuckDBEngineAdapter(DuckDBEngineAdapter):
+    """Forces the generic VALUES fallback instead of DuckDB's native DataFrame scan."""
+
+    _df_to_source_queries = EngineAdapter._df_to_source_queries  # type: ignore
+
+
+def ingest(adapter_class: t.Type[DuckDBEngineAdapter], df: t.Any) -> None:
+    connection = duckdb.connect()
+    adapter = adapter_class(lambda: connection)
+    adapter.replace_query("test_table", df, COLUMNS_TO_TYPES)
+    adapter.close()
+
+
+def benchmark_ingest(loops: int, adapter_class: t.Type[DuckDBEngineAdapter], df: t.Any) -> float:
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        ingest(adapter_class, df)
+    return pyperf.perf_counter() - t0
+
+
+def peak_memory_bytes(adapter_class: t.Type[DuckDBEngineAdapter], df: t.Any) -> int:
+    tracemalloc.start()
+    try:
+        ingest(adapter_class, df)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    import pyarrow as pa
+
+    runner = pyperf.Runner()
+    df = make_df()
+    inputs = {
+        "values_pandas": (ValuesDuckDBEngineAdapter, df),
+        "native_pandas": (DuckDBEngineAdapter, df),
+        "native_arrow": (DuckDBEngineAdapter, pa.Table.from_pandas(df)),
+    }
+    for name, (adapter_class, data) in inputs.items():
+        runner.bench_time_func(
+            f"df_ingestion_duckdb_20k_{name}",
+            benchmark_ingest,
+            adapter_class,
+            data,
+            metadata={"peak_python_memory_bytes": peak_memory_bytes(adapter_class, data)},
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+
+import pyperf
+
+from sqlmesh.core.node import IntervalUnit
+from sqlmesh.core.snapshot.definition import expand_range
+from sqlmesh.utils.cron import CroniterCache
+from sqlmesh.utils.date import to_timestamp
+
+START_TS = to_timestamp("2020-01-01")
+END_TS = to_timestamp("2025-01-01")
+
+
+def croniter_expand_range(start_ts: int, end_ts: int, interval_unit: IntervalUnit) -> list:
+    # The croniter based implementation which is still used for units with a variable width
+    croniter = CroniterCache(interval_unit.cron_expr, start_ts)
+    timestamps = [start_ts]
+    while True:
+        ts = to_timestamp(croniter.get_next(estimate=True))
+        if ts > end_ts:
+            if timestamps[-1] != end_ts:
+                timestamps.append(end_ts)
+            break
+        timestamps.append(ts)
+    return timestamps
+
+
+def benchmark_expand_range(loops: int, use_croniter: bool) -> float:
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        if use_croniter:
+            croniter_expand_range(START_TS, END_TS, IntervalUnit.HOUR)
+        else:
+            expand_range.cache_clear()
+            expand_range(START_TS, END_TS, IntervalUnit.HOUR)
+    return pyperf.perf_counter() - t0
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    runner.bench_time_func("expand_range_5y_hourly", benchmark_expand_range, False)
+    runner.bench_time_func("expand_range_5y_hourly_croniter", benchmark_expand_range, True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+
+import logging
+import tempfile
+from pathlib import Path
+
+import duckdb  # noqa: TID253
+import pyperf
+from sqlglot import parse_one
+
+from sqlmesh.core.engine_adapter import create_engine_adapter
+from sqlmesh.core.environment import Environment
+from sqlmesh.core.model import SqlModel
+from sqlmesh.core.snapshot import Snapshot, SnapshotChangeCategory, SnapshotFingerprint
+from sqlmesh.core.state_sync import EngineAdapterStateSync
+from sqlmesh.utils.date import now_timestamp
+
+logging.getLogger().setLevel(logging.WARNING)
+
+NUM_MODELS = 500
+VERSIONS_PER_MODEL = 40
+# Every 4th version of each model is still part of an environment
+IN_USE_EVERY = 4
+
+
+def seed_state(cache_dir: Path) -> EngineAdapterStateSync:
+    state_sync = EngineAdapterStateSync(
+        create_engine_adapter(duckdb.connect, "duckdb"), schema="sqlmesh", cache_dir=cache_dir
+    )
+    state_sync.migrate()
+
+    template = Snapshot.from_node(
+        SqlModel(name="db.model", query=parse_one("SELECT 1 AS a, ds")), nodes={}
+    )
+    template.categorize_as(SnapshotChangeCategory.BREAKING)
+    expired_ts = now_timestamp() - template.ttl_ms - 1000
+
+    in_use = []
+    for i in range(NUM_MODELS):
+        snapshots = []
+        for j in range(VERSIONS_PER_MODEL):
+            # Pairs of snapshots share the same version to exercise the shared table checks
+            fingerprint = SnapshotFingerprint(data_hash=f"{i}_{j}", metadata_hash="0")
+            version = f"{i}_{j // 2}"
+            snapshot = template.copy(
+                update={
+                    "name": f'"db"."model_{i}"',
+                    "fingerprint": fingerprint,
+                    "version": version,
+                    "dev_version_": version,
+                    "updated_ts": expired_ts,
+                }
+            )
+            snapshots.append(snapshot)
+            if j % IN_USE_EVERY == 0:
+                in_use.append(snapshot.table_info)
+        state_sync.push_snapshots(snapshots)
+
+    state_sync.promote(
+        Environment(
+            name="dev",
+            snapshots=in_use,
+            start_at="2024-01-01",
+            end_at="2024-01-01",
+            plan_id="plan",
+        )
+    )
+    return state_sync
+
+
+def benchmark_get_expired_snapshots(loops: int, state_sync: EngineAdapterStateSync) -> float:
+    t0 = pyperf.perf_counter()
+    for _ in range(loops):
+        state_sync.get_expired_snapshots()
+    return pyperf.perf_counter() - t0
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    with tempfile.TemporaryDirectory() as tmp:
+        state_sync = seed_state(Path(tmp))
+        runner.bench_time_func(
+            f"get_expired_snapshots_{NUM_MODELS * VERSIONS_PER_MODEL}",
+            benchmark_get_expired_snapshots,
+            state_sync,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+
+import logging
+
+import pyperf
+
+from sqlmesh.utils.jinja import JinjaMacroRegistry, MacroInfo
+
+logging.getLogger().setLevel(logging.WARNING)
+
+NUM_PACKAGES = 5
+NUM_MACROS_PER_PACKAGE = 400
+NUM_RENDERS = 100
+
+QUERY = """
+SELECT {{ package_0.macro_1('a') }} AS a, {{ root_macro_1() }} AS b
+FROM {{ this }}
+WHERE ds BETWEEN '{{ start_ds }}' AND '{{ end_ds }}'
+"""
+
+
+def registry() -> JinjaMacroRegistry:
+    """Returns a registry with as many macros as a dbt project which depends on a few packages."""
+    registry = JinjaMacroRegistry(
+        create_builtins_module="sqlmesh.dbt",
+        root_package_name="project",
+        top_level_packages=["dbt"],
+    )
+    for package in range(NUM_PACKAGES):
+        registry.add_macros(
+            {
+                f"macro_{i}": MacroInfo(
+                    definition=(
+                        f"{{% macro macro_{i}(column) %}}{{{{ column }}}} + {i}{{% endmacro %}}"
+                    ),
+                    depends_on=[],
+                )
+                for i in range(NUM_MACROS_PER_PACKAGE)
+            },
+            package=f"package_{package}",
+        )
+    registry.add_macros(
+        {
+            f"root_macro_{i}": MacroInfo(
+                definition=f"{{% macro root_macro_{i}() %}}{i}{{% endmacro %}}",
+                depends_on=[],
+            )
+            for i in range(NUM_MACROS_PER_PACKAGE)
+        }
+    )
+    return registry
+
+
+def benchmark_render(loops: int, registry: JinjaMacroRegistry) -> float:
+    elapsed = 0.0
+    for _ in range(loops):
+        t0 = pyperf.perf_counter()
+        for i in range(NUM_RENDERS):
+            env = registry.build_environment(
+                this={"database": "db", "schema": "schema", "identifier": "model"},
+                target={"type": "duckdb", "name": "dev", "schema": "schema", "database": "db"},
+                refs={},
+                sources={},
+                vars={},
+                start_ds=f"2024-01-{i % 28 + 1:02}",
+                end_ds=f"2024-01-{i % 28 + 1:02}",
+            )
+            env.from_string(QUERY).render()
+        elapsed += pyperf.perf_counter() - t0
+    return elapsed
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    runner.bench_time_func(
+        f"render_{NUM_RENDERS}_models_with_{(NUM_PACKAGES + 1) * NUM_MACROS_PER_PACKAGE}_macros",
+        benchmark_render,
+        registry(),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+
+import logging
+import typing as t
+
+import pyperf
+from sqlglot import parse_one
+
+from sqlmesh.core import constants as c
+from sqlmesh.core.model import IncrementalByTimeRangeKind, SqlModel
+from sqlmesh.utils.date import to_timestamp
+from sqlmesh.utils.metaprogramming import Executable, SqlValue, _compile_payload
+
+logging.getLogger().setLevel(logging.WARNING)
+
+NUM_MODELS = 1000
+NUM_INTERVALS = 24
+START_TS = to_timestamp("2024-01-01")
+HOUR_MS = 60 * 60 * 1000
+
+# A shared library of macros, similar to what every model of a large project references
+MACRO_LIBRARY = {
+    f"macro_{i}": Executable(
+        name=f"macro_{i}",
+        path=f"macros/macro_{i}.py",
+        payload=f"""def macro_{i}(evaluator, column):
+    values = [exp.Literal.number(v) for v in range({i} + 1)]
+    return exp.Coalesce(this=column, expressions=values)""",
+    )
+    for i in range(20)
+}
+
+
+def models() -> t.List[SqlModel]:
+    return [
+        SqlModel(
+            name=f"db.model_{i}",
+            kind=IncrementalByTimeRangeKind(time_column="ds"),
+            cron="@hourly",
+            query=parse_one(
+                f"SELECT @macro_{i % 20}(a) AS a, @threshold AS t, ds FROM db.source_{i} "
+                "WHERE ds BETWEEN @start_ds AND @end_ds"
+            ),
+            python_env={
+                "exp": Executable(payload="from sqlglot import exp", kind="import"),
+                **MACRO_LIBRARY,
+                c.SQLMESH_VARS: Executable.value({"threshold": SqlValue(sql=f"{i} + 1")}),
+            },
+        )
+        for i in range(NUM_MODELS)
+    ]
+
+
+def benchmark_render(loops: int, models: t.List[SqlModel], cached: bool) -> float:
+    elapsed = 0.0
+    for _ in range(loops):
+        t0 = pyperf.perf_counter()
+        for model in models:
+            for i in range(NUM_INTERVALS):
+                if not cached:
+                    _compile_payload.cache_clear()
+                start = START_TS + i * HOUR_MS
+                model.render_query(start=start, end=start + HOUR_MS - 1)
+        elapsed += pyperf.perf_counter() - t0
+    return elapsed
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    rendered_models = models()
+    for name, cached in (("uncached", False), ("cached", True)):
+        runner.bench_time_func(
+            f"render_{NUM_MODELS}_models_x_{NUM_INTERVALS}_intervals_{name}",
+            benchmark_render,
+            rendered_models,
+            cached,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+
+import json
+import logging
+import tempfile
+import typing as t
+from pathlib import Path
+
+import duckdb  # noqa: TID253
+import pyperf
+
+from sqlmesh.core.context import Context
+from sqlmesh.core.engine_adapter import create_engine_adapter
+from sqlmesh.core.snapshot import Snapshot, SnapshotChangeCategory, SnapshotId
+from sqlmesh.core.state_sync import EngineAdapterStateSync
+
+logging.getLogger().setLevel(logging.WARNING)
+
+EXAMPLES_PATH = Path(__file__).parent.parent / "examples"
+NUM_COPIES = 100
+
+
+def seed_state(cache_dir: Path) -> t.Tuple[EngineAdapterStateSync, t.List[SnapshotId]]:
+    state_sync = EngineAdapterStateSync(
+        create_engine_adapter(duckdb.connect, "duckdb"), schema="sqlmesh", cache_dir=cache_dir
+    )
+    state_sync.migrate()
+
+    context = Context(paths=[EXAMPLES_PATH / "sushi"])
+    payloads = [snapshot.json() for snapshot in context.snapshots.values()]
+    snapshot_ids = []
+    for i in range(NUM_COPIES):
+        # Copies of the project's snapshots with distinct identifiers
+        snapshots = []
+        for payload in payloads:
+            payload = json.loads(payload)
+            payload["fingerprint"]["data_hash"] += f"_{i}"
+            snapshots.append(Snapshot.parse_obj(payload))
+        for snapshot in snapshots:
+            snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+        state_sync.push_snapshots(snapshots)
+        snapshot_ids.extend(snapshot.snapshot_id for snapshot in snapshots)
+    return state_sync, snapshot_ids
+
+
+def benchmark_cold_load(
+    loops: int,
+    state_sync: EngineAdapterStateSync,
+    snapshot_ids: t.List[SnapshotId],
+    parallel_parse_threshold: int,
+) -> float:
+    snapshot_state = state_sync.snapshot_state
+    snapshot_state.PARALLEL_PARSE_THRESHOLD = parallel_parse_threshold
+
+    elapsed = 0.0
+    for _ in range(loops):
+        # Snapshots that are missing in the cache have to be parsed from their payloads
+        snapshot_state.clear_cache()
+        t0 = pyperf.perf_counter()
+        snapshot_state.get_snapshots(snapshot_ids)
+        elapsed += pyperf.perf_counter() - t0
+    return elapsed
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    with tempfile.TemporaryDirectory() as tmp:
+        state_sync, snapshot_ids = seed_state(Path(tmp))
+        for name, threshold in (("serial", len(snapshot_ids) + 1), ("parallel", 1)):
+            runner.bench_time_func(
+                f"snapshot_cold_load_{len(snapshot_ids)}_{name}",
+                benchmark_cold_load,
+                state_sync,
+                snapshot_ids,
+                threshold,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+
+import typing as t
+
+import duckdb  # noqa: TID253
+import pandas as pd  # noqa: TID253
+import pyperf
+from sqlglot import exp
+
+from sqlmesh.core.engine_adapter import EngineAdapter, create_engine_adapter
+from sqlmesh.core.state_sync.db.interval import IntervalState
+
+NUM_ROWS = 50_000
+
+
+def interval_rows() -> pd.DataFrame:
+    """Returns rows shaped like the ones written to the intervals table after a large backfill."""
+    return pd.DataFrame(
+        [
+            {
+                "id": f"id_{i}",
+                "created_ts": 1700000000000 + i,
+                "name": f'"db"."model_{i % 500}"',
+                "identifier": str(i),
+                "version": str(i % 500),
+                "dev_version": str(i % 500),
+                "start_ts": 1600000000000 + i * 86400000,
+                "end_ts": 1600000000000 + (i + 1) * 86400000,
+                "is_dev": False,
+                "is_removed": False,
+                "is_compacted": False,
+                "is_pending_restatement": False,
+                "last_altered_ts": None if i % 2 else 1700000000000,
+            }
+            for i in range(NUM_ROWS)
+        ]
+    )
+
+
+def benchmark_insert(
+    loops: int,
+    adapter: EngineAdapter,
+    df: pd.DataFrame,
+    columns_to_types: t.Dict[str, exp.DataType],
+    bulk: bool,
+) -> float:
+    elapsed = 0.0
+    for _ in range(loops):
+        adapter.create_table("intervals", columns_to_types)
+        t0 = pyperf.perf_counter()
+        if bulk:
+            adapter.bulk_insert("intervals", df, columns_to_types)
+        else:
+            adapter.insert_append(
+                "intervals", df, target_columns_to_types=columns_to_types, track_rows_processed=False
+            )
+        elapsed += pyperf.perf_counter() - t0
+        adapter.drop_table("intervals")
+    return elapsed
+
+
+def main() -> None:
+    runner = pyperf.Runner()
+    adapter = create_engine_adapter(duckdb.connect, "duckdb")
+    columns_to_types = IntervalState(adapter)._interval_columns_to_types
+    df = interval_rows()
+
+    # Rows per second are NUM_ROWS divided by the reported time
+    for name, bulk in (("insert_append", False), ("bulk_insert", True)):
+        runner.bench_time_func(
+            f"state_{name}_{adapter.dialect}_{NUM_ROWS}",
+            benchmark_insert,
+            adapter,
+            df,
+            columns_to_types,
+            bulk,
+            metadata={"rows": NUM_ROWS},
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -631,16 +631,23 @@ def invalidate(ctx: click.Context, environment: str, **kwargs: t.Any) -> None:
     is_flag=True,
     help="Cleanup snapshots that are not referenced in any environment, regardless of when they're set to expire",
 )
+@click.option(
+    "--time-budget",
+    type=int,
+    help="The number of seconds after which the janitor stops cleaning up expired snapshots. The remaining snapshots are cleaned up during the next run.",
+)
 @click.pass_context
 @error_handler
 @cli_analytics
-def janitor(ctx: click.Context, ignore_ttl: bool, **kwargs: t.Any) -> None:
+def janitor(
+    ctx: click.Context, ignore_ttl: bool, time_budget: t.Optional[int], **kwargs: t.Any
+) -> None:
     """
     Run the janitor process on-demand.
 
     The janitor cleans up old environments and expired snapshots.
     """
-    ctx.obj.run_janitor(ignore_ttl, **kwargs)
+    ctx.obj.run_janitor(ignore_ttl, time_budget=time_budget, **kwargs)
 
 
 @cli.command("destroy")
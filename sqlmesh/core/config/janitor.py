@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import typing as t
 
 from sqlmesh.core.config.base import BaseConfig
 
@@ -9,6 +10,9 @@ class JanitorConfig(BaseConfig):
 
     Args:
         warn_on_delete_failure: Whether to warn instead of erroring if the janitor fails to delete the expired environment schema / views.
+        time_budget: The number of seconds after which the janitor stops cleaning up expired snapshots. The remaining
+            snapshots are cleaned up during the next run.
     """
 
     warn_on_delete_failure: bool = False
+    time_budget: t.Optional[int] = None
@@ -105,7 +105,13 @@ class _EngineAdapterStateSyncSchedulerConfig(SchedulerConfig):
 
         schema = context.config.get_state_schema(context.gateway)
         return EngineAdapterStateSync(
-            engine_adapter, schema=schema, cache_dir=context.cache_dir, console=context.console
+            engine_adapter,
+            schema=schema,
+            cache_dir=context.cache_dir,
+            console=context.console,
+            max_concurrent_reads=state_connection.concurrent_tasks,
+            cache_store=context.config.cache_store,
+            cache_codec=context.config.cache_codec,
         )
 
     def state_sync_fingerprint(self, context: GenericContext) -> str:
@@ -142,6 +142,7 @@ from sqlmesh.utils.jinja import JinjaMacroRegistry
 
 if t.TYPE_CHECKING:
     import pandas as pd
+    import pyarrow as pa
     from typing_extensions import Literal
 
     from sqlmesh.core.engine_adapter._typing import (
@@ -243,6 +244,20 @@ class BaseContext(abc.ABC):
         """
         return self.engine_adapter.fetchdf(query, quote_identifiers=quote_identifiers)
 
+    def fetch_arrow(
+        self, query: t.Union[exp.Expression, str], quote_identifiers: bool = False
+    ) -> pa.Table:
+        """Fetches a PyArrow table given a sql string or sqlglot expression.
+
+        Args:
+            query: SQL string or sqlglot expression.
+            quote_identifiers: Whether to quote all identifiers in the query.
+
+        Returns:
+            A PyArrow table.
+        """
+        return self.engine_adapter.fetch_arrow(query, quote_identifiers=quote_identifiers)
+
     def fetch_pyspark_df(
         self, query: t.Union[exp.Expression, str], quote_identifiers: bool = False
     ) -> PySparkDataFrame:
@@ -407,6 +422,9 @@ class GenericContext(BaseContext, t.Generic[C]):
         if self.config.disable_anonymized_analytics:
             analytics.disable_analytics()
 
+        # Fail early if the package required by the cache codec is missing
+        self.config.cache_codec.ensure_available()
+
         self.gateway = gateway
         self._scheduler = self.config.get_scheduler(self.gateway)
         self.environment_ttl = self.config.environment_ttl
@@ -532,6 +550,8 @@ class GenericContext(BaseContext, t.Generic[C]):
             self.dag,
             models=self._models,
             cache_dir=self.cache_dir,
+            cache_store=self.config.cache_store,
+            cache_codec=self.config.cache_codec,
         )
 
         if model.dialect:
@@ -609,13 +629,24 @@ class GenericContext(BaseContext, t.Generic[C]):
     def refresh(self) -> None:
         """Refresh all models that have been updated."""
         if any(loader.reload_needed() for loader in self._loaders):
-            self.load()
+            self.load(incremental=True)
+
+    def load(self, update_schemas: bool = True, incremental: bool = False) -> GenericContext[C]:
+        """Load all files in the context's path.
 
-    def load(self, update_schemas: bool = True) -> GenericContext[C]:
-        """Load all files in the context's path."""
+        Args:
+            update_schemas: Whether to update the schemas of all loaded models.
+            incremental: Whether to reuse the models from the previous load whose files haven't changed.
+                Their optimized queries and schemas are only recomputed if the schema of any of their
+                upstream models has changed.
+        """
         load_start_ts = time.perf_counter()
 
-        loaded_projects = [loader.load() for loader in self._loaders]
+        previous_models = dict(self._models) if incremental and self._loaded else None
+
+        loaded_projects = [
+            loader.load(reuse_loaded_models=previous_models is not None) for loader in self._loaders
+        ]
 
         self.dag = DAG()
         self._standalone_audits.clear()
@@ -688,6 +719,9 @@ class GenericContext(BaseContext, t.Generic[C]):
                 self.dag,
                 models=self._models,
                 cache_dir=self.cache_dir,
+                previous_models=previous_models,
+                cache_store=self.config.cache_store,
+                cache_codec=self.config.cache_codec,
             )
 
             models = self.models.values()
@@ -755,7 +789,7 @@ class GenericContext(BaseContext, t.Generic[C]):
         environment = environment or self.config.default_target_environment
         environment = Environment.sanitize_name(environment)
         if not skip_janitor and environment.lower() == c.PROD:
-            self._run_janitor()
+            self._run_janitor(time_budget=self.config.janitor.time_budget)
 
         self.notification_target_manager.notify(
             NotificationEvent.RUN_START, environment=environment
@@ -855,12 +889,17 @@ class GenericContext(BaseContext, t.Generic[C]):
         return completion_status
 
     @python_api_analytics
-    def run_janitor(self, ignore_ttl: bool) -> bool:
+    def run_janitor(self, ignore_ttl: bool, time_budget: t.Optional[int] = None) -> bool:
         success = False
 
         if self.console.start_cleanup(ignore_ttl):
             try:
-                self._run_janitor(ignore_ttl)
+                self._run_janitor(
+                    ignore_ttl,
+                    time_budget=(
+                        time_budget if time_budget is not None else self.config.janitor.time_budget
+                    ),
+                )
                 success = True
             finally:
                 self.console.stop_cleanup(success=success)
@@ -881,7 +920,7 @@ class GenericContext(BaseContext, t.Generic[C]):
         # For each environment find schemas and tables
         for environment in environments:
             all_snapshot_infos.update(environment.snapshots)
-            snapshots = self.state_reader.get_snapshots(environment.snapshots).values()
+            snapshots = self.state_reader.get_snapshot_table_infos(environment.snapshots).values()
             for snapshot in snapshots:
                 if snapshot.is_model and not snapshot.is_symbolic:
                     # Get the appropriate adapter
@@ -2846,24 +2885,31 @@ class GenericContext(BaseContext, t.Generic[C]):
 
         return True
 
-    def _run_janitor(self, ignore_ttl: bool = False) -> None:
+    def _run_janitor(self, ignore_ttl: bool = False, time_budget: t.Optional[int] = None) -> None:
         current_ts = now_timestamp()
+        deadline = time.monotonic() + time_budget if time_budget is not None else None
 
         # Clean up expired environments by removing their views and schemas
         self._cleanup_environments(current_ts=current_ts)
 
-        cleanup_targets = self.state_sync.get_expired_snapshots(
+        # Expired snapshots are cleaned up one batch at a time. Records of a batch are deleted from the state
+        # as soon as its tables have been removed, so that an interrupted run resumes where it left off.
+        for batch in self.state_sync.get_expired_snapshot_batches(
             ignore_ttl=ignore_ttl, current_ts=current_ts
-        )
-
-        # Remove the expired snapshots tables
-        self.snapshot_evaluator.cleanup(
-            target_snapshots=cleanup_targets,
-            on_complete=self.console.update_cleanup_progress,
-        )
+        ):
+            self.snapshot_evaluator.cleanup(
+                target_snapshots=batch.cleanup_tasks,
+                on_complete=self.console.update_cleanup_progress,
+            )
+            self.state_sync.delete_expired_snapshot_batch(batch)
 
-        # Delete the expired snapshot records from the state sync
-        self.state_sync.delete_expired_snapshots(ignore_ttl=ignore_ttl, current_ts=current_ts)
+            if deadline is not None and time.monotonic() >= deadline:
+                logger.info(
+                    "The janitor exceeded its time budget of %s seconds. Remaining expired snapshots "
+                    "will be cleaned up during the next run.",
+                    time_budget,
+                )
+                return
 
         self.state_sync.compact_intervals()
 
@@ -2910,6 +2956,8 @@ class GenericContext(BaseContext, t.Generic[C]):
             default_catalog=self.default_catalog,
             dialect=self.default_dialect,
             cache_dir=self.cache_dir,
+            cache_store=self.config.cache_store,
+            cache_codec=self.config.cache_codec,
         )
 
     def _register_notification_targets(self) -> None:
@@ -6,6 +6,7 @@ from sqlmesh.utils import optional_import
 
 if t.TYPE_CHECKING:
     import pandas as pd
+    import pyarrow as pa
     import pyspark
     import pyspark.sql.connect.dataframe
     from bigframes.session import Session as BigframeSession  # noqa
@@ -23,6 +24,7 @@ if t.TYPE_CHECKING:
 
     DF = t.Union[
         pd.DataFrame,
+        pa.Table,
         pyspark.sql.DataFrame,
         pyspark.sql.connect.dataframe.DataFrame,
         BigframeDataFrame,
@@ -54,10 +54,11 @@ from sqlmesh.utils.errors import (
     SQLMeshError,
     UnsupportedCatalogOperationError,
 )
-from sqlmesh.utils.pandas import columns_to_types_from_df
+from sqlmesh.utils.pandas import columns_to_types_from_df, df_to_query_params, is_arrow_table
 
 if t.TYPE_CHECKING:
     import pandas as pd
+    import pyarrow as pa
 
     from sqlmesh.core._typing import SchemaName, SessionProperties, TableName
     from sqlmesh.core.engine_adapter._typing import (
@@ -95,6 +96,7 @@ class EngineAdapter:
 
     DIALECT = ""
     DEFAULT_BATCH_SIZE = 10000
+    DEFAULT_FETCH_BATCH_SIZE = 10000
     DATA_OBJECT_FILTER_BATCH_SIZE = 4000
     SUPPORTS_TRANSACTIONS = True
     SUPPORTS_INDEXES = False
@@ -120,6 +122,11 @@ class EngineAdapter:
     ATTACH_CORRELATION_ID = True
     SUPPORTS_QUERY_EXECUTION_TRACKING = False
     SUPPORTS_METADATA_TABLE_LAST_MODIFIED_TS = False
+    # Whether bulk_insert can hand rows over to the driver instead of rendering them into the query
+    SUPPORTS_BULK_INSERT = False
+    # The placeholder of positional query parameters expected by the DB-API driver
+    QUERY_PARAM_PLACEHOLDER = "%s"
+    BULK_INSERT_BATCH_SIZE = 10000
 
     def __init__(
         self,
@@ -304,6 +311,9 @@ class EngineAdapter:
                 "It is expected that if a DataFrame is passed in then columns_to_types is set"
             )
 
+        if is_arrow_table(query_or_df):
+            query_or_df = self._arrow_table_to_df(query_or_df)
+
         if isinstance(query_or_df, pd.DataFrame) and query_or_df.empty:
             raise SQLMeshError(
                 "Cannot construct source query from an empty DataFrame. This error is commonly "
@@ -336,13 +346,12 @@ class EngineAdapter:
         # we need to ensure that the order of the columns in columns_to_types columns matches the order of the values
         # they can differ if a user specifies columns() on a python model in a different order than what's in the DataFrame's emitted by that model
         df = df[list(source_columns or target_columns_to_types)]
-        values = list(df.itertuples(index=False, name=None))
 
         return [
             SourceQuery(
                 query_factory=partial(
-                    self._values_to_sql,
-                    values=values,  # type: ignore
+                    self._df_batch_to_sql,
+                    df=df,
                     target_columns_to_types=target_columns_to_types,
                     batch_start=i,
                     batch_end=min(i + batch_size, num_rows),
@@ -352,6 +361,32 @@ class EngineAdapter:
             for i in range(0, num_rows, batch_size)
         ]
 
+    def _df_batch_to_sql(
+        self,
+        df: pd.DataFrame,
+        target_columns_to_types: t.Dict[str, exp.DataType],
+        batch_start: int,
+        batch_end: int,
+        source_columns: t.Optional[t.List[str]] = None,
+    ) -> Query:
+        # Rows are converted into tuples one batch at a time, so that only the batch which is being
+        # inserted is held in memory as Python objects rather than a copy of the entire DataFrame
+        values = list(df.iloc[batch_start:batch_end].itertuples(index=False, name=None))
+        return self._values_to_sql(
+            values,
+            target_columns_to_types,
+            batch_start=0,
+            batch_end=len(values),
+            source_columns=source_columns,
+        )
+
+    def _arrow_table_to_df(self, table: t.Any) -> DF:
+        """Converts a PyArrow table into a DataFrame that this engine can ingest.
+
+        Engines that are able to load Arrow data natively should override this to return the table as is.
+        """
+        return table.to_pandas()
+
     def _get_source_queries_and_columns_to_types(
         self,
         query_or_df: QueryOrDF,
@@ -399,6 +434,9 @@ class EngineAdapter:
 
         if not target_columns_to_types and isinstance(query_or_df, pd.DataFrame):
             target_columns_to_types = columns_to_types_from_df(t.cast(pd.DataFrame, query_or_df))
+        elif not target_columns_to_types and is_arrow_table(query_or_df):
+            # Only the schema is needed, so an empty slice is converted to infer the types
+            target_columns_to_types = columns_to_types_from_df(query_or_df.slice(0, 0).to_pandas())
         if not source_columns and target_columns_to_types:
             source_columns = list(target_columns_to_types)
         # source columns should only contain columns that are defined in the target. If there are extras then
@@ -1485,6 +1523,74 @@ class EngineAdapter:
             table_name, source_queries, target_columns_to_types, track_rows_processed
         )
 
+    def bulk_insert(
+        self,
+        table_name: TableName,
+        df: pd.DataFrame,
+        target_columns_to_types: t.Dict[str, exp.DataType],
+    ) -> None:
+        """Appends the rows of a DataFrame to an existing table.
+
+        Rows are handed over to the driver in bulk, eg. as parameters of a single statement or with COPY, so
+        that no SQL has to be generated for them. Falls back to `insert_append` if the engine doesn't support it.
+
+        Args:
+            table_name: The name of the target table.
+            df: The rows to insert. Must contain all columns in `target_columns_to_types`.
+            target_columns_to_types: The columns of the target table and their types.
+        """
+        if not self.SUPPORTS_BULK_INSERT:
+            self.insert_append(
+                table_name,
+                df,
+                target_columns_to_types=target_columns_to_types,
+                track_rows_processed=False,
+            )
+            return
+
+        if df.empty:
+            return
+
+        table = exp.to_table(table_name)
+        logger.debug(
+            "Bulk inserting %d rows into %s", len(df.index), table.sql(dialect=self.dialect)
+        )
+        with self.transaction():
+            self._bulk_insert_df(table, df[list(target_columns_to_types)], target_columns_to_types)
+
+    def _bulk_insert_df(
+        self,
+        table: exp.Table,
+        df: pd.DataFrame,
+        target_columns_to_types: t.Dict[str, exp.DataType],
+    ) -> None:
+        """Inserts the rows of the DataFrame by passing them as parameters to the driver's executemany."""
+        self._executemany_insert(table, df, target_columns_to_types, self.QUERY_PARAM_PLACEHOLDER)
+
+    def _executemany_insert(
+        self,
+        table: exp.Table,
+        df: pd.DataFrame,
+        target_columns_to_types: t.Dict[str, exp.DataType],
+        placeholder: str,
+    ) -> None:
+        columns = ", ".join(
+            exp.to_identifier(column).sql(dialect=self.dialect, identify=True)
+            for column in target_columns_to_types
+        )
+        placeholders = ", ".join([placeholder] * len(target_columns_to_types))
+        sql = (
+            f"INSERT INTO {table.sql(dialect=self.dialect, identify=True)} ({columns}) "
+            f"VALUES ({placeholders})"
+        )
+        for start in range(0, len(df.index), self.BULK_INSERT_BATCH_SIZE):
+            self.cursor.executemany(
+                sql,
+                df_to_query_params(
+                    df.iloc[start : start + self.BULK_INSERT_BATCH_SIZE], target_columns_to_types
+                ),
+            )
+
     def _insert_append_source_queries(
         self,
         table_name: TableName,
@@ -2336,6 +2442,9 @@ class EngineAdapter:
         if isinstance(query_or_df, (exp.Query, pd.DataFrame)):
             return query_or_df
 
+        if is_arrow_table(query_or_df):
+            return query_or_df.to_pandas()
+
         # EngineAdapter subclasses that have native DataFrame types should override this
         raise NotImplementedError(f"Unable to convert {type(query_or_df)} to Pandas")
 
@@ -2358,6 +2467,47 @@ class EngineAdapter:
         """Fetches a PySpark DataFrame from the cursor"""
         raise NotImplementedError(f"Engine does not support PySpark DataFrames: {type(self)}")
 
+    def fetch_arrow(
+        self, query: t.Union[exp.Expression, str], quote_identifiers: bool = False
+    ) -> pa.Table:
+        """Fetches a PyArrow table from the cursor without going through pandas."""
+        with self.transaction():
+            self.execute(query, quote_identifiers=quote_identifiers)
+            return self._rows_to_arrow(self.cursor.description, self.cursor.fetchall())
+
+    def fetch_record_batches(
+        self,
+        query: t.Union[exp.Expression, str],
+        quote_identifiers: bool = False,
+        batch_size: t.Optional[int] = None,
+    ) -> t.Iterator[pa.RecordBatch]:
+        """Fetches the results of a query as a stream of PyArrow record batches.
+
+        Only one batch is held in memory at a time, so that large results can be processed without
+        materializing them fully.
+
+        Args:
+            query: The query to fetch the results of.
+            quote_identifiers: Whether to quote all identifiers in the query.
+            batch_size: The maximum number of rows in each batch.
+        """
+        batch_size = batch_size or self.DEFAULT_FETCH_BATCH_SIZE
+        with self.transaction():
+            self.execute(query, quote_identifiers=quote_identifiers)
+            while rows := self.cursor.fetchmany(batch_size):
+                yield from self._rows_to_arrow(self.cursor.description, rows).to_batches()
+
+    @staticmethod
+    def _rows_to_arrow(
+        description: t.Sequence[t.Sequence[t.Any]], rows: t.Sequence[t.Sequence[t.Any]]
+    ) -> pa.Table:
+        """Builds a PyArrow table from rows returned by a cursor, converting one column at a time."""
+        import pyarrow as pa
+
+        names = [column[0] for column in description]
+        columns = list(zip(*rows)) if rows else [() for _ in names]
+        return pa.table([pa.array(column) for column in columns], names=names)
+
     @property
     def wap_enabled(self) -> bool:
         """Returns whether WAP is enabled for this engine."""
@@ -30,6 +30,7 @@ from sqlmesh.utils.pandas import columns_to_types_from_dtypes
 
 if t.TYPE_CHECKING:
     import pandas as pd
+    import pyarrow as pa
     from google.api_core.retry import Retry
     from google.cloud import bigquery
     from google.cloud.bigquery import StandardSqlDataType
@@ -797,6 +798,28 @@ class BigQueryEngineAdapter(ClusteredByMixin, RowDiffMixin):
         assert query_job is not None
         return query_job.to_dataframe()
 
+    def fetch_arrow(
+        self, query: t.Union[exp.Expression, str], quote_identifiers: bool = False
+    ) -> pa.Table:
+        self.execute(query, quote_identifiers=quote_identifiers)
+        query_job = self._query_job
+        assert query_job is not None
+        return query_job.to_arrow()
+
+    def fetch_record_batches(
+        self,
+        query: t.Union[exp.Expression, str],
+        quote_identifiers: bool = False,
+        batch_size: t.Optional[int] = None,
+    ) -> t.Iterator[pa.RecordBatch]:
+        self.execute(query, quote_identifiers=quote_identifiers)
+        query_job = self._query_job
+        assert query_job is not None
+        # Each page of results is downloaded only when the previous batch has been consumed
+        yield from query_job.result(
+            page_size=batch_size or self.DEFAULT_FETCH_BATCH_SIZE
+        ).to_arrow_iterable()
+
     def _create_column_comments(
         self,
         table_name: TableName,
@@ -21,6 +21,7 @@ from sqlmesh.utils.errors import SQLMeshError, MissingDefaultCatalogError
 
 if t.TYPE_CHECKING:
     import pandas as pd
+    import pyarrow as pa
 
     from sqlmesh.core._typing import SchemaName, TableName, SessionProperties
     from sqlmesh.core.engine_adapter._typing import DF, PySparkSession, Query
@@ -194,6 +195,30 @@ class DatabricksEngineAdapter(SparkEngineAdapter):
         self.execute(query)
         return self.cursor.fetchall_arrow().to_pandas()
 
+    def fetch_arrow(
+        self, query: t.Union[exp.Expression, str], quote_identifiers: bool = False
+    ) -> pa.Table:
+        if self.is_spark_session_connection or self._spark_engine_adapter:
+            return super().fetch_arrow(query, quote_identifiers=quote_identifiers)
+        self.execute(query, quote_identifiers=quote_identifiers)
+        return self.cursor.fetchall_arrow()
+
+    def fetch_record_batches(
+        self,
+        query: t.Union[exp.Expression, str],
+        quote_identifiers: bool = False,
+        batch_size: t.Optional[int] = None,
+    ) -> t.Iterator[pa.RecordBatch]:
+        if self.is_spark_session_connection or self._spark_engine_adapter:
+            yield from super().fetch_record_batches(
+                query, quote_identifiers=quote_identifiers, batch_size=batch_size
+            )
+            return
+        batch_size = batch_size or self.DEFAULT_FETCH_BATCH_SIZE
+        self.execute(query, quote_identifiers=quote_identifiers)
+        while (table := self.cursor.fetchmany_arrow(batch_size)).num_rows:
+            yield from table.to_batches()
+
     def fetchdf(
         self, query: t.Union[exp.Expression, str], quote_identifiers: bool = False
     ) -> pd.DataFrame:
@@ -20,6 +20,9 @@ from sqlmesh.core.engine_adapter.shared import (
 )
 
 if t.TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
     from sqlmesh.core._typing import SchemaName, TableName
     from sqlmesh.core.engine_adapter._typing import DF
 
@@ -37,6 +40,8 @@ class DuckDBEngineAdapter(LogicalMergeMixin, GetCurrentCatalogFromFunctionMixin,
     COMMENT_CREATION_VIEW = CommentCreationView.COMMENT_COMMAND_ONLY
     SUPPORTS_CREATE_DROP_CATALOG = True
     SUPPORTED_DROP_CASCADE_OBJECT_KINDS = ["SCHEMA", "TABLE", "VIEW"]
+    SUPPORTS_BULK_INSERT = True
+    QUERY_PARAM_PLACEHOLDER = "?"
 
     @property
     def catalog_support(self) -> CatalogSupport:
@@ -81,12 +86,19 @@ class DuckDBEngineAdapter(LogicalMergeMixin, GetCurrentCatalogFromFunctionMixin,
         source_columns: t.Optional[t.List[str]] = None,
     ) -> t.List[SourceQuery]:
         temp_table = self._get_temp_table(target_table)
+        # The DataFrame is registered as a view so that DuckDB scans it directly instead of
+        # rendering its rows into the query
+        df_view = self._get_temp_table(target_table, table_only=True, quoted=False).name
         temp_table_sql = (
             exp.select(*self._casted_columns(target_columns_to_types, source_columns))
-            .from_("df")
+            .from_(exp.to_identifier(df_view))
             .sql(dialect=self.dialect)
         )
-        self.cursor.sql(f"CREATE TABLE {temp_table} AS {temp_table_sql}")
+        self.cursor.register(df_view, df)
+        try:
+            self.cursor.sql(f"CREATE TABLE {temp_table} AS {temp_table_sql}")
+        finally:
+            self.cursor.unregister(df_view)
         return [
             SourceQuery(
                 query_factory=lambda: self._select_columns(target_columns_to_types).from_(
@@ -96,6 +108,47 @@ class DuckDBEngineAdapter(LogicalMergeMixin, GetCurrentCatalogFromFunctionMixin,
             )
         ]
 
+    def _bulk_insert_df(
+        self,
+        table: exp.Table,
+        df: pd.DataFrame,
+        target_columns_to_types: t.Dict[str, exp.DataType],
+    ) -> None:
+        # DuckDB scans the registered DataFrame directly, which is much faster than binding its rows one by one
+        df_view = self._get_temp_table(table, table_only=True, quoted=False).name
+        self.cursor.register(df_view, df)
+        try:
+            self.execute(
+                exp.insert(
+                    exp.select(*self._casted_columns(target_columns_to_types)).from_(
+                        exp.to_identifier(df_view)
+                    ),
+                    table,
+                    columns=list(target_columns_to_types),
+                )
+            )
+        finally:
+            self.cursor.unregister(df_view)
+
+    def fetch_arrow(
+        self, query: t.Union[exp.Expression, str], quote_identifiers: bool = False
+    ) -> pa.Table:
+        self.execute(query, quote_identifiers=quote_identifiers)
+        return self.cursor.fetch_arrow_table()
+
+    def fetch_record_batches(
+        self,
+        query: t.Union[exp.Expression, str],
+        quote_identifiers: bool = False,
+        batch_size: t.Optional[int] = None,
+    ) -> t.Iterator[pa.RecordBatch]:
+        self.execute(query, quote_identifiers=quote_identifiers)
+        yield from self.cursor.fetch_record_batch(batch_size or self.DEFAULT_FETCH_BATCH_SIZE)
+
+    def _arrow_table_to_df(self, table: t.Any) -> DF:
+        # DuckDB scans Arrow tables natively
+        return table
+
     def _get_data_objects(
         self, schema_name: SchemaName, object_names: t.Optional[t.Set[str]] = None
     ) -> t.List[DataObject]:
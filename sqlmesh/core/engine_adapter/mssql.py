@@ -32,6 +32,8 @@ from sqlmesh.core.engine_adapter.shared import (
 from sqlmesh.utils import get_source_columns_to_types
 
 if t.TYPE_CHECKING:
+    import pandas as pd
+
     from sqlmesh.core._typing import SchemaName, TableName
     from sqlmesh.core.engine_adapter._typing import DF, Query, QueryOrDF
 
@@ -52,6 +54,7 @@ class MSSQLEngineAdapter(
     COMMENT_CREATION_VIEW = CommentCreationView.UNSUPPORTED
     SUPPORTS_REPLACE_TABLE = False
     SUPPORTS_QUERY_EXECUTION_TRACKING = True
+    SUPPORTS_BULK_INSERT = True
     SCHEMA_DIFFER_KWARGS = {
         "parameterized_type_defaults": {
             exp.DataType.build("DECIMAL", dialect=DIALECT).this: [(18, 0), (0,)],
@@ -357,6 +360,21 @@ class MSSQLEngineAdapter(
             )
         ]
 
+    def _bulk_insert_df(
+        self,
+        table: exp.Table,
+        df: pd.DataFrame,
+        target_columns_to_types: t.Dict[str, exp.DataType],
+    ) -> None:
+        self._convert_df_datetime(df, target_columns_to_types)
+        cursor = self.cursor
+        if hasattr(cursor, "fast_executemany"):
+            # pyodbc binds the parameters of all rows at once, but only supports qmark placeholders
+            cursor.fast_executemany = True
+            self._executemany_insert(table, df, target_columns_to_types, "?")
+        else:
+            self._executemany_insert(table, df, target_columns_to_types, "%s")
+
     def _get_data_objects(
         self, schema_name: SchemaName, object_names: t.Optional[t.Set[str]] = None
     ) -> t.List[DataObject]:
@@ -40,6 +40,7 @@ class MySQLEngineAdapter(
     SUPPORTS_REPLACE_TABLE = False
     MAX_IDENTIFIER_LENGTH = 64
     SUPPORTS_QUERY_EXECUTION_TRACKING = True
+    SUPPORTS_BULK_INSERT = True
     SCHEMA_DIFFER_KWARGS = {
         "parameterized_type_defaults": {
             exp.DataType.build("BIT", dialect=DIALECT).this: [(1,)],
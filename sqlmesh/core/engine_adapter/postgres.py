@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 import logging
 import re
 import typing as t
@@ -13,11 +14,16 @@ from sqlmesh.core.engine_adapter.mixins import (
     RowDiffMixin,
     logical_merge,
 )
-from sqlmesh.core.engine_adapter.shared import set_catalog
+from sqlmesh.core.engine_adapter.shared import SourceQuery, set_catalog
+from sqlmesh.utils import get_source_columns_to_types, random_id
+from sqlmesh.utils.pandas import columns_to_types_from_df, restore_integer_columns
 
 if t.TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
     from sqlmesh.core._typing import TableName
-    from sqlmesh.core.engine_adapter._typing import DF, QueryOrDF
+    from sqlmesh.core.engine_adapter._typing import DF, Query, QueryOrDF
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +42,9 @@ class PostgresEngineAdapter(
     SUPPORTS_REPLACE_TABLE = False
     MAX_IDENTIFIER_LENGTH = 63
     SUPPORTS_QUERY_EXECUTION_TRACKING = True
+    SUPPORTS_COPY_FROM_STDIN = True
+    SUPPORTS_BULK_INSERT = True
+    COPY_BATCH_SIZE = 100_000
     SCHEMA_DIFFER_KWARGS = {
         "parameterized_type_defaults": {
             # DECIMAL without precision is "up to 131072 digits before the decimal point; up to 16383 digits after the decimal point"
@@ -79,6 +88,117 @@ class PostgresEngineAdapter(
             self._connection_pool.commit()
         return df
 
+    def _df_to_source_queries(
+        self,
+        df: DF,
+        target_columns_to_types: t.Dict[str, exp.DataType],
+        batch_size: int,
+        target_table: TableName,
+        source_columns: t.Optional[t.List[str]] = None,
+    ) -> t.List[SourceQuery]:
+        import pandas as pd
+
+        if not self._supports_copy_from_stdin or not isinstance(df, pd.DataFrame):
+            return super()._df_to_source_queries(
+                df, target_columns_to_types, batch_size, target_table, source_columns=source_columns
+            )
+
+        ordered_df = df[list(get_source_columns_to_types(target_columns_to_types, source_columns))]
+        try:
+            # The staging table mirrors the DataFrame's own types, so that the values written by pandas can
+            # always be parsed by COPY. Converting them into the target types is left to the final query.
+            df_columns_to_types = columns_to_types_from_df(ordered_df)
+        except ValueError:
+            return super()._df_to_source_queries(
+                df, target_columns_to_types, batch_size, target_table, source_columns=source_columns
+            )
+
+        temp_table = self._get_temp_table(target_table or "pandas")
+
+        def query_factory() -> Query:
+            self.create_table(temp_table, df_columns_to_types)
+            self._copy_df_to_table(temp_table, ordered_df)
+            return exp.select(
+                *self._casted_columns(target_columns_to_types, source_columns=source_columns)
+            ).from_(temp_table)
+
+        return [
+            SourceQuery(
+                query_factory=query_factory,
+                cleanup_func=lambda: self.drop_table(temp_table),
+            )
+        ]
+
+    def _bulk_insert_df(
+        self,
+        table: exp.Table,
+        df: pd.DataFrame,
+        target_columns_to_types: t.Dict[str, exp.DataType],
+    ) -> None:
+        if not self._supports_copy_from_stdin:
+            return super()._bulk_insert_df(table, df, target_columns_to_types)
+        # Values are copied straight into the target table, so they must be parsable as its column types
+        self._copy_df_to_table(table, restore_integer_columns(df, target_columns_to_types))
+
+    @property
+    def _supports_copy_from_stdin(self) -> bool:
+        # COPY FROM STDIN is only exposed by psycopg2 cursors. Other drivers, like pg8000 which is used
+        # for GCP Postgres, fall back to VALUES and executemany.
+        return self.SUPPORTS_COPY_FROM_STDIN and hasattr(self.cursor, "copy_expert")
+
+    def _copy_df_to_table(self, table: exp.Table, df: pd.DataFrame) -> None:
+        """Streams the DataFrame into the table with COPY, one chunk of rows at a time."""
+        columns = ", ".join(
+            exp.to_identifier(column).sql(dialect=self.dialect, identify=True)
+            for column in df.columns
+        )
+        # NULLs are written as \N so that they can be told apart from empty strings
+        copy_sql = (
+            f"COPY {table.sql(dialect=self.dialect, identify=True)} ({columns}) "
+            "FROM STDIN WITH (FORMAT CSV, NULL '\\N')"
+        )
+        logger.debug("Copying %d rows into %s", len(df.index), table.sql(dialect=self.dialect))
+
+        for start in range(0, len(df.index), self.COPY_BATCH_SIZE):
+            buffer = io.StringIO()
+            df.iloc[start : start + self.COPY_BATCH_SIZE].to_csv(
+                buffer, header=False, index=False, na_rep="\\N"
+            )
+            buffer.seek(0)
+            self.cursor.copy_expert(copy_sql, buffer)
+
+    def fetch_record_batches(
+        self,
+        query: t.Union[exp.Expression, str],
+        quote_identifiers: bool = False,
+        batch_size: t.Optional[int] = None,
+    ) -> t.Iterator[pa.RecordBatch]:
+        if not hasattr(self.cursor, "itersize"):
+            # Named server-side cursors are specific to psycopg2, other drivers fetch the result in batches
+            # from a regular cursor
+            yield from super().fetch_record_batches(
+                query, quote_identifiers=quote_identifiers, batch_size=batch_size
+            )
+            return
+
+        batch_size = batch_size or self.DEFAULT_FETCH_BATCH_SIZE
+        sql = (
+            self._to_sql(query, quote=quote_identifiers)
+            if isinstance(query, exp.Expression)
+            else query
+        )
+        logger.debug(f"Executing SQL:\n{sql}")
+        with self.transaction():
+            # A named cursor keeps the result on the server, so rows are only transferred one batch at a time
+            cursor = self._connection_pool.get().cursor(name=f"sqlmesh_{random_id(short=True)}")
+            try:
+                cursor.itersize = batch_size
+                cursor.execute(sql)
+                while rows := cursor.fetchmany(batch_size):
+                    yield from self._rows_to_arrow(cursor.description, rows).to_batches()
+            finally:
+                cursor.close()
+
     def create_table_like(
         self,
         target_table_name: TableName,
@@ -31,6 +31,7 @@ class RisingwaveEngineAdapter(PostgresEngineAdapter):
     COMMENT_CREATION_VIEW = CommentCreationView.UNSUPPORTED
     SUPPORTS_MATERIALIZED_VIEWS = True
     SUPPORTS_TRANSACTIONS = False
+    SUPPORTS_COPY_FROM_STDIN = False
     MAX_IDENTIFIER_LENGTH = None
 
     def columns(
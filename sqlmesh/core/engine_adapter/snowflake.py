@@ -32,6 +32,7 @@ snowpark = optional_import("snowflake.snowpark")
 
 if t.TYPE_CHECKING:
     import pandas as pd
+    import pyarrow as pa
 
     from sqlmesh.core._typing import SchemaName, SessionProperties, TableName
     from sqlmesh.core.engine_adapter._typing import DF, Query, QueryOrDF, SnowparkSession
@@ -460,6 +461,36 @@ class SnowflakeEngineAdapter(GetCurrentCatalogFromFunctionMixin, ClusteredByMixi
             columns = self.cursor._result_set.batches[0].column_names
             return pd.DataFrame([dict(zip(columns, row)) for row in rows])
 
+    def fetch_arrow(
+        self, query: t.Union[exp.Expression, str], quote_identifiers: bool = False
+    ) -> pa.Table:
+        from snowflake.connector.errors import NotSupportedError
+
+        self.execute(query, quote_identifiers=quote_identifiers)
+
+        try:
+            table = self.cursor.fetch_arrow_all()
+        except NotSupportedError:
+            # Results which aren't returned in the Arrow format (Ex: `SHOW TERSE OBJECTS IN SCHEMA`)
+            # have to be converted manually
+            return self._rows_to_arrow(self.cursor.description, self.cursor.fetchall())
+        if table is None:
+            # The connector returns None instead of an empty table when there are no results
+            return self._rows_to_arrow(self.cursor.description, [])
+        return table
+
+    def fetch_record_batches(
+        self,
+        query: t.Union[exp.Expression, str],
+        quote_identifiers: bool = False,
+        batch_size: t.Optional[int] = None,
+    ) -> t.Iterator[pa.RecordBatch]:
+        batch_size = batch_size or self.DEFAULT_FETCH_BATCH_SIZE
+        # Results are downloaded one chunk at a time and chunks larger than the batch size are split
+        self.execute(query, quote_identifiers=quote_identifiers)
+        for table in self.cursor.fetch_arrow_batches():
+            yield from table.to_batches(max_chunksize=batch_size)
+
     def _native_df_to_pandas_df(
         self,
         query_or_df: QueryOrDF,
@@ -27,6 +27,7 @@ from sqlmesh.utils.errors import SQLMeshError
 
 if t.TYPE_CHECKING:
     import pandas as pd
+    import pyarrow as pa
     from pyspark.sql import types as spark_types
 
     from sqlmesh.core._typing import SchemaName, TableName
@@ -351,6 +352,26 @@ class SparkEngineAdapter(
             self._fetch_native_df(query, quote_identifiers=quote_identifiers)
         )
 
+    def fetch_arrow(
+        self, query: t.Union[exp.Expression, str], quote_identifiers: bool = False
+    ) -> pa.Table:
+        import pyarrow as pa
+
+        # Spark's own Arrow conversion is only exposed through pandas in the supported PySpark versions
+        return pa.Table.from_pandas(
+            self.fetchdf(query, quote_identifiers=quote_identifiers), preserve_index=False
+        )
+
+    def fetch_record_batches(
+        self,
+        query: t.Union[exp.Expression, str],
+        quote_identifiers: bool = False,
+        batch_size: t.Optional[int] = None,
+    ) -> t.Iterator[pa.RecordBatch]:
+        yield from self.fetch_arrow(query, quote_identifiers=quote_identifiers).to_batches(
+            max_chunksize=batch_size or self.DEFAULT_FETCH_BATCH_SIZE
+        )
+
     def _get_data_objects(
         self, schema_name: SchemaName, object_names: t.Optional[t.Set[str]] = None
     ) -> t.List[DataObject]:
@@ -174,6 +174,9 @@ class Loader(abc.ABC):
         from sqlmesh.core.console import get_console
 
         self._path_mtimes: t.Dict[Path, float] = {}
+        # Models returned by the previous load keyed by their file path, along with the cache entry id they were loaded with
+        self._loaded_models: t.Dict[Path, t.Tuple[str, t.List[Model]]] = {}
+        self._reuse_loaded_models = False
         self.context = context
         self.config_path = path
         self.config = self.context.configs[self.config_path]
@@ -187,13 +190,19 @@ class Loader(abc.ABC):
         }
         _init_model_defaults(self.config_essentials, self.context.selected_gateway)
 
-    def load(self) -> LoadedProject:
+    def load(self, reuse_loaded_models: bool = False) -> LoadedProject:
         """
         Loads all macros and models in the context's path.
 
+        Args:
+            reuse_loaded_models: Whether to return the same model instances as the previous load
+                for files that haven't changed since then.
+
         Returns:
             A loaded project object.
         """
+        self._reuse_loaded_models = reuse_loaded_models
+
         with sys_path(self.config_path):
             # python files are cached by the system
             # need to manually clear here so we can reload macros
@@ -903,7 +912,11 @@ class SqlMeshLoader(Loader):
         def __init__(self, loader: SqlMeshLoader, config_path: Path):
             self._loader = loader
             self.config_path = config_path
-            self._model_cache = ModelCache(self._loader.context.cache_dir)
+            self._model_cache = ModelCache(
+                self._loader.context.cache_dir,
+                store=self._loader.config.cache_store,
+                codec=self._loader.config.cache_codec,
+            )
 
         def get_or_load_models(
             self, target_path: Path, loader: t.Callable[[], t.List[Model]]
@@ -927,14 +940,21 @@ class SqlMeshLoader(Loader):
             )
 
         def get(self, path: Path) -> t.List[Model]:
-            models = self._model_cache.get(
-                self._cache_entry_name(path),
-                self._model_cache_entry_id(path),
-            )
+            entry_id = self._model_cache_entry_id(path)
+
+            loaded = self._loader._loaded_models.get(path)
+            if self._loader._reuse_loaded_models and loaded and loaded[0] == entry_id:
+                # Returning the same instances lets the context reuse their optimized queries and schemas
+                return loaded[1]
+
+            models = self._model_cache.get(self._cache_entry_name(path), entry_id)
 
             for model in models:
                 model._path = path
 
+            if models:
+                self._loader._loaded_models[path] = (entry_id, models)
+
             return models
 
         def _cache_entry_name(self, target_path: Path) -> str:
@@ -226,7 +226,7 @@ class MacroEvaluator:
                 ):
                     value = {
                         var_name: (
-                            self.parse_one(var_value.sql)
+                            _parse_sql_value(var_value.sql, self.dialect).copy()
                             if isinstance(var_value, SqlValue)
                             else var_value
                         )
@@ -1607,6 +1607,12 @@ def _convert_sql(v: t.Any, dialect: DialectType) -> t.Any:
     return v
 
 
+@lru_cache(maxsize=16384)
+def _parse_sql_value(sql: str, dialect: DialectType) -> exp.Expression:
+    # Variables are parsed by every evaluator, callers must copy the result before modifying it
+    return sqlglot.maybe_parse(sql, dialect=dialect)
+
+
 @lru_cache(maxsize=16384)
 def _cache_convert_sql(v: t.Any, dialect: DialectType, t: type) -> t.Any:
     return _convert_sql(v, dialect)
@@ -11,7 +11,7 @@ from sqlglot.schema import MappingSchema
 
 from sqlmesh.core import constants as c
 from sqlmesh.core.model.definition import ExternalModel, Model, SqlModel, _Model
-from sqlmesh.utils.cache import FileCache
+from sqlmesh.utils.cache import CacheCodec, CacheStore, FileCache
 from sqlmesh.utils.hashing import crc32
 from sqlmesh.utils.process import PoolExecutor, create_process_pool_executor
 
@@ -31,13 +31,22 @@ class ModelCache:
 
     Args:
         path: The path to the cache folder.
+        store: The storage layout of the cache.
+        codec: The encoding of cache entries.
     """
 
-    def __init__(self, path: Path):
+    def __init__(
+        self,
+        path: Path,
+        store: t.Optional[CacheStore] = None,
+        codec: t.Optional[CacheCodec] = None,
+    ):
         self.path = path
         self._file_cache: FileCache[t.List[Model]] = FileCache(
             path,
             prefix="model_definition",
+            store=store,
+            codec=codec,
         )
 
     def get_or_load(
@@ -90,12 +99,19 @@ class OptimizedQueryCache:
 
     Args:
         path: The path to the cache folder.
+        store: The storage layout of the cache.
+        codec: The encoding of cache entries.
     """
 
-    def __init__(self, path: Path):
+    def __init__(
+        self,
+        path: Path,
+        store: t.Optional[CacheStore] = None,
+        codec: t.Optional[CacheCodec] = None,
+    ):
         self.path = path
         self._file_cache: FileCache[OptimizedQueryCacheEntry] = FileCache(
-            path, prefix="optimized_query"
+            path, prefix="optimized_query", store=store, codec=codec
         )
 
     def with_optimized_query(self, model: Model, name: t.Optional[str] = None) -> bool:
@@ -110,24 +126,28 @@ class OptimizedQueryCache:
 
         name = self._entry_name(model) if name is None else name
         cache_entry = self._file_cache.get(name)
-        if cache_entry:
-            try:
-                # If the optimized rendered query is None, then there are likely adapter calls in the query
-                # that prevent us from rendering it at load time. This means that we can safely set the
-                # unoptimized cache to None as well to prevent attempts to render it downstream.
-                optimized = cache_entry.optimized_rendered_query is not None
-                model._query_renderer.update_cache(
-                    cache_entry.optimized_rendered_query,
-                    cache_entry.renderer_violations,
-                    optimized=optimized,
-                )
-                return True
-            except Exception as ex:
-                logger.warning("Failed to load a cache entry '%s': %s", name, ex)
+        if cache_entry and self._update_cache(model, name, cache_entry):
+            return True
 
         self._put(name, model)
         return False
 
+    def with_optimized_queries(self, models: t.Dict[str, SqlModel]) -> t.List[SqlModel]:
+        """Adds optimized queries to the in-memory caches of multiple models using a single batched read.
+
+        Args:
+            models: The models keyed by their cache entry names.
+
+        Returns:
+            The models for which no cache entry could be loaded.
+        """
+        cache_entries = self._file_cache.get_many(models)
+        return [
+            model
+            for name, model in models.items()
+            if not (name in cache_entries and self._update_cache(model, name, cache_entries[name]))
+        ]
+
     def put(self, model: Model) -> t.Optional[str]:
         if not isinstance(model, SqlModel):
             return None
@@ -140,6 +160,23 @@ class OptimizedQueryCache:
         self._put(name, model)
         return name
 
+    @staticmethod
+    def _update_cache(model: SqlModel, name: str, cache_entry: OptimizedQueryCacheEntry) -> bool:
+        try:
+            # If the optimized rendered query is None, then there are likely adapter calls in the query
+            # that prevent us from rendering it at load time. This means that we can safely set the
+            # unoptimized cache to None as well to prevent attempts to render it downstream.
+            optimized = cache_entry.optimized_rendered_query is not None
+            model._query_renderer.update_cache(
+                cache_entry.optimized_rendered_query,
+                cache_entry.renderer_violations,
+                optimized=optimized,
+            )
+            return True
+        except Exception as ex:
+            logger.warning("Failed to load a cache entry '%s': %s", name, ex)
+            return False
+
     def _put(self, name: str, model: SqlModel) -> None:
         optimized_query = model.render_query()
 
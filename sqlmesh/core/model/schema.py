@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import typing as t
+from collections import deque
 from concurrent.futures import as_completed
 from pathlib import Path
 
+from sqlglot import exp
 from sqlglot.errors import SchemaError
 from sqlglot.schema import MappingSchema
 
@@ -15,6 +17,7 @@ from sqlmesh.core.model.cache import (
 
 if t.TYPE_CHECKING:
     from sqlmesh.core.model.definition import Model
+    from sqlmesh.utils.cache import CacheCodec, CacheStore
     from sqlmesh.utils import UniqueKeyDict
     from sqlmesh.utils.dag import DAG
 
@@ -23,11 +26,57 @@ def update_model_schemas(
     dag: DAG[str],
     models: UniqueKeyDict[str, Model],
     cache_dir: Path,
+    previous_models: t.Optional[t.Dict[str, Model]] = None,
+    cache_store: t.Optional[CacheStore] = None,
+    cache_codec: t.Optional[CacheCodec] = None,
 ) -> None:
+    """Updates the mapping schemas of the given models and optimizes their queries.
+
+    Args:
+        dag: The DAG of models.
+        models: The models to update.
+        cache_dir: The path to the cache folder.
+        previous_models: Models from the previous update. If a model instance is the same as in the previous
+            update and the schemas of its upstream models haven't changed, its optimized query and hashes are
+            reused instead of being recomputed.
+        cache_store: The storage layout of the cache.
+        cache_codec: The encoding of cache entries.
+    """
     schema = MappingSchema(normalize=False)
-    optimized_query_cache: OptimizedQueryCache = OptimizedQueryCache(cache_dir)
+    optimized_query_cache: OptimizedQueryCache = OptimizedQueryCache(
+        cache_dir, store=cache_store, codec=cache_codec
+    )
 
-    _update_model_schemas(dag, models, schema, optimized_query_cache)
+    _update_model_schemas(dag, models, schema, optimized_query_cache, previous_models)
+
+
+def mapping_schema_matches(model: Model, get_model: t.Callable[[str], t.Optional[Model]]) -> bool:
+    """Checks whether the model's mapping schema matches the current columns of its upstream models.
+
+    Args:
+        model: The target model.
+        get_model: The function that returns an upstream model given its name.
+
+    Returns:
+        True if the mapping schema is up-to-date, False otherwise.
+    """
+    for dep in model.depends_on:
+        schema = model.mapping_schema
+
+        for part in exp.to_table(dep).parts:
+            schema = schema.get(part.sql()) or {}
+
+        parent = get_model(dep)
+
+        parent_schema = {
+            c: t.sql(dialect=model.dialect)
+            for c, t in ((parent and parent.columns_to_types) or {}).items()
+        }
+
+        if schema != parent_schema:
+            return False
+
+    return True
 
 
 def _update_schema_with_model(schema: MappingSchema, model: Model) -> None:
@@ -50,38 +99,62 @@ def _update_model_schemas(
     models: UniqueKeyDict[str, Model],
     schema: MappingSchema,
     optimized_query_cache: OptimizedQueryCache,
+    previous_models: t.Optional[t.Dict[str, Model]] = None,
 ) -> None:
     futures = set()
-    graph = {
-        model: {dep for dep in deps if dep in models}
-        for model, deps in dag._dag.items()
-        if model in models
-    }
-
-    def process_models(completed_model: t.Optional[Model] = None) -> None:
-        for name in list(graph):
-            deps = graph[name]
-
-            if completed_model:
-                deps.discard(completed_model.fqn)
-
-            if not deps:
-                del graph[name]
-                model = models[name]
-                futures.add(
-                    executor.submit(
-                        load_optimized_query_and_mapping,
-                        model,
-                        mapping={
-                            parent: models[parent].columns_to_types
-                            for parent in model.depends_on
-                            if parent in models
-                        },
-                    )
+    previous_models = previous_models or {}
+
+    in_degree: t.Dict[str, int] = {}
+    downstream: t.Dict[str, t.List[str]] = {}
+    for name, deps in dag._dag.items():
+        if name not in models:
+            continue
+        in_degree[name] = 0
+        for dep in deps:
+            if dep in models:
+                in_degree[name] += 1
+                downstream.setdefault(dep, []).append(name)
+
+    ready = deque(name for name, degree in in_degree.items() if not degree)
+
+    def complete_model(model: Model) -> None:
+        _update_schema_with_model(schema, model)
+
+        for name in downstream.get(model.fqn, []):
+            in_degree[name] -= 1
+            if not in_degree[name]:
+                ready.append(name)
+
+    def process_ready_models() -> None:
+        while ready:
+            name = ready.popleft()
+            model = models[name]
+
+            if name in previous_models and previous_models[name] is model:
+                # The optimized query and hashes of a model which hasn't changed since the previous update
+                # can be reused as long as the schemas of its upstream models haven't changed either.
+                if mapping_schema_matches(model, models.get):
+                    complete_model(model)
+                    continue
+
+                # Copy the model to avoid mutating an instance which might still be referenced elsewhere
+                model = model.copy(update={"mapping_schema": {}})
+                models.update({name: model})
+
+            futures.add(
+                executor.submit(
+                    load_optimized_query_and_mapping,
+                    model,
+                    mapping={
+                        parent: models[parent].columns_to_types
+                        for parent in model.depends_on
+                        if parent in models
+                    },
                 )
+            )
 
     with optimized_query_cache_pool(optimized_query_cache) as executor:
-        process_models()
+        process_ready_models()
 
         while futures:
             for future in as_completed(futures):
@@ -94,7 +167,7 @@ def _update_model_schemas(
                     if model.mapping_schema != mapping_schema:
                         model.set_mapping_schema(mapping_schema)
                     optimized_query_cache.with_optimized_query(model, entry_name)
-                    _update_schema_with_model(schema, model)
-                    process_models(completed_model=model)
+                    complete_model(model)
+                    process_ready_models()
                 except Exception as ex:
                     raise SchemaError(f"Failed to update model schemas\n\n{ex}")
@@ -2,15 +2,15 @@ from __future__ import annotations
 
 import typing as t
 import zoneinfo
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
 
 from pydantic import Field
 from sqlglot import exp
 
-from sqlmesh.utils.cron import CroniterCache
-from sqlmesh.utils.date import TimeLike, to_datetime, validate_date_range
+from sqlmesh.utils.cron import CroniterCache, interval_seconds
+from sqlmesh.utils.date import UTC, TimeLike, to_datetime, validate_date_range
 from sqlmesh.utils.errors import ConfigError
 from sqlmesh.utils.pydantic import (
     PydanticModel,
@@ -100,6 +100,15 @@ class IntervalUnit(str, Enum):
             return "0 0 1 1 *"
         return ""
 
+    @property
+    def fixed_interval_seconds(self) -> int:
+        """The number of seconds between two consecutive runs if it's constant (eg. hour or day), otherwise 0.
+
+        The cron schedules of fixed-width units are aligned with the Unix epoch, which allows computing
+        their timestamps arithmetically instead of stepping through croniter.
+        """
+        return interval_seconds(self.cron_expr)
+
     def croniter(self, value: TimeLike) -> CroniterCache:
         return CroniterCache(self.cron_expr, value)
 
@@ -114,6 +123,12 @@ class IntervalUnit(str, Enum):
         Returns:
             The timestamp for the next run.
         """
+        step = self.fixed_interval_seconds
+        if step:
+            dt = to_datetime(value)
+            if estimate:
+                return dt + timedelta(seconds=step)
+            return _from_epoch_us((_to_epoch_us(dt) // (step * 1_000_000) + 1) * step * 1_000_000)
         return self.croniter(value).get_next(estimate=estimate)
 
     def cron_prev(self, value: TimeLike, estimate: bool = False) -> datetime:
@@ -127,6 +142,12 @@ class IntervalUnit(str, Enum):
         Returns:
             The timestamp for the previous run.
         """
+        step = self.fixed_interval_seconds
+        if step:
+            dt = to_datetime(value)
+            if estimate:
+                return dt - timedelta(seconds=step)
+            return _from_epoch_us(((_to_epoch_us(dt) - 1) // (step * 1_000_000)) * step * 1_000_000)
         return self.croniter(value).get_prev(estimate=estimate)
 
     def cron_floor(self, value: TimeLike, estimate: bool = False) -> datetime:
@@ -140,6 +161,12 @@ class IntervalUnit(str, Enum):
         Returns:
             The timestamp floor.
         """
+        step = self.fixed_interval_seconds
+        if step:
+            dt = to_datetime(value)
+            if estimate:
+                return dt
+            return _from_epoch_us((_to_epoch_us(dt) // (step * 1_000_000)) * step * 1_000_000)
         croniter = self.croniter(value)
         croniter.get_next(estimate=estimate)
         return croniter.get_prev(estimate=True)
@@ -260,6 +287,17 @@ INTERVAL_SECONDS = {
 }
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def _to_epoch_us(value: datetime) -> int:
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _from_epoch_us(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+
 class _Node(DbtInfoMixin, PydanticModel):
     """
     Node is the core abstraction for entity that can be executed within the scheduler.
@@ -44,6 +44,16 @@ if t.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# All time variables that are available to macros
+TIME_VARIABLES = frozenset(date_dict(c.EPOCH, c.EPOCH, c.EPOCH))
+# Time variables with string values, which are rendered as plain literals and can thus be substituted into a
+# query that has been rendered once
+TEMPLATE_TIME_VARIABLES = frozenset(
+    f"{prefix}_{suffix}"
+    for prefix in ("latest", "execution", "start", "end")
+    for suffix in ("ds", "ts", "tstz")
+)
+
 
 class BaseExpressionRenderer:
     def __init__(
@@ -90,6 +100,7 @@ class BaseExpressionRenderer:
         table_mapping: t.Optional[t.Dict[str, str]] = None,
         deployability_index: t.Optional[DeployabilityIndex] = None,
         runtime_stage: RuntimeStage = RuntimeStage.LOADING,
+        time_variables: t.Optional[t.Dict[str, t.Any]] = None,
         **kwargs: t.Any,
     ) -> t.List[t.Optional[exp.Expression]]:
         """Renders a expression, expanding macros with provided kwargs
@@ -102,6 +113,7 @@ class BaseExpressionRenderer:
             table_mapping: Table mapping of physical locations. Takes precedence over snapshot mappings.
             deployability_index: Determines snapshots that are deployable in the context of this evaluation.
             runtime_stage: Indicates the current runtime stage, for example if we're still loading the project, etc.
+            time_variables: Values that override the time variables derived from start, end and execution time.
             kwargs: Additional kwargs to pass to the renderer.
 
         Returns:
@@ -181,18 +193,9 @@ class BaseExpressionRenderer:
             model_fqn=self._model_fqn,
         )
 
-        start_time, end_time = (
-            make_inclusive(start or c.EPOCH, end or c.EPOCH, self._dialect)
-            if not self._only_execution_time
-            else (None, None)
-        )
-
         render_kwargs = {
-            **date_dict(
-                to_datetime(execution_time or c.EPOCH),
-                start_time,
-                end_time,
-            ),
+            **self._time_variables(start, end, execution_time),
+            **(time_variables or {}),
             **kwargs,
         }
 
@@ -431,6 +434,19 @@ class BaseExpressionRenderer:
     def _should_cache(self, runtime_stage: RuntimeStage, *args: t.Any) -> bool:
         return runtime_stage == RuntimeStage.LOADING and not any(args)
 
+    def _time_variables(
+        self,
+        start: t.Optional[TimeLike],
+        end: t.Optional[TimeLike],
+        execution_time: t.Optional[TimeLike],
+    ) -> t.Dict[str, TimeLike]:
+        start_time, end_time = (
+            make_inclusive(start or c.EPOCH, end or c.EPOCH, self._dialect)
+            if not self._only_execution_time
+            else (None, None)
+        )
+        return date_dict(to_datetime(execution_time or c.EPOCH), start_time, end_time)
+
     def _to_table_mapping(
         self, snapshots: t.Iterable[Snapshot], deployability_index: t.Optional[DeployabilityIndex]
     ) -> t.Dict[str, str]:
@@ -520,10 +536,22 @@ class QueryRenderer(BaseExpressionRenderer):
         super().__init__(*args, **kwargs)
         self._optimized_cache: t.Optional[exp.Query] = None
         self._violated_rules: t.Dict[type[Rule], t.Any] = {}
+        # The query rendered with placeholders in place of time variables, along with the render arguments
+        # that it has been rendered with
+        self._time_template: t.Optional[t.Tuple[t.Tuple[t.Any, ...], exp.Query]] = None
+        # The last query rendered without a template, which the template is checked against once the query
+        # is rendered again with the same arguments
+        self._pending_time_template: t.Optional[
+            t.Tuple[t.Tuple[t.Any, ...], exp.Query, t.Dict[str, t.Any]]
+        ] = None
+        self._supports_time_template: t.Optional[bool] = None
+        self._references_time_variables: t.Optional[bool] = None
 
     def update_schema(self, schema: t.Dict[str, t.Any]) -> None:
         super().update_schema(schema)
         self._optimized_cache = None
+        self._time_template = None
+        self._pending_time_template = None
 
     def render(
         self,
@@ -559,7 +587,59 @@ class QueryRenderer(BaseExpressionRenderer):
         Returns:
             The rendered expression.
         """
+        render_kwargs = dict(
+            snapshots=snapshots,
+            table_mapping=table_mapping,
+            deployability_index=deployability_index,
+            expand=expand,
+            needs_optimization=needs_optimization,
+            runtime_stage=runtime_stage,
+            **kwargs,
+        )
+
+        template_key = self._time_template_key(start, end, execution_time, render_kwargs)
+        if template_key is None:
+            return self._render_query(start, end, execution_time, **render_kwargs)
+
+        time_variables = self._time_variables(start, end, execution_time)
+        template = self._time_template
+        if template is not None and template[0] == template_key:
+            return _substitute_time_variables(template[1], time_variables)
+
+        pending = self._pending_time_template
+        if pending is not None and pending[0] == template_key:
+            # The query is rendered repeatedly for different intervals, so a template is worth building
+            self._pending_time_template = None
+            self._update_time_template(
+                template_key, pending[1], start, end, execution_time, pending[2], render_kwargs
+            )
+            template = self._time_template
+            if template is not None:
+                return _substitute_time_variables(template[1], time_variables)
+
+        query = self._render_query(start, end, execution_time, **render_kwargs)
+        if query is not None and self._supports_time_template:
+            if self._references_time_variables:
+                self._pending_time_template = (template_key, query, time_variables)
+            else:
+                # The rendered query doesn't depend on the time range, so it's cached as is
+                self._time_template = (template_key, query.copy())
+        return query
 
+    def _render_query(
+        self,
+        start: t.Optional[TimeLike] = None,
+        end: t.Optional[TimeLike] = None,
+        execution_time: t.Optional[TimeLike] = None,
+        snapshots: t.Optional[t.Dict[str, Snapshot]] = None,
+        table_mapping: t.Optional[t.Dict[str, str]] = None,
+        deployability_index: t.Optional[DeployabilityIndex] = None,
+        expand: t.Iterable[str] = tuple(),
+        needs_optimization: bool = True,
+        runtime_stage: RuntimeStage = RuntimeStage.LOADING,
+        time_variables: t.Optional[t.Dict[str, t.Any]] = None,
+        **kwargs: t.Any,
+    ) -> t.Optional[exp.Query]:
         should_cache = self._should_cache(
             runtime_stage, start, end, execution_time, *kwargs.values()
         )
@@ -576,6 +656,7 @@ class QueryRenderer(BaseExpressionRenderer):
                     table_mapping=table_mapping,
                     deployability_index=deployability_index,
                     runtime_stage=runtime_stage,
+                    time_variables=time_variables,
                     **kwargs,
                 )
             except ParsetimeAdapterCallError:
@@ -630,6 +711,99 @@ class QueryRenderer(BaseExpressionRenderer):
 
         return query
 
+    def _time_template_key(
+        self,
+        start: t.Optional[TimeLike],
+        end: t.Optional[TimeLike],
+        execution_time: t.Optional[TimeLike],
+        render_kwargs: t.Dict[str, t.Any],
+    ) -> t.Optional[t.Tuple[t.Any, ...]]:
+        """Returns the arguments that a time-parameterized template of the query depends on.
+
+        Queries are rendered from such a template if they're rendered repeatedly for different intervals,
+        eg. one batch at a time. None is returned if the query can't be rendered from a template.
+        """
+        if start is None and end is None and execution_time is None:
+            return None
+        if render_kwargs["expand"] or not render_kwargs["needs_optimization"]:
+            return None
+        snapshots = render_kwargs["snapshots"] or {}
+        if any(snapshot.is_embedded for snapshot in snapshots.values()):
+            # Embedded models are expanded into the query using the actual start and end
+            return None
+
+        if self._supports_time_template is None:
+            self._supports_time_template = self._can_render_time_template()
+        if not self._supports_time_template:
+            return None
+
+        return tuple(sorted(render_kwargs.items(), key=lambda item: item[0]))
+
+    def _can_render_time_template(self) -> bool:
+        if isinstance(self._expression, d.Jinja):
+            return False
+
+        if any(not executable.is_value for executable in self._python_env.values()):
+            # Python macros could compute anything from time variables or have side effects, so their
+            # results can't be captured by a template
+            return False
+
+        references_time_variables = False
+        for expression in (self._expression, *self._macro_definitions):
+            for node in expression.walk():
+                if isinstance(node, (d.MacroSQL, d.MacroStrReplace)):
+                    return False
+                if isinstance(node, exp.Identifier) and "@" in node.this:
+                    return False
+                if isinstance(node, d.MacroVar) and node.name.lower() in TIME_VARIABLES:
+                    # Only string variables that are used as is can be substituted into a rendered query
+                    if node.name.lower() not in TEMPLATE_TIME_VARIABLES or node.find_ancestor(
+                        d.MacroFunc
+                    ):
+                        return False
+                    references_time_variables = True
+                elif (
+                    isinstance(node, (exp.Identifier, exp.Var))
+                    and node.name.lower() in TIME_VARIABLES
+                    and node.find_ancestor(d.MacroFunc)
+                ):
+                    # Macro lambdas can refer to time variables by name
+                    references_time_variables = True
+
+        self._references_time_variables = references_time_variables
+        return True
+
+    def _update_time_template(
+        self,
+        template_key: t.Tuple[t.Any, ...],
+        query: exp.Query,
+        start: t.Optional[TimeLike],
+        end: t.Optional[TimeLike],
+        execution_time: t.Optional[TimeLike],
+        time_variables: t.Dict[str, t.Any],
+        render_kwargs: t.Dict[str, t.Any],
+    ) -> None:
+        try:
+            template = self._render_query(
+                start,
+                end,
+                execution_time,
+                time_variables={name: _time_placeholder(name) for name in TEMPLATE_TIME_VARIABLES},
+                **render_kwargs,
+            )
+        except Exception:
+            logger.debug("Failed to render a template for model '%s'", self._model_fqn, exc_info=True)
+            template = None
+
+        # The template is only used if it reproduces the query that has just been rendered, which guards against
+        # placeholders being treated differently from actual values, eg. by the optimizer
+        if template is not None and _substitute_time_variables(template, time_variables) == query:
+            self._time_template = (template_key, template)
+        else:
+            logger.debug("Model '%s' can't be rendered from a template", self._model_fqn)
+            self._supports_time_template = False
+            self._time_template = None
+
     def update_cache(
         self,
         expression: t.Optional[exp.Expression],
@@ -702,6 +876,25 @@ class QueryRenderer(BaseExpressionRenderer):
         return query
 
 
+def _time_placeholder(name: str) -> str:
+    return f"__sqlmesh_{name}__"
+
+
+def _substitute_time_variables(query: exp.Query, time_variables: t.Dict[str, t.Any]) -> exp.Query:
+    values = {
+        _time_placeholder(name): value
+        for name, value in time_variables.items()
+        if name in TEMPLATE_TIME_VARIABLES
+    }
+
+    def _substitute(node: exp.Expression) -> exp.Expression:
+        if isinstance(node, exp.Literal) and node.is_string and node.this in values:
+            return exp.Literal.string(values[node.this])
+        return node
+
+    return query.transform(_substitute)
+
+
 def _prepare_python_env_for_jinja(
     evaluator: MacroEvaluator,
     python_env: t.Dict[str, Executable],
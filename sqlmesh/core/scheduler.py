@@ -37,7 +37,11 @@ from sqlmesh.core.snapshot.definition import (
 )
 from sqlmesh.core.state_sync import StateSync
 from sqlmesh.utils import CompletionStatus
-from sqlmesh.utils.concurrency import concurrent_apply_to_dag, NodeExecutionFailedError
+from sqlmesh.utils.concurrency import (
+    concurrent_apply_to_dag,
+    critical_path_priority,
+    NodeExecutionFailedError,
+)
 from sqlmesh.utils.dag import DAG
 from sqlmesh.utils.date import (
     TimeLike,
@@ -589,6 +593,7 @@ class Scheduler:
                     run_node,
                     self.max_workers,
                     raise_on_error=False,
+                    priority=critical_path_priority(dag),
                 )
                 self.console.stop_evaluation_progress(success=not errors)
 
@@ -1163,4 +1168,4 @@ def _expand_range_as_interval(
     start_ts: int, end_ts: int, interval_unit: IntervalUnit
 ) -> t.List[Interval]:
     values = expand_range(start_ts, end_ts, interval_unit)
-    return [(values[i], values[i + 1]) for i in range(len(values) - 1)]
+    return list(zip(values, values[1:]))
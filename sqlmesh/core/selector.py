@@ -16,6 +16,7 @@ from sqlmesh.core import constants as c
 from sqlmesh.core.dialect import normalize_model_name
 from sqlmesh.core.environment import Environment
 from sqlmesh.core.model import update_model_schemas
+from sqlmesh.core.model.schema import mapping_schema_matches
 from sqlmesh.utils import UniqueKeyDict
 from sqlmesh.utils.dag import DAG
 from sqlmesh.utils.git import GitClient
@@ -26,6 +27,7 @@ if t.TYPE_CHECKING:
     from typing_extensions import Literal as Lit  # noqa
     from sqlmesh.core.model import Model
     from sqlmesh.core.state_sync import StateReader
+    from sqlmesh.utils.cache import CacheCodec, CacheStore
 
 
 class Selector(abc.ABC):
@@ -38,11 +40,15 @@ class Selector(abc.ABC):
         default_catalog: t.Optional[str] = None,
         dialect: t.Optional[str] = None,
         cache_dir: t.Optional[Path] = None,
+        cache_store: t.Optional[CacheStore] = None,
+        cache_codec: t.Optional[CacheCodec] = None,
     ):
         self._state_reader = state_reader
         self._models = models
         self._context_path = context_path
         self._cache_dir = cache_dir if cache_dir else context_path / c.CACHE
+        self._cache_store = cache_store
+        self._cache_codec = cache_codec
         self._default_catalog = default_catalog
         self._dialect = dialect
         self._git_client = GitClient(context_path)
@@ -141,28 +147,20 @@ class Selector(abc.ABC):
             if model.fqn in subdag:
                 dag.add(model.fqn, model.depends_on)
 
-                for dep in model.depends_on:
-                    schema = model.mapping_schema
-
-                    for part in exp.to_table(dep).parts:
-                        schema = schema.get(part.sql()) or {}
-
-                    parent = get_model(dep)
-
-                    parent_schema = {
-                        c: t.sql(dialect=model.dialect)
-                        for c, t in ((parent and parent.columns_to_types) or {}).items()
-                    }
-
-                    if schema != parent_schema:
-                        model = model.copy(update={"mapping_schema": {}})
-                        needs_update = True
-                        break
+                if not mapping_schema_matches(model, get_model):
+                    model = model.copy(update={"mapping_schema": {}})
+                    needs_update = True
 
             models[model.fqn] = model
 
         if needs_update:
-            update_model_schemas(dag, models=models, cache_dir=self._cache_dir)
+            update_model_schemas(
+                dag,
+                models=models,
+                cache_dir=self._cache_dir,
+                cache_store=self._cache_store,
+                cache_codec=self._cache_codec,
+            )
 
         return models
 
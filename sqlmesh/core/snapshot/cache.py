@@ -10,17 +10,27 @@ from sqlmesh.core.model.cache import (
     load_optimized_query,
 )
 from sqlmesh.core import constants as c
+from sqlmesh.core.model import Model, SqlModel
 from sqlmesh.core.snapshot.definition import Snapshot, SnapshotId
-from sqlmesh.utils.cache import FileCache
+from sqlmesh.utils.cache import CacheCodec, CacheStore, FileCache
+from sqlmesh.utils.process import PoolExecutor
 
 
 logger = logging.getLogger(__name__)
 
 
 class SnapshotCache:
-    def __init__(self, path: Path):
-        self._snapshot_cache: FileCache[Snapshot] = FileCache(path, prefix="snapshot")
-        self._optimized_query_cache = OptimizedQueryCache(path)
+    def __init__(
+        self,
+        path: Path,
+        store: t.Optional[CacheStore] = None,
+        codec: t.Optional[CacheCodec] = None,
+    ):
+        self._snapshot_cache: FileCache[Snapshot] = FileCache(
+            path, prefix="snapshot", store=store, codec=codec
+        )
+        self._optimized_query_cache = OptimizedQueryCache(path, store=store, codec=codec)
+        self._optimized_query_pool: t.Optional[PoolExecutor] = None
 
     def get_or_load(
         self,
@@ -38,49 +48,40 @@ class SnapshotCache:
             snapshot IDs for which records were retrieved from the cache.
 
         """
-        snapshots = {}
-        cache_hits: t.Set[SnapshotId] = set()
+        entry_names = {self._entry_name(s_id): s_id for s_id in snapshot_ids}
+        snapshots = {
+            entry_names[name]: snapshot
+            for name, snapshot in self._snapshot_cache.get_many(entry_names).items()
+        }
+        cache_hits: t.Set[SnapshotId] = set(snapshots)
 
-        for s_id in snapshot_ids:
-            snapshot = self._snapshot_cache.get(self._entry_name(s_id))
-            if snapshot:
-                snapshot.intervals = []
-                snapshot.dev_intervals = []
-                snapshots[s_id] = snapshot
-                cache_hits.add(s_id)
+        for snapshot in snapshots.values():
+            snapshot.intervals = []
+            snapshot.dev_intervals = []
 
+        loaded_snapshots: t.List[Snapshot] = []
         snapshot_ids_to_load = snapshot_ids - snapshots.keys()
         if snapshot_ids_to_load:
-            loaded_snapshots = loader(snapshot_ids_to_load)
+            loaded_snapshots = list(loader(snapshot_ids_to_load))
             for snapshot in loaded_snapshots:
                 snapshots[snapshot.snapshot_id] = snapshot
 
-        with optimized_query_cache_pool(self._optimized_query_cache) as executor:
-            for key, entry_name in executor.map(
-                load_optimized_query,
-                (
-                    (snapshot.model, s_id)
-                    for s_id, snapshot in snapshots.items()
-                    if snapshot.is_model
-                ),
-            ):
-                if entry_name:
-                    self._optimized_query_cache.with_optimized_query(
-                        snapshots[key].model, entry_name
-                    )
+        models_to_hydrate: t.Dict[SnapshotId, SqlModel] = {}
+        for s_id, snapshot in snapshots.items():
+            if not snapshot.is_model:
+                continue
+            if isinstance(snapshot.model, SqlModel) and not _is_hydrated(snapshot.model):
+                models_to_hydrate[s_id] = snapshot.model
+            elif s_id not in cache_hits:
+                # Persist the query which is already rendered in memory so that it can be hydrated next time
+                self._put_optimized_query(s_id, snapshot.model)
+
+        self._hydrate_optimized_queries(models_to_hydrate)
 
         for snapshot in snapshots.values():
             self._update_node_hash_cache(snapshot)
 
-            if snapshot.is_model and c.MAX_FORK_WORKERS == 1:
-                try:
-                    self._optimized_query_cache.with_optimized_query(snapshot.model)
-                except Exception:
-                    logger.exception(
-                        "Failed to cache optimized query for snapshot %s", snapshot.snapshot_id
-                    )
-
-            self.put(snapshot)
+        self.put_many(loaded_snapshots)
 
         return snapshots, cache_hits
 
@@ -98,9 +99,70 @@ class SnapshotCache:
         except Exception:
             logger.exception("Failed to cache snapshot %s", snapshot.snapshot_id)
 
+    def put_many(self, snapshots: t.Collection[Snapshot]) -> None:
+        """Stores snapshots which are known to be missing from the cache in a single batch."""
+        if not snapshots:
+            return
+
+        try:
+            for snapshot in snapshots:
+                if snapshot.is_model:
+                    # make sure we preload full_depends_on
+                    snapshot.model.full_depends_on
+            self._snapshot_cache.put_many(
+                {self._entry_name(snapshot.snapshot_id): snapshot for snapshot in snapshots}
+            )
+        except Exception:
+            # Fall back to storing snapshots one by one to find the ones that can't be cached
+            for snapshot in snapshots:
+                self.put(snapshot)
+
     def clear(self) -> None:
         self._snapshot_cache.clear()
 
+    def close(self) -> None:
+        """Shuts down the pool used to hydrate optimized queries."""
+        if self._optimized_query_pool is not None:
+            self._optimized_query_pool.shutdown()
+            self._optimized_query_pool = None
+
+    def _hydrate_optimized_queries(self, models: t.Dict[SnapshotId, SqlModel]) -> None:
+        if not models:
+            return
+
+        if c.MAX_FORK_WORKERS == 1:
+            entry_names = {
+                self._optimized_query_cache._entry_name(model): model for model in models.values()
+            }
+        else:
+            if self._optimized_query_pool is None:
+                # The pool outlives a single call since the forked workers only depend on the cache path
+                self._optimized_query_pool = optimized_query_cache_pool(self._optimized_query_cache)
+
+            # Workers render and store queries that are missing in the cache
+            entry_names = {
+                entry_name: models[s_id]
+                for s_id, entry_name in self._optimized_query_pool.map(
+                    load_optimized_query, ((model, s_id) for s_id, model in models.items())
+                )
+                if entry_name
+            }
+
+        missing = self._optimized_query_cache.with_optimized_queries(entry_names)
+
+        if c.MAX_FORK_WORKERS == 1:
+            for model in missing:
+                try:
+                    self._optimized_query_cache.with_optimized_query(model)
+                except Exception:
+                    logger.exception("Failed to cache optimized query for model %s", model.name)
+
+    def _put_optimized_query(self, snapshot_id: SnapshotId, model: Model) -> None:
+        try:
+            self._optimized_query_cache.put(model)
+        except Exception:
+            logger.exception("Failed to cache optimized query for snapshot %s", snapshot_id)
+
     @staticmethod
     def _entry_name(snapshot_id: SnapshotId) -> str:
         return f"{snapshot_id.name}_{snapshot_id.identifier}"
@@ -109,3 +171,15 @@ class SnapshotCache:
     def _update_node_hash_cache(snapshot: Snapshot) -> None:
         snapshot.node._data_hash = snapshot.fingerprint.data_hash
         snapshot.node._metadata_hash = snapshot.fingerprint.metadata_hash
+
+
+def _is_hydrated(model: Model) -> bool:
+    """Returns True if the model's rendered query is already cached in memory."""
+    if not isinstance(model, SqlModel):
+        # Only SQL models have queries to hydrate
+        return True
+
+    renderer = model.__dict__.get("_query_renderer")
+    return renderer is not None and (
+        renderer._optimized_cache is not None or bool(renderer._cache)
+    )
@@ -25,6 +25,7 @@ from sqlmesh.core.model import Model, ModelKindMixin, ModelKindName, ViewKind, C
 from sqlmesh.core.model.definition import _Model
 from sqlmesh.core.node import IntervalUnit, NodeType
 from sqlmesh.utils import sanitize_name, unique
+from sqlmesh.utils import intervals as vectorized
 from sqlmesh.utils.dag import DAG
 from sqlmesh.utils.date import (
     TimeLike,
@@ -1930,6 +1931,9 @@ def merge_intervals(intervals: t.Collection[Interval]) -> Intervals:
     """
     if not intervals:
         return []
+    if len(intervals) >= vectorized.VECTORIZE_THRESHOLD:
+        return vectorized.merge_intervals(intervals)
+
     intervals = sorted(intervals)
 
     merged = [intervals[0]]
@@ -1973,6 +1977,9 @@ def remove_interval(intervals: Intervals, remove_start: int, remove_end: int) ->
     Returns:
         A new list of intervals.
     """
+    if len(intervals) >= vectorized.VECTORIZE_THRESHOLD:
+        return vectorized.remove_interval(intervals, remove_start, remove_end)
+
     modified: Intervals = []
 
     for start, end in intervals:
@@ -2105,6 +2112,14 @@ def missing_intervals(
 
 @lru_cache(maxsize=16384)
 def expand_range(start_ts: int, end_ts: int, interval_unit: IntervalUnit) -> t.List[int]:
+    step_ms = interval_unit.fixed_interval_seconds * 1000
+    if step_ms:
+        # Fixed-width units don't need croniter, the timestamps can be generated arithmetically
+        timestamps = list(range(start_ts, end_ts + 1, step_ms)) or [start_ts]
+        if timestamps[-1] != end_ts:
+            timestamps.append(end_ts)
+        return timestamps
+
     croniter = interval_unit.croniter(start_ts)
     timestamps = [start_ts]
 
@@ -2146,6 +2161,14 @@ def compute_missing_intervals(
         return []
 
     timestamps = expand_range(start_ts, end_ts, interval_unit)
+
+    if len(timestamps) >= vectorized.VECTORIZE_THRESHOLD:
+        missing_intervals = _compute_missing_intervals_vectorized(
+            interval_unit, intervals, timestamps, end_ts, lookback, model_end_ts
+        )
+        if missing_intervals is not None:
+            return missing_intervals
+
     missing = set()
 
     for current_ts, next_ts in zip(timestamps, timestamps[1:]):
@@ -2161,14 +2184,7 @@ def compute_missing_intervals(
     if missing:
         if lookback:
             if model_end_ts:
-                croniter = interval_unit.croniter(end_ts)
-                end_ts = to_timestamp(croniter.get_prev(estimate=True))
-
-                while model_end_ts < end_ts:
-                    end_ts = to_timestamp(croniter.get_prev(estimate=True))
-                    lookback -= 1
-
-                lookback = max(lookback, 0)
+                lookback = _lookback_before_model_end(interval_unit, end_ts, lookback, model_end_ts)
 
             for i, (current_ts, next_ts) in enumerate(zip(timestamps, timestamps[1:])):
                 parent = timestamps[i + lookback : i + lookback + 2]
@@ -2182,6 +2198,55 @@ def compute_missing_intervals(
     return sorted(missing)
 
 
+def _compute_missing_intervals_vectorized(
+    interval_unit: IntervalUnit,
+    intervals: t.Tuple[Interval, ...],
+    timestamps: t.List[int],
+    end_ts: int,
+    lookback: int,
+    model_end_ts: t.Optional[int],
+) -> t.Optional[Intervals]:
+    """Same as `compute_missing_intervals` but uses NumPy arrays to test the coverage of expanded timestamps.
+
+    Returns None if the provided intervals are not sorted, in which case the pure Python
+    implementation should be used instead.
+    """
+    import numpy as np
+
+    timestamps_array = np.array(timestamps, dtype=np.int64)
+    missing = vectorized.missing_mask(timestamps_array, intervals)
+    if missing is None:
+        return None
+
+    if not missing.any():
+        return []
+
+    if lookback:
+        if model_end_ts:
+            lookback = _lookback_before_model_end(interval_unit, end_ts, lookback, model_end_ts)
+        if lookback:
+            missing = vectorized.apply_lookback(missing, lookback)
+
+    if model_end_ts:
+        missing &= timestamps_array[:-1] < model_end_ts
+
+    missing_idx = np.flatnonzero(missing)
+    return list(zip(timestamps_array[missing_idx].tolist(), timestamps_array[missing_idx + 1].tolist()))
+
+
+def _lookback_before_model_end(
+    interval_unit: IntervalUnit, end_ts: int, lookback: int, model_end_ts: int
+) -> int:
+    croniter = interval_unit.croniter(end_ts)
+    end_ts = to_timestamp(croniter.get_prev(estimate=True))
+
+    while model_end_ts < end_ts:
+        end_ts = to_timestamp(croniter.get_prev(estimate=True))
+        lookback -= 1
+
+    return max(lookback, 0)
+
+
 @lru_cache(maxsize=16384)
 def inclusive_exclusive(
     start: TimeLike,
@@ -2428,6 +2493,10 @@ def parent_snapshots_by_name(
 
 def _contiguous_intervals(intervals: Intervals) -> t.List[Intervals]:
     """Given a list of intervals with gaps, returns a list of sequences of contiguous intervals."""
+    if len(intervals) >= vectorized.VECTORIZE_THRESHOLD:
+        boundaries = [0, *vectorized.contiguous_breaks(intervals), len(intervals)]
+        return [intervals[i:j] for i, j in zip(boundaries, boundaries[1:])]
+
     contiguous_intervals = []
     current_batch: t.List[Interval] = []
     for interval in intervals:
@@ -24,6 +24,7 @@ from sqlmesh.core.snapshot import (
     SnapshotTableCleanupTask,
     SnapshotTableInfo,
     SnapshotNameVersion,
+    SnapshotNameVersionLike,
     SnapshotIdAndVersion,
 )
 from sqlmesh.core.snapshot.definition import Interval, SnapshotIntervals
@@ -31,7 +32,12 @@ from sqlmesh.utils import major_minor
 from sqlmesh.utils.date import TimeLike
 from sqlmesh.utils.errors import SQLMeshError
 from sqlmesh.utils.pydantic import PydanticModel, ValidationInfo, field_validator
-from sqlmesh.core.state_sync.common import StateStream
+from sqlmesh.core.state_sync.common import (
+    ExpiredSnapshotBatch,
+    IntervalCompactionStats,
+    IntervalSummary,
+    StateStream,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -102,6 +108,22 @@ class StateReader(abc.ABC):
             A dictionary of snapshot ids to snapshots for ones that could be found.
         """
 
+    @abc.abstractmethod
+    def get_snapshot_table_infos(
+        self, snapshot_ids: t.Iterable[SnapshotIdLike]
+    ) -> t.Dict[SnapshotId, SnapshotTableInfo]:
+        """Bulk fetch table infos of snapshots given the corresponding snapshot ids.
+
+        Unlike get_snapshots, this doesn't load and parse the full snapshot payloads, which makes it a better fit
+        for callers that only need names, versions, kinds and physical tables of snapshots.
+
+        Args:
+            snapshot_ids: Iterable of snapshot ids to get.
+
+        Returns:
+            A dictionary of snapshot ids to table infos for snapshots that could be found.
+        """
+
     @abc.abstractmethod
     def get_snapshots_by_names(
         self,
@@ -200,6 +222,22 @@ class StateReader(abc.ABC):
             A dictionary of model FQNs to their respective interval ends in milliseconds since epoch.
         """
 
+    @abc.abstractmethod
+    def get_interval_summaries(
+        self, snapshots: t.Collection[SnapshotNameVersionLike]
+    ) -> t.Dict[SnapshotNameVersion, IntervalSummary]:
+        """Returns the earliest start and the latest end of intervals per snapshot version without fetching the intervals.
+
+        Removed intervals and gaps between intervals are not reflected in the summaries, so they can't be used
+        to tell that a snapshot version has no missing intervals.
+
+        Args:
+            snapshots: The snapshot versions to fetch summaries for.
+
+        Returns:
+            A dictionary of snapshot versions to their interval summaries. Snapshot versions without intervals are omitted.
+        """
+
     @abc.abstractmethod
     def recycle(self) -> None:
         """Closes all open connections and releases all allocated resources associated with any thread
@@ -326,6 +364,22 @@ class StateReader(abc.ABC):
            The list of table cleanup tasks.
         """
 
+    @abc.abstractmethod
+    def get_expired_snapshot_batches(
+        self, current_ts: t.Optional[int] = None, ignore_ttl: bool = False
+    ) -> t.Iterator[ExpiredSnapshotBatch]:
+        """Lazily fetches expired snapshots in batches.
+
+        Each batch can be cleaned up and deleted from the state before the next batch is fetched.
+
+        Args:
+            current_ts: The timestamp relative to which snapshots are considered expired.
+            ignore_ttl: Ignore the TTL on the snapshot when considering it expired.
+
+        Returns:
+            An iterator over batches of expired snapshots.
+        """
+
     @abc.abstractmethod
     def get_expired_environments(self, current_ts: int) -> t.List[EnvironmentSummary]:
         """Returns the expired environments.
@@ -375,6 +429,16 @@ class StateSync(StateReader, abc.ABC):
                 all snapshots that are not referenced in any environment
         """
 
+    @abc.abstractmethod
+    def delete_expired_snapshot_batch(self, batch: ExpiredSnapshotBatch) -> None:
+        """Removes the records of snapshots in a batch returned by `get_expired_snapshot_batches`.
+
+        This should only be called once tables of the snapshots in the batch have been dropped.
+
+        Args:
+            batch: The batch of expired snapshots.
+        """
+
     @abc.abstractmethod
     def invalidate_environment(self, name: str, protect_prod: bool = True) -> None:
         """Invalidates the target environment by setting its expiration timestamp to now.
@@ -463,11 +527,14 @@ class StateSync(StateReader, abc.ABC):
         """
 
     @abc.abstractmethod
-    def compact_intervals(self) -> None:
+    def compact_intervals(self) -> IntervalCompactionStats:
         """Compacts intervals for all snapshots.
 
         Compaction process involves merging of existing interval records into new records and
         then deleting the old ones.
+
+        Returns:
+            The number of compacted snapshot versions and the number of rows that have been read and written.
         """
 
     @abc.abstractmethod
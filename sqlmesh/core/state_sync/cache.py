@@ -1,91 +1,142 @@
 from __future__ import annotations
 
+import logging
+import threading
 import typing as t
+from collections import OrderedDict
+from dataclasses import dataclass
 
-from sqlmesh.core.model import SeedModel
 from sqlmesh.core.snapshot import (
     Snapshot,
     SnapshotId,
     SnapshotIdLike,
     SnapshotIdAndVersionLike,
     SnapshotInfoLike,
+    SnapshotTableInfo,
 )
 from sqlmesh.core.snapshot.definition import Interval, SnapshotIntervals
 from sqlmesh.core.state_sync.base import DelegatingStateSync, StateSync
+from sqlmesh.core.state_sync.common import ExpiredSnapshotBatch
 from sqlmesh.utils.date import TimeLike, now_timestamp
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStats:
+    """Counters of snapshot lookups served by the cache.
+
+    Lookups of snapshots that are known not to exist are counted as hits too.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _CacheEntry:
+    # None means that the snapshot doesn't exist in the state sync but has been requested before
+    snapshot: t.Optional[Snapshot]
+    refreshed_ts: int
+
 
 class CachingStateSync(DelegatingStateSync):
-    """In memory cache for snapshots that implements the state sync api.
+    """In memory LRU cache for snapshots that implements the state sync api.
+
+    The definition of a snapshot never changes for a given snapshot ID, so cached snapshots are only evicted once
+    the cache is full or when they're modified through this state sync. Fields that can be modified by other
+    processes, like timestamps and intervals, are refreshed once they're older than the TTL.
 
     Args:
         state_sync: The base state sync.
-        ttl: The number of seconds a snapshot should be cached.
+        ttl: The number of seconds after which mutable fields of a snapshot and missing snapshots are refreshed.
+        max_size: The maximum number of snapshots to cache.
     """
 
-    def __init__(self, state_sync: StateSync, ttl: int = 120):
-        super().__init__(state_sync)
-        # The cache can contain a snapshot or False or None.
-        # False means that the snapshot does not exist in the state sync but has been requested before
-        # None means that the snapshot has not been requested.
-        self.snapshot_cache: t.Dict[
-            SnapshotId, t.Tuple[t.Optional[Snapshot | t.Literal[False]], int]
-        ] = {}
+    DEFAULT_MAX_SIZE = 10000
 
+    def __init__(self, state_sync: StateSync, ttl: int = 120, max_size: int = DEFAULT_MAX_SIZE):
+        super().__init__(state_sync)
+        self.snapshot_cache: OrderedDict[SnapshotId, _CacheEntry] = OrderedDict()
         self.ttl = ttl
-
-    def _from_cache(
-        self, snapshot_id: SnapshotId, now: int
-    ) -> t.Optional[Snapshot | t.Literal[False]]:
-        snapshot: t.Optional[Snapshot | t.Literal[False]] = None
-        snapshot_expiration = self.snapshot_cache.get(snapshot_id)
-
-        if snapshot_expiration and snapshot_expiration[1] >= now:
-            snapshot = snapshot_expiration[0]
-
-        return snapshot
+        self.max_size = max_size
+        self.stats = CacheStats()
+        # The cache is shared by threads of the concurrent scheduler
+        self._lock = threading.RLock()
 
     def get_snapshots(
         self, snapshot_ids: t.Iterable[SnapshotIdLike]
     ) -> t.Dict[SnapshotId, Snapshot]:
+        snapshot_ids = tuple(snapshot_ids)
         existing = {}
         missing = set()
         now = now_timestamp()
-        expire_at = now + self.ttl * 1000
 
-        for s in snapshot_ids:
-            snapshot_id = s.snapshot_id
-            snapshot = self._from_cache(snapshot_id, now)
-
-            if snapshot is None:
-                self.snapshot_cache[snapshot_id] = (False, expire_at)
-                missing.add(snapshot_id)
-            elif snapshot:
-                existing[snapshot_id] = snapshot
+        with self._lock:
+            for s in snapshot_ids:
+                snapshot_id = s.snapshot_id
+                entry = self._get_entry(snapshot_id, now)
+                if entry is None:
+                    missing.add(snapshot_id)
+                elif entry.snapshot:
+                    existing[snapshot_id] = entry.snapshot
+            self._record_lookups(len(snapshot_ids), len(missing))
 
         if missing:
-            existing.update(self.state_sync.get_snapshots(missing))
+            loaded = self.state_sync.get_snapshots(missing)
+            with self._lock:
+                for snapshot_id in missing:
+                    self._put_entry(snapshot_id, loaded.get(snapshot_id), now)
+            existing.update(loaded)
 
-        for snapshot_id, snapshot in existing.items():
-            cached = self._from_cache(snapshot_id, now)
-            if cached and (not isinstance(cached.node, SeedModel) or cached.node.is_hydrated):
-                continue
-            self.snapshot_cache[snapshot_id] = (snapshot, expire_at)
+        return existing
+
+    def get_snapshot_table_infos(
+        self, snapshot_ids: t.Iterable[SnapshotIdLike]
+    ) -> t.Dict[SnapshotId, SnapshotTableInfo]:
+        snapshot_ids = tuple(snapshot_ids)
+        existing = {}
+        missing = set()
+        now = now_timestamp()
+
+        with self._lock:
+            for s in snapshot_ids:
+                snapshot_id = s.snapshot_id
+                # Table infos only consist of immutable fields, so they can be served regardless of the TTL
+                entry = self._get_entry(snapshot_id, now, mutable=False)
+                if entry and entry.snapshot:
+                    existing[snapshot_id] = entry.snapshot.table_info
+                elif entry is None or self._is_expired(entry, now):
+                    missing.add(snapshot_id)
+            self._record_lookups(len(snapshot_ids), len(missing))
+
+        if missing:
+            existing.update(self.state_sync.get_snapshot_table_infos(missing))
 
         return existing
 
     def snapshots_exist(self, snapshot_ids: t.Iterable[SnapshotIdLike]) -> t.Set[SnapshotId]:
+        snapshot_ids = tuple(snapshot_ids)
         existing = set()
         missing = set()
         now = now_timestamp()
 
-        for s in snapshot_ids:
-            snapshot_id = s.snapshot_id
-            snapshot = self._from_cache(snapshot_id, now)
-            if snapshot:
-                existing.add(snapshot_id)
-            elif snapshot is None:
-                missing.add(snapshot_id)
+        with self._lock:
+            for s in snapshot_ids:
+                snapshot_id = s.snapshot_id
+                # Snapshots can be deleted by other processes, so their existence is subject to the TTL
+                entry = self._get_entry(snapshot_id, now)
+                if entry and entry.snapshot:
+                    existing.add(snapshot_id)
+                elif entry is None:
+                    missing.add(snapshot_id)
+            self._record_lookups(len(snapshot_ids), len(missing))
 
         if missing:
             existing.update(self.state_sync.snapshots_exist(missing))
@@ -94,37 +145,38 @@ class CachingStateSync(DelegatingStateSync):
 
     def push_snapshots(self, snapshots: t.Iterable[Snapshot]) -> None:
         snapshots = tuple(snapshots)
-
-        for snapshot in snapshots:
-            self.snapshot_cache.pop(snapshot.snapshot_id, None)
-
+        self._evict(s.snapshot_id for s in snapshots)
         self.state_sync.push_snapshots(snapshots)
 
     def delete_snapshots(self, snapshot_ids: t.Iterable[SnapshotIdLike]) -> None:
         snapshot_ids = tuple(snapshot_ids)
-
-        for s in snapshot_ids:
-            self.snapshot_cache.pop(s.snapshot_id, None)
+        self._evict(s.snapshot_id for s in snapshot_ids)
         self.state_sync.delete_snapshots(snapshot_ids)
 
     def delete_expired_snapshots(
         self, ignore_ttl: bool = False, current_ts: t.Optional[int] = None
     ) -> None:
         current_ts = current_ts or now_timestamp()
-        self.snapshot_cache.clear()
         self.state_sync.delete_expired_snapshots(current_ts=current_ts, ignore_ttl=ignore_ttl)
+        if ignore_ttl:
+            self.clear_cache()
+        else:
+            # Only snapshots which have outlived their TTL can be deleted
+            self._evict_where(
+                lambda snapshot: snapshot is None or snapshot.expiration_ts <= current_ts
+            )
+
+    def delete_expired_snapshot_batch(self, batch: ExpiredSnapshotBatch) -> None:
+        self._evict(batch.snapshot_ids)
+        self.state_sync.delete_expired_snapshot_batch(batch)
 
     def add_snapshots_intervals(self, snapshots_intervals: t.Sequence[SnapshotIntervals]) -> None:
         for snapshot_intervals in snapshots_intervals:
             if snapshot_intervals.snapshot_id:
-                self.snapshot_cache.pop(snapshot_intervals.snapshot_id, None)
+                self._evict([snapshot_intervals.snapshot_id])
             else:
                 # Evict all snapshots that share the same name
-                self.snapshot_cache = {
-                    snapshot_id: value
-                    for snapshot_id, value in self.snapshot_cache.items()
-                    if snapshot_id.name != snapshot_intervals.name
-                }
+                self._evict_names({snapshot_intervals.name})
         self.state_sync.add_snapshots_intervals(snapshots_intervals)
 
     def remove_intervals(
@@ -132,15 +184,80 @@ class CachingStateSync(DelegatingStateSync):
         snapshot_intervals: t.Sequence[t.Tuple[SnapshotIdAndVersionLike, Interval]],
         remove_shared_versions: bool = False,
     ) -> None:
-        for s, _ in snapshot_intervals:
-            self.snapshot_cache.pop(s.snapshot_id, None)
+        if remove_shared_versions:
+            self._evict_names({s.name for s, _ in snapshot_intervals})
+        else:
+            self._evict(s.snapshot_id for s, _ in snapshot_intervals)
         self.state_sync.remove_intervals(snapshot_intervals, remove_shared_versions)
 
     def unpause_snapshots(
         self, snapshots: t.Collection[SnapshotInfoLike], unpaused_dt: TimeLike
     ) -> None:
-        self.snapshot_cache.clear()
+        # Unpausing snapshots pauses all other snapshots with the same names
+        self._evict_names({s.name for s in snapshots})
         self.state_sync.unpause_snapshots(snapshots, unpaused_dt)
 
     def clear_cache(self) -> None:
-        self.snapshot_cache.clear()
+        with self._lock:
+            self.snapshot_cache.clear()
+
+    def close(self) -> None:
+        if self.stats.hits or self.stats.misses:
+            logger.info(
+                "Snapshot cache stats: %s hits, %s misses (%.1f%% hit rate), %s evictions",
+                self.stats.hits,
+                self.stats.misses,
+                self.stats.hit_rate * 100,
+                self.stats.evictions,
+            )
+        self.state_sync.close()
+
+    def _get_entry(
+        self, snapshot_id: SnapshotId, now: int, mutable: bool = True
+    ) -> t.Optional[_CacheEntry]:
+        """Returns the cached entry of a snapshot, or None if it needs to be fetched from the state sync.
+
+        Args:
+            snapshot_id: The snapshot ID.
+            now: The current timestamp.
+            mutable: Whether the mutable fields of the snapshot are needed, in which case expired entries aren't
+                returned.
+        """
+        entry = self.snapshot_cache.get(snapshot_id)
+        if entry is None:
+            return None
+        if mutable and self._is_expired(entry, now):
+            return None
+        self.snapshot_cache.move_to_end(snapshot_id)
+        return entry
+
+    def _record_lookups(self, lookups: int, misses: int) -> None:
+        self.stats.hits += lookups - misses
+        self.stats.misses += misses
+
+    def _put_entry(self, snapshot_id: SnapshotId, snapshot: t.Optional[Snapshot], now: int) -> None:
+        self.snapshot_cache[snapshot_id] = _CacheEntry(snapshot=snapshot, refreshed_ts=now)
+        self.snapshot_cache.move_to_end(snapshot_id)
+        while len(self.snapshot_cache) > self.max_size:
+            self.snapshot_cache.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _is_expired(self, entry: _CacheEntry, now: int) -> bool:
+        return entry.refreshed_ts + self.ttl * 1000 < now
+
+    def _evict(self, snapshot_ids: t.Iterable[SnapshotId]) -> None:
+        with self._lock:
+            for snapshot_id in snapshot_ids:
+                self.snapshot_cache.pop(snapshot_id, None)
+
+    def _evict_names(self, names: t.Set[str]) -> None:
+        with self._lock:
+            for snapshot_id in [s_id for s_id in self.snapshot_cache if s_id.name in names]:
+                del self.snapshot_cache[snapshot_id]
+
+    def _evict_where(self, predicate: t.Callable[[t.Optional[Snapshot]], bool]) -> None:
+        with self._lock:
+            for snapshot_id in [
+                s_id for s_id, entry in self.snapshot_cache.items() if predicate(entry.snapshot)
+            ]:
+                del self.snapshot_cache[snapshot_id]
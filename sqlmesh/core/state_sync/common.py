@@ -14,7 +14,12 @@ from sqlmesh.core.dialect import schema_
 from sqlmesh.utils.pydantic import PydanticModel
 from sqlmesh.core.environment import Environment, EnvironmentStatements
 from sqlmesh.utils.errors import SQLMeshError
-from sqlmesh.core.snapshot import Snapshot
+from sqlmesh.core.snapshot import (
+    Snapshot,
+    SnapshotId,
+    SnapshotNameVersion,
+    SnapshotTableCleanupTask,
+)
 
 if t.TYPE_CHECKING:
     from sqlmesh.core.engine_adapter.base import EngineAdapter
@@ -156,6 +161,47 @@ class EnvironmentWithStatements(PydanticModel):
     statements: t.List[EnvironmentStatements] = []
 
 
+class ExpiredSnapshotBatch(PydanticModel):
+    """A batch of expired snapshots which can be cleaned up independently of other batches.
+
+    Args:
+        snapshot_ids: IDs of the expired snapshots whose records should be deleted.
+        cleanup_tasks: Tasks to drop the tables of the expired snapshots.
+    """
+
+    snapshot_ids: t.Set[SnapshotId]
+    cleanup_tasks: t.List[SnapshotTableCleanupTask]
+
+
+class IntervalSummary(PydanticModel):
+    """The range covered by intervals that have been added to a snapshot version.
+
+    Args:
+        name: The name of the snapshot.
+        version: The version of the snapshot.
+        min_start_ts: The earliest start of an interval, in milliseconds since epoch.
+        max_end_ts: The latest end of an interval, in milliseconds since epoch.
+    """
+
+    name: str
+    version: str
+    min_start_ts: int
+    max_end_ts: int
+
+    @property
+    def name_version(self) -> SnapshotNameVersion:
+        return SnapshotNameVersion(name=self.name, version=self.version)
+
+
+@dataclass
+class IntervalCompactionStats:
+    """Statistics of a single compaction pass."""
+
+    snapshot_versions: int = 0
+    rows_read: int = 0
+    rows_written: int = 0
+
+
 @dataclass
 class VersionsChunk:
     versions: Versions
@@ -32,6 +32,7 @@ class EnvironmentState:
         self.engine_adapter = engine_adapter
         self.environments_table = exp.table_("_environments", db=schema)
         self.environment_statements_table = exp.table_("_environment_statements", db=schema)
+        self.environment_snapshots_table = exp.table_("_environment_snapshots", db=schema)
 
         index_type = index_text_type(engine_adapter.dialect)
         blob_type = blob_text_type(engine_adapter.dialect)
@@ -60,6 +61,13 @@ class EnvironmentState:
             "environment_statements": exp.DataType.build(blob_type),
         }
 
+        self._environment_snapshots_columns_to_types = {
+            "environment_name": exp.DataType.build(index_type),
+            "name": exp.DataType.build(index_type),
+            "identifier": exp.DataType.build(index_type),
+            "version": exp.DataType.build(index_type),
+        }
+
     def update_environment(self, environment: Environment) -> None:
         """Updates the environment.
 
@@ -74,13 +82,24 @@ class EnvironmentState:
             ),
         )
 
-        self.engine_adapter.insert_append(
+        self.engine_adapter.bulk_insert(
             self.environments_table,
             _environment_to_df(environment),
             target_columns_to_types=self._environment_columns_to_types,
-            track_rows_processed=False,
         )
 
+        self.engine_adapter.delete_from(
+            self.environment_snapshots_table,
+            where=exp.column("environment_name").eq(exp.Literal.string(environment.name)),
+        )
+
+        if environment.snapshots:
+            self.engine_adapter.bulk_insert(
+                self.environment_snapshots_table,
+                _environment_snapshots_to_df(environment),
+                target_columns_to_types=self._environment_snapshots_columns_to_types,
+            )
+
     def update_environment_statements(
         self,
         environment_name: str,
@@ -105,11 +124,10 @@ class EnvironmentState:
         )
 
         if environment_statements:
-            self.engine_adapter.insert_append(
+            self.engine_adapter.bulk_insert(
                 self.environment_statements_table,
                 _environment_statements_to_df(environment_name, plan_id, environment_statements),
                 target_columns_to_types=self._environment_statements_columns_to_types,
-                track_rows_processed=False,
             )
 
     def invalidate_environment(self, name: str, protect_prod: bool = True) -> None:
@@ -194,7 +212,7 @@ class EnvironmentState:
             where=self._create_expiration_filter_expr(current_ts),
         )
 
-        # Delete the expired environments' corresponding environment statements
+        # Delete the expired environments' corresponding environment statements and snapshots
         if expired_environments_exprs := [
             exp.EQ(this=exp.column("environment_name"), expression=exp.Literal.string(env.name))
             for env in expired_environments
@@ -203,6 +221,10 @@ class EnvironmentState:
                 self.environment_statements_table,
                 where=exp.or_(*expired_environments_exprs),
             )
+            self.engine_adapter.delete_from(
+                self.environment_snapshots_table,
+                where=exp.or_(*expired_environments_exprs),
+            )
 
         return expired_environments
 
@@ -370,6 +392,22 @@ def _environment_to_df(environment: Environment) -> pd.DataFrame:
     )
 
 
+def _environment_snapshots_to_df(environment: Environment) -> pd.DataFrame:
+    import pandas as pd
+
+    return pd.DataFrame(
+        [
+            {
+                "environment_name": environment.name,
+                "name": snapshot.name,
+                "identifier": snapshot.identifier,
+                "version": snapshot.version,
+            }
+            for snapshot in environment.snapshots
+        ]
+    )
+
+
 def _environment_statements_to_df(
     environment_name: str, plan_id: str, environment_statements: t.List[EnvironmentStatements]
 ) -> pd.DataFrame:
@@ -35,6 +35,7 @@ from sqlmesh.core.snapshot import (
     SnapshotInfoLike,
     SnapshotIntervals,
     SnapshotNameVersion,
+    SnapshotNameVersionLike,
     SnapshotTableCleanupTask,
     SnapshotTableInfo,
     start_date,
@@ -55,12 +56,17 @@ from sqlmesh.core.state_sync.common import (
     StateStream,
     chunk_iterable,
     EnvironmentWithStatements,
+    ExpiredSnapshotBatch,
+    IntervalCompactionStats,
+    IntervalSummary,
 )
 from sqlmesh.core.state_sync.db.interval import IntervalState
 from sqlmesh.core.state_sync.db.environment import EnvironmentState
 from sqlmesh.core.state_sync.db.snapshot import SnapshotState
 from sqlmesh.core.state_sync.db.version import VersionState
 from sqlmesh.core.state_sync.db.migrator import StateMigrator, _backup_table_name
+from sqlmesh.core.state_sync.db.utils import StateReadPool
+from sqlmesh.utils.cache import CacheCodec, CacheStore
 from sqlmesh.utils.date import TimeLike, to_timestamp, time_like_to_str, now_timestamp
 from sqlmesh.utils.errors import ConflictingPlanError, SQLMeshError
 
@@ -81,6 +87,10 @@ class EngineAdapterStateSync(StateSync):
         schema: The schema to store state metadata in. If None or empty string then no schema is defined
         console: The console to log information to.
         cache_dir: The cache path, used for caching snapshot models.
+        cache_store: The storage layout of the snapshot cache.
+        cache_codec: The encoding of snapshot cache entries.
+        max_concurrent_reads: The maximum number of independent state queries that run at the same time. Reads
+            are only run concurrently if the engine adapter is multithreaded.
     """
 
     def __init__(
@@ -89,10 +99,21 @@ class EngineAdapterStateSync(StateSync):
         schema: t.Optional[str],
         console: t.Optional[Console] = None,
         cache_dir: Path = Path(),
+        max_concurrent_reads: int = 1,
+        cache_store: t.Optional[CacheStore] = None,
+        cache_codec: t.Optional[CacheCodec] = None,
     ):
-        self.interval_state = IntervalState(engine_adapter, schema=schema)
+        self.read_pool = StateReadPool(max_workers=max_concurrent_reads)
+        self.interval_state = IntervalState(engine_adapter, schema=schema, read_pool=self.read_pool)
         self.environment_state = EnvironmentState(engine_adapter, schema=schema)
-        self.snapshot_state = SnapshotState(engine_adapter, schema=schema, cache_dir=cache_dir)
+        self.snapshot_state = SnapshotState(
+            engine_adapter,
+            schema=schema,
+            cache_dir=cache_dir,
+            read_pool=self.read_pool,
+            cache_store=cache_store,
+            cache_codec=cache_codec,
+        )
         self.version_state = VersionState(engine_adapter, schema=schema)
         self.migrator = StateMigrator(
             engine_adapter,
@@ -265,22 +286,40 @@ class EngineAdapterStateSync(StateSync):
     ) -> t.List[SnapshotTableCleanupTask]:
         current_ts = current_ts or now_timestamp()
         return self.snapshot_state.get_expired_snapshots(
-            self.environment_state.get_environments(), current_ts=current_ts, ignore_ttl=ignore_ttl
+            self.environment_state.environment_snapshots_table,
+            current_ts=current_ts,
+            ignore_ttl=ignore_ttl,
         )
 
     def get_expired_environments(self, current_ts: int) -> t.List[EnvironmentSummary]:
         return self.environment_state.get_expired_environments(current_ts=current_ts)
 
+    def get_expired_snapshot_batches(
+        self, current_ts: t.Optional[int] = None, ignore_ttl: bool = False
+    ) -> t.Iterator[ExpiredSnapshotBatch]:
+        current_ts = current_ts or now_timestamp()
+        for expired_snapshot_ids, cleanup_targets in self.snapshot_state._get_expired_snapshots(
+            self.environment_state.environment_snapshots_table,
+            ignore_ttl=ignore_ttl,
+            current_ts=current_ts,
+        ):
+            yield ExpiredSnapshotBatch(
+                snapshot_ids=expired_snapshot_ids, cleanup_tasks=cleanup_targets
+            )
+
     @transactional()
     def delete_expired_snapshots(
         self, ignore_ttl: bool = False, current_ts: t.Optional[int] = None
     ) -> None:
-        current_ts = current_ts or now_timestamp()
-        for expired_snapshot_ids, cleanup_targets in self.snapshot_state._get_expired_snapshots(
-            self.environment_state.get_environments(), ignore_ttl=ignore_ttl, current_ts=current_ts
+        for batch in self.get_expired_snapshot_batches(
+            current_ts=current_ts, ignore_ttl=ignore_ttl
         ):
-            self.snapshot_state.delete_snapshots(expired_snapshot_ids)
-            self.interval_state.cleanup_intervals(cleanup_targets, expired_snapshot_ids)
+            self.delete_expired_snapshot_batch(batch)
+
+    @transactional()
+    def delete_expired_snapshot_batch(self, batch: ExpiredSnapshotBatch) -> None:
+        self.snapshot_state.delete_snapshots(batch.snapshot_ids)
+        self.interval_state.cleanup_intervals(batch.cleanup_tasks, batch.snapshot_ids)
 
     @transactional()
     def delete_expired_environments(
@@ -305,7 +344,9 @@ class EngineAdapterStateSync(StateSync):
             self.snapshot_state.auto_restatements_table,
             self.environment_state.environments_table,
             self.environment_state.environment_statements_table,
+            self.environment_state.environment_snapshots_table,
             self.interval_state.intervals_table,
+            self.interval_state.interval_summaries_table,
             self.version_state.versions_table,
         ):
             self.engine_adapter.drop_table(table)
@@ -313,6 +354,7 @@ class EngineAdapterStateSync(StateSync):
                 self.engine_adapter.drop_table(_backup_table_name(table))
 
         self.snapshot_state.clear_cache()
+        self.interval_state.invalidate_index()
 
     def reset(self, default_catalog: t.Optional[str]) -> None:
         """Resets the state store to the state when it was first initialized."""
@@ -364,6 +406,11 @@ class EngineAdapterStateSync(StateSync):
         Snapshot.hydrate_with_intervals_by_version(snapshots.values(), intervals)
         return snapshots
 
+    def get_snapshot_table_infos(
+        self, snapshot_ids: t.Iterable[SnapshotIdLike]
+    ) -> t.Dict[SnapshotId, SnapshotTableInfo]:
+        return self.snapshot_state.get_snapshot_table_infos(snapshot_ids)
+
     def get_snapshots_by_names(
         self,
         snapshot_names: t.Iterable[str],
@@ -374,19 +421,9 @@ class EngineAdapterStateSync(StateSync):
             snapshot_names=snapshot_names, current_ts=current_ts, exclude_expired=exclude_expired
         )
 
-    @transactional()
-    def add_interval(
-        self,
-        snapshot: Snapshot,
-        start: TimeLike,
-        end: TimeLike,
-        is_dev: bool = False,
-        last_altered_ts: t.Optional[int] = None,
-    ) -> None:
-        super().add_interval(snapshot, start, end, is_dev, last_altered_ts)
-
-    @transactional()
     def add_snapshots_intervals(self, snapshots_intervals: t.Sequence[SnapshotIntervals]) -> None:
+        # Intervals are written in a single transaction by the interval state, which then compacts versions
+        # that have accumulated too many rows in separate transactions
         intervals_to_insert = []
         for snapshot_intervals in snapshots_intervals:
             snapshot_intervals = snapshot_intervals.copy(
@@ -414,9 +451,9 @@ class EngineAdapterStateSync(StateSync):
     ) -> None:
         self.interval_state.remove_intervals(snapshot_intervals, remove_shared_versions)
 
-    @transactional()
-    def compact_intervals(self) -> None:
-        self.interval_state.compact_intervals()
+    def compact_intervals(self) -> IntervalCompactionStats:
+        # Each batch of snapshot versions is committed separately, so no transaction is started here
+        return self.interval_state.compact_intervals()
 
     def refresh_snapshot_intervals(self, snapshots: t.Collection[Snapshot]) -> t.List[Snapshot]:
         return self.interval_state.refresh_snapshot_intervals(snapshots)
@@ -442,10 +479,17 @@ class EngineAdapterStateSync(StateSync):
 
         return self.interval_state.max_interval_end_per_model(snapshots)
 
+    def get_interval_summaries(
+        self, snapshots: t.Collection[SnapshotNameVersionLike]
+    ) -> t.Dict[SnapshotNameVersion, IntervalSummary]:
+        return self.interval_state.get_interval_summaries(snapshots)
+
     def recycle(self) -> None:
         self.engine_adapter.recycle()
 
     def close(self) -> None:
+        self.snapshot_state.close()
+        self.read_pool.close()
         self.engine_adapter.close()
 
     @transactional()
@@ -460,11 +504,13 @@ class EngineAdapterStateSync(StateSync):
             skip_backup=skip_backup,
             promoted_snapshots_only=promoted_snapshots_only,
         )
+        self.interval_state.invalidate_index()
 
     @transactional()
     def rollback(self) -> None:
         """Rollback to the previous migration."""
         self.migrator.rollback()
+        self.interval_state.invalidate_index()
 
     @transactional()
     def export(self, environment_names: t.Optional[t.List[str]] = None) -> StateStream:
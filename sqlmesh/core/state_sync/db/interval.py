@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import typing as t
 import logging
+import threading
 
 from sqlglot import exp
 
@@ -11,6 +12,7 @@ from sqlmesh.core.state_sync.db.utils import (
     snapshot_id_filter,
     create_batches,
     fetchall,
+    StateReadPool,
 )
 from sqlmesh.core.snapshot import (
     SnapshotIntervals,
@@ -22,6 +24,7 @@ from sqlmesh.core.snapshot import (
     Snapshot,
 )
 from sqlmesh.core.snapshot.definition import Interval
+from sqlmesh.core.state_sync.common import IntervalCompactionStats, IntervalSummary
 from sqlmesh.utils.migration import index_text_type
 from sqlmesh.utils import random_id
 from sqlmesh.utils.date import now_timestamp
@@ -33,18 +36,38 @@ if t.TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+IntervalKey = t.Tuple[str, str]
+IntervalMergeKey = t.Tuple[str, str, t.Optional[str], t.Optional[str]]
+
+
 class IntervalState:
-    INTERVAL_BATCH_SIZE = 1000
     SNAPSHOT_BATCH_SIZE = 1000
+    # The number of snapshot versions that are compacted in a single transaction
+    COMPACTION_BATCH_SIZE = 100
+    # The number of compacted rows that are deleted by a single statement
+    INTERVAL_BATCH_SIZE = 1000
+    # Snapshot versions are compacted as soon as new intervals are added to them once they've accumulated
+    # this many uncompacted rows
+    COMPACTION_THRESHOLD = 100
+    # Rows written shortly before the high-water mark can become visible only after it has advanced, eg. due to
+    # long-running transactions or clock skew between writers, so rows this recent are always read again
+    INDEX_LOOKBACK_MS = 10 * 60 * 1000
+    # The index is periodically rebuilt to pick up rows that have been updated or deleted by other processes
+    INDEX_TTL_MS = 60 * 60 * 1000
+    # Only rows older than this are compacted, so that rows of ongoing transactions are unlikely to be missed
+    COMPACTION_LAG_MS = INDEX_LOOKBACK_MS
 
     def __init__(
         self,
         engine_adapter: EngineAdapter,
         schema: t.Optional[str] = None,
         table_name: t.Optional[str] = None,
+        read_pool: t.Optional[StateReadPool] = None,
     ):
         self.engine_adapter = engine_adapter
+        self.read_pool = read_pool or StateReadPool()
         self.intervals_table = exp.table_(table_name or "_intervals", db=schema)
+        self.interval_summaries_table = exp.table_("_interval_summaries", db=schema)
 
         index_type = index_text_type(engine_adapter.dialect)
         self._interval_columns_to_types = {
@@ -62,10 +85,28 @@ class IntervalState:
             "is_pending_restatement": exp.DataType.build("boolean"),
             "last_altered_ts": exp.DataType.build("bigint"),
         }
+        self._interval_summary_columns_to_types = {
+            "name": exp.DataType.build(index_type),
+            "version": exp.DataType.build(index_type),
+            "min_start_ts": exp.DataType.build("bigint"),
+            "max_end_ts": exp.DataType.build("bigint"),
+        }
+        self._index = _IntervalIndex()
+        self._index_lock = threading.Lock()
 
     def add_snapshots_intervals(self, snapshots_intervals: t.Sequence[SnapshotIntervals]) -> None:
         if snapshots_intervals:
-            self._push_snapshot_intervals(snapshots_intervals)
+            with self.engine_adapter.transaction():
+                self._push_snapshot_intervals(snapshots_intervals)
+                self._refresh_interval_summaries(snapshots_intervals)
+
+            if self.engine_adapter._connection_pool.is_transaction_active:
+                # Compaction must not extend the caller's transaction. Versions that have reached the threshold
+                # are compacted when intervals are added to them next time or by the janitor
+                return
+            self._compact_intervals(
+                snapshots_intervals, min_uncompacted_rows=self.COMPACTION_THRESHOLD
+            )
 
     def remove_intervals(
         self,
@@ -112,40 +153,45 @@ class IntervalState:
             snapshot_ids = ", ".join(str(s.snapshot_id) for s, _ in intervals_to_remove)
             logger.info("Removing interval for snapshots: %s", snapshot_ids)
 
-        self.engine_adapter.insert_append(
-            self.intervals_table,
-            _intervals_to_df(intervals_to_remove, is_dev=False, is_removed=True),
-            target_columns_to_types=self._interval_columns_to_types,
-            track_rows_processed=False,
-        )
+        with self.engine_adapter.transaction():
+            self.engine_adapter.bulk_insert(
+                self.intervals_table,
+                _intervals_to_df(intervals_to_remove, is_dev=False, is_removed=True),
+                target_columns_to_types=self._interval_columns_to_types,
+            )
+            self._refresh_interval_summaries([s for s, _ in intervals_to_remove])
 
     def get_snapshot_intervals(
         self, snapshots: t.Collection[SnapshotNameVersionLike]
     ) -> t.List[SnapshotIntervals]:
-        return self._get_snapshot_intervals(snapshots)[1]
+        return self._get_indexed_snapshot_intervals(snapshots)
 
-    def compact_intervals(self) -> None:
-        interval_ids, snapshot_intervals = self._get_snapshot_intervals(uncompacted_only=True)
+    def invalidate_index(self) -> None:
+        """Discards all intervals cached in memory, so that they're fetched from scratch next time."""
+        with self._index_lock:
+            self._index = _IntervalIndex()
 
-        logger.info(
-            "Compacting %s intervals for %s snapshots", len(interval_ids), len(snapshot_intervals)
-        )
+    def compact_intervals(
+        self, snapshots: t.Optional[t.Collection[SnapshotNameVersionLike]] = None
+    ) -> IntervalCompactionStats:
+        """Merges rows of snapshot versions which have uncompacted rows into compacted ones.
 
-        self._push_snapshot_intervals(snapshot_intervals, is_compacted=True)
+        Only rows that are older than the compaction watermark are compacted. Snapshot versions are compacted in
+        batches, each of which is committed separately.
 
-        if interval_ids:
-            for interval_id_batch in create_batches(
-                list(interval_ids), batch_size=self.INTERVAL_BATCH_SIZE
-            ):
-                self.engine_adapter.delete_from(
-                    self.intervals_table, exp.column("id").isin(*interval_id_batch)
-                )
+        Args:
+            snapshots: Snapshot versions to compact. All snapshot versions are compacted if not provided.
+
+        Returns:
+            The number of compacted snapshot versions and the number of rows that have been read and written.
+        """
+        return self._compact_intervals(snapshots)
 
     def refresh_snapshot_intervals(self, snapshots: t.Collection[Snapshot]) -> t.List[Snapshot]:
         if not snapshots:
             return []
 
-        _, intervals = self._get_snapshot_intervals([s for s in snapshots if s.version])
+        intervals = self._get_indexed_snapshot_intervals([s for s in snapshots if s.version])
         for s in snapshots:
             s.intervals = []
             s.dev_intervals = []
@@ -154,38 +200,42 @@ class IntervalState:
     def max_interval_end_per_model(
         self, snapshots: t.Collection[SnapshotNameVersionLike]
     ) -> t.Dict[str, int]:
-        if not snapshots:
-            return {}
+        return {
+            summary.name: summary.max_end_ts
+            for summary in self.get_interval_summaries(snapshots).values()
+        }
+
+    def get_interval_summaries(
+        self, snapshots: t.Collection[SnapshotNameVersionLike]
+    ) -> t.Dict[SnapshotNameVersion, IntervalSummary]:
+        """Returns the earliest start and the latest end of non-dev intervals of the given snapshot versions.
 
-        table_alias = "intervals"
-        name_col = exp.column("name", table=table_alias)
-        version_col = exp.column("version", table=table_alias)
+        The summaries are read from a rollup table which is maintained whenever intervals are added, removed or
+        compacted, so that the intervals themselves don't have to be fetched.
 
-        result: t.Dict[str, int] = {}
+        Args:
+            snapshots: Snapshot versions to fetch summaries for.
+
+        Returns:
+            Summaries by snapshot version. Versions without any intervals are omitted.
+        """
+        if not snapshots:
+            return {}
 
+        result: t.Dict[SnapshotNameVersion, IntervalSummary] = {}
         for where in snapshot_name_version_filter(
-            self.engine_adapter, snapshots, alias=table_alias, batch_size=self.SNAPSHOT_BATCH_SIZE
+            self.engine_adapter, snapshots, alias=None, batch_size=self.SNAPSHOT_BATCH_SIZE
         ):
             query = (
-                exp.select(
-                    name_col,
-                    exp.func("MAX", exp.column("end_ts", table=table_alias)).as_("max_end_ts"),
-                )
-                .from_(exp.to_table(self.intervals_table).as_(table_alias))
+                exp.select(*self._interval_summary_columns_to_types)
+                .from_(self.interval_summaries_table)
                 .where(where, copy=False)
-                .where(
-                    exp.and_(
-                        exp.to_column("is_dev").not_(),
-                        exp.to_column("is_removed").not_(),
-                        exp.to_column("is_pending_restatement").not_(),
-                    ),
-                    copy=False,
-                )
-                .group_by(name_col, version_col, copy=False)
             )
-
-            for name, max_end in fetchall(self.engine_adapter, query):
-                result[name] = max_end
+            for name, version, min_start_ts, max_end_ts in fetchall(self.engine_adapter, query):
+                summary = IntervalSummary(
+                    name=name, version=version, min_start_ts=min_start_ts, max_end_ts=max_end_ts
+                )
+                result[summary.name_version] = summary
 
         return result
 
@@ -194,20 +244,134 @@ class IntervalState:
         cleanup_targets: t.List[SnapshotTableCleanupTask],
         expired_snapshot_ids: t.Collection[SnapshotIdLike],
     ) -> None:
+        watermark = self._compaction_watermark()
         # Cleanup can only happen for compacted intervals
-        self.compact_intervals()
+        self._compact_intervals(
+            self._get_snapshot_versions(expired_snapshot_ids), watermark=watermark
+        )
         # Delete intervals for non-dev tables that are no longer used
         self._delete_intervals_by_version(cleanup_targets)
         # Delete dev intervals for dev tables that are no longer used
         self._delete_intervals_by_dev_version(cleanup_targets)
         # Nullify the snapshot identifiers of interval records for snapshots that have been deleted
-        self._update_intervals_for_deleted_snapshots(expired_snapshot_ids)
+        self._update_intervals_for_deleted_snapshots(expired_snapshot_ids, watermark)
+        self.invalidate_index()
+
+    def _compact_intervals(
+        self,
+        snapshots: t.Optional[t.Collection[SnapshotNameVersionLike]] = None,
+        min_uncompacted_rows: int = 1,
+        watermark: t.Optional[int] = None,
+    ) -> IntervalCompactionStats:
+        stats = IntervalCompactionStats()
+        if not snapshots and snapshots is not None:
+            return stats
+
+        watermark = watermark if watermark is not None else self._compaction_watermark()
+        snapshot_versions = self._get_uncompacted_snapshot_versions(
+            watermark, snapshots, min_uncompacted_rows
+        )
+        if not snapshot_versions:
+            return stats
+
+        # Compaction rewrites existing rows, which can't be detected by the index
+        self.invalidate_index()
+
+        for batch in create_batches(snapshot_versions, batch_size=self.COMPACTION_BATCH_SIZE):
+            interval_ids = []
+            intervals: t.Dict[IntervalKey, t.Dict[IntervalMergeKey, SnapshotIntervals]] = {}
+            for row in self._fetch_interval_rows(batch, watermark=watermark):
+                interval_ids.append(row[0])
+                _apply_interval_row(intervals.setdefault((row[1], row[3]), {}), row)
+            stats.rows_read += len(interval_ids)
+
+            with self.engine_adapter.transaction():
+                # Only rows that have been merged are deleted. Rows which became visible after they were read
+                # are left for the next pass, even if they were created before the watermark
+                for interval_id_batch in create_batches(
+                    interval_ids, batch_size=self.INTERVAL_BATCH_SIZE
+                ):
+                    self.engine_adapter.delete_from(
+                        self.intervals_table, exp.column("id").isin(*interval_id_batch)
+                    )
+                # Compacted rows take the watermark as their creation timestamp so that they're applied before
+                # the remaining rows which haven't been compacted
+                stats.rows_written += self._push_snapshot_intervals(
+                    [i for by_merge_key in intervals.values() for i in by_merge_key.values()],
+                    is_compacted=True,
+                    created_ts=watermark,
+                )
+                # Removed intervals are only subtracted from the added ones once they've been merged
+                self._refresh_interval_summaries(batch)
+            stats.snapshot_versions += len(batch)
+
+        logger.info(
+            "Compacted intervals of %s snapshot versions: %s rows read, %s rows written",
+            stats.snapshot_versions,
+            stats.rows_read,
+            stats.rows_written,
+        )
+        return stats
+
+    def _compaction_watermark(self) -> int:
+        return now_timestamp() - self.COMPACTION_LAG_MS
+
+    def _get_uncompacted_snapshot_versions(
+        self,
+        watermark: int,
+        snapshots: t.Optional[t.Collection[SnapshotNameVersionLike]] = None,
+        min_uncompacted_rows: int = 1,
+    ) -> t.List[SnapshotNameVersion]:
+        """Returns snapshot versions with at least the given number of uncompacted rows before the watermark."""
+        query = (
+            exp.select("name", "version")
+            .from_(self.intervals_table)
+            .where(
+                exp.and_(
+                    exp.column("is_compacted").not_(),
+                    exp.column("created_ts") <= exp.Literal.number(watermark),
+                )
+            )
+            .group_by("name", "version")
+        )
+        if min_uncompacted_rows > 1:
+            query = query.having(
+                exp.func("COUNT", exp.Star()) >= exp.Literal.number(min_uncompacted_rows)
+            )
+
+        return [
+            SnapshotNameVersion(name=name, version=version)
+            for where in (
+                snapshot_name_version_filter(
+                    self.engine_adapter, snapshots, alias=None, batch_size=self.SNAPSHOT_BATCH_SIZE
+                )
+                if snapshots
+                else [None]
+            )
+            for name, version in fetchall(self.engine_adapter, query.where(where))
+        ]
+
+    def _get_snapshot_versions(
+        self, snapshot_ids: t.Collection[SnapshotIdLike]
+    ) -> t.List[SnapshotNameVersion]:
+        """Returns versions which have interval rows recorded by the given snapshots."""
+        return [
+            SnapshotNameVersion(name=name, version=version)
+            for where in snapshot_id_filter(
+                self.engine_adapter, snapshot_ids, alias=None, batch_size=self.SNAPSHOT_BATCH_SIZE
+            )
+            for name, version in fetchall(
+                self.engine_adapter,
+                exp.select("name", "version").from_(self.intervals_table).where(where).distinct(),
+            )
+        ]
 
     def _push_snapshot_intervals(
         self,
         snapshots: t.Iterable[t.Union[Snapshot, SnapshotIntervals]],
         is_compacted: bool = False,
-    ) -> None:
+        created_ts: t.Optional[int] = None,
+    ) -> int:
         import pandas as pd
 
         new_intervals = []
@@ -222,6 +386,7 @@ class IntervalState:
                         is_dev=False,
                         is_compacted=is_compacted,
                         last_altered_ts=snapshot.last_altered_ts,
+                        created_ts=created_ts,
                     )
                 )
             for start_ts, end_ts in snapshot.dev_intervals:
@@ -233,6 +398,7 @@ class IntervalState:
                         is_dev=True,
                         is_compacted=is_compacted,
                         last_altered_ts=snapshot.dev_last_altered_ts,
+                        created_ts=created_ts,
                     )
                 )
 
@@ -248,102 +414,132 @@ class IntervalState:
                         is_compacted=is_compacted,
                         is_pending_restatement=True,
                         last_altered_ts=snapshot.last_altered_ts,
+                        created_ts=created_ts,
                     )
                 )
 
         if new_intervals:
-            self.engine_adapter.insert_append(
+            self.engine_adapter.bulk_insert(
                 self.intervals_table,
                 pd.DataFrame(new_intervals),
                 target_columns_to_types=self._interval_columns_to_types,
-                track_rows_processed=False,
             )
+        return len(new_intervals)
 
     def _get_snapshot_intervals(
-        self,
-        snapshots: t.Optional[t.Collection[SnapshotNameVersionLike]] = None,
-        uncompacted_only: bool = False,
-    ) -> t.Tuple[t.Set[str], t.List[SnapshotIntervals]]:
-        if not snapshots and snapshots is not None:
-            return (set(), [])
+        self, snapshots: t.Collection[SnapshotNameVersionLike]
+    ) -> t.List[SnapshotIntervals]:
+        if not snapshots:
+            return []
 
-        query = self._get_snapshot_intervals_query(uncompacted_only)
+        intervals: t.Dict[IntervalKey, t.Dict[IntervalMergeKey, SnapshotIntervals]] = {}
 
-        interval_ids: t.Set[str] = set()
-        intervals: t.Dict[
-            t.Tuple[str, str, t.Optional[str], t.Optional[str]], SnapshotIntervals
-        ] = {}
+        for row in self._fetch_interval_rows(snapshots):
+            _apply_interval_row(intervals.setdefault((row[1], row[3]), {}), row)
 
-        for where in (
-            snapshot_name_version_filter(
-                self.engine_adapter,
-                snapshots,
-                alias="intervals",
-                batch_size=self.SNAPSHOT_BATCH_SIZE,
+        return [
+            i for by_merge_key in intervals.values() for i in by_merge_key.values() if not i.is_empty()
+        ]
+
+    def _get_indexed_snapshot_intervals(
+        self, snapshots: t.Collection[SnapshotNameVersionLike]
+    ) -> t.List[SnapshotIntervals]:
+        """Returns intervals of target snapshots using the in-memory index.
+
+        Only rows that were added since the previous call are fetched for snapshot versions that are already
+        indexed. Versions that haven't been indexed yet, or whose rows could have been applied out of order,
+        are fetched in full.
+        """
+        if not snapshots:
+            return []
+
+        if self.engine_adapter._connection_pool.is_transaction_active:
+            # Rows written by the ongoing transaction can still be rolled back, so they must not be indexed
+            return self._get_snapshot_intervals(snapshots)
+
+        with self._index_lock:
+            index = self._index
+            now = now_timestamp()
+            if index.created_ts is None or now - index.created_ts > self.INDEX_TTL_MS:
+                index = self._index = _IntervalIndex(created_ts=now)
+
+            snapshots_by_key = {(s.name, s.version): s for s in snapshots}
+            missing = [s for key, s in snapshots_by_key.items() if key not in index.intervals]
+
+            # New rows of indexed versions and all rows of missing versions don't depend on each other, so
+            # both are fetched at the same time. They're still applied in the same order.
+            new_rows = self.read_pool.submit(
+                self.engine_adapter, self._fetch_new_interval_rows, index
             )
-            if snapshots
-            else [None]
-        ):
-            rows = fetchall(self.engine_adapter, query.where(where))
-            for (
-                interval_id,
-                name,
-                identifier,
-                version,
-                dev_version,
-                start,
-                end,
-                is_dev,
-                is_removed,
-                is_pending_restatement,
-                last_altered_ts,
-            ) in rows:
-                interval_ids.add(interval_id)
-                merge_key = (name, version, dev_version, identifier)
-                # Pending restatement intervals are merged by name and version
-                pending_restatement_interval_merge_key = (name, version, None, None)
-
-                if merge_key not in intervals:
-                    intervals[merge_key] = SnapshotIntervals(
-                        name=name,
-                        identifier=identifier,
-                        version=version,
-                        dev_version=dev_version,
-                    )
+            missing_rows = list(self._fetch_interval_rows(missing)) if missing else []
 
-                if pending_restatement_interval_merge_key not in intervals:
-                    intervals[pending_restatement_interval_merge_key] = SnapshotIntervals(
-                        name=name,
-                        identifier=None,
-                        version=version,
-                        dev_version=None,
-                    )
+            stale_keys = index.apply_rows(new_rows.result())
+            for key in stale_keys:
+                index.intervals.pop(key, None)
 
-                if is_removed:
-                    if is_dev:
-                        intervals[merge_key].remove_dev_interval(start, end)
-                    else:
-                        intervals[merge_key].remove_interval(start, end)
-                elif is_pending_restatement:
-                    intervals[
-                        pending_restatement_interval_merge_key
-                    ].add_pending_restatement_interval(start, end)
-                else:
-                    if is_dev:
-                        intervals[merge_key].add_dev_interval(start, end)
-                        intervals[merge_key].update_dev_last_altered_ts(last_altered_ts)
-                    else:
-                        intervals[merge_key].add_interval(start, end)
-                        intervals[merge_key].update_last_altered_ts(last_altered_ts)
-                        # Remove all pending restatement intervals recorded before the current interval has been added
-                        intervals[
-                            pending_restatement_interval_merge_key
-                        ].remove_pending_restatement_interval(start, end)
-
-        return interval_ids, [i for i in intervals.values() if not i.is_empty()]
-
-    def _get_snapshot_intervals_query(self, uncompacted_only: bool) -> exp.Select:
-        query = (
+            if missing:
+                logger.debug("Indexing intervals for %s snapshot versions", len(missing))
+                self._index_snapshot_versions(index, missing, missing_rows)
+
+            stale = [s for key, s in snapshots_by_key.items() if key in stale_keys]
+            if stale:
+                logger.debug("Reindexing intervals for %s snapshot versions", len(stale))
+                self._index_snapshot_versions(index, stale, self._fetch_interval_rows(stale))
+
+            index.advance(now, self.INDEX_LOOKBACK_MS)
+
+            return [
+                i.copy()
+                for key in snapshots_by_key
+                for i in index.intervals[key].values()
+                if not i.is_empty()
+            ]
+
+    def _fetch_new_interval_rows(self, index: _IntervalIndex) -> t.List[t.Tuple]:
+        """Fetches rows which have been added since the high-water mark of the index."""
+        if index.high_water_mark is None or not index.intervals:
+            return []
+
+        query = self._get_snapshot_intervals_query().where(
+            exp.column("created_ts")
+            >= exp.Literal.number(index.high_water_mark - self.INDEX_LOOKBACK_MS)
+        )
+        return fetchall(self.engine_adapter, query)
+
+    def _index_snapshot_versions(
+        self,
+        index: _IntervalIndex,
+        snapshots: t.Collection[SnapshotNameVersionLike],
+        rows: t.Iterable[t.Tuple],
+    ) -> None:
+        for s in snapshots:
+            index.intervals[(s.name, s.version)] = {}
+        index.apply_rows(rows, skip_recent=False)
+
+    def _fetch_interval_rows(
+        self,
+        snapshots: t.Collection[SnapshotNameVersionLike],
+        watermark: t.Optional[int] = None,
+    ) -> t.Iterator[t.Tuple]:
+        query = self._get_snapshot_intervals_query()
+        if watermark is not None:
+            query = query.where(exp.column("created_ts") <= exp.Literal.number(watermark))
+        for rows in self.read_pool.fetchall(
+            self.engine_adapter,
+            (
+                query.where(where)
+                for where in snapshot_name_version_filter(
+                    self.engine_adapter,
+                    snapshots,
+                    alias="intervals",
+                    batch_size=self.SNAPSHOT_BATCH_SIZE,
+                )
+            ),
+        ):
+            yield from rows
+
+    def _get_snapshot_intervals_query(self) -> exp.Select:
+        return (
             exp.select(
                 "id",
                 exp.column("name", table="intervals"),
@@ -356,6 +552,7 @@ class IntervalState:
                 "is_removed",
                 "is_pending_restatement",
                 "last_altered_ts",
+                "created_ts",
             )
             .from_(exp.to_table(self.intervals_table).as_("intervals"))
             .order_by(
@@ -366,30 +563,15 @@ class IntervalState:
                 "is_pending_restatement",
             )
         )
-        if uncompacted_only:
-            query.join(
-                exp.select("name", "version")
-                .from_(exp.to_table(self.intervals_table).as_("intervals"))
-                .where(exp.column("is_compacted").not_())
-                .distinct()
-                .subquery(alias="uncompacted"),
-                on=exp.and_(
-                    exp.column("name", table="intervals").eq(
-                        exp.column("name", table="uncompacted")
-                    ),
-                    exp.column("version", table="intervals").eq(
-                        exp.column("version", table="uncompacted")
-                    ),
-                ),
-                copy=False,
-            )
-        return query
 
     def _update_intervals_for_deleted_snapshots(
-        self, snapshot_ids: t.Collection[SnapshotIdLike]
+        self, snapshot_ids: t.Collection[SnapshotIdLike], watermark: int
     ) -> None:
         """Nullifies the snapshot identifiers of dev interval records and snapshot identifiers and dev versions of
         non-dev interval records for snapshots that have been deleted so that they can be compacted efficiently.
+
+        Only rows that have been compacted up to the given watermark are updated, since they must not be merged
+        with uncompacted rows of other snapshots.
         """
         if not snapshot_ids:
             return
@@ -397,6 +579,7 @@ class IntervalState:
         for where in snapshot_id_filter(
             self.engine_adapter, snapshot_ids, alias=None, batch_size=self.SNAPSHOT_BATCH_SIZE
         ):
+            where = where.and_(exp.column("created_ts") <= exp.Literal.number(watermark))
             # Nullify the identifier for dev intervals
             # Set is_compacted to False so that it's compacted during the next compaction
             self.engine_adapter.update_table(
@@ -444,6 +627,167 @@ class IntervalState:
             batch_size=self.SNAPSHOT_BATCH_SIZE,
         ):
             self.engine_adapter.delete_from(self.intervals_table, where)
+            self.engine_adapter.delete_from(self.interval_summaries_table, where)
+
+    def _refresh_interval_summaries(self, snapshots: t.Collection[SnapshotNameVersionLike]) -> None:
+        """Recomputes the summary rows of the given snapshot versions from their non-dev intervals."""
+        snapshot_versions = {s.name_version for s in snapshots}
+        if not snapshot_versions:
+            return
+
+        for where in snapshot_name_version_filter(
+            self.engine_adapter, snapshot_versions, alias=None, batch_size=self.SNAPSHOT_BATCH_SIZE
+        ):
+            self.engine_adapter.delete_from(self.interval_summaries_table, where)
+            self.engine_adapter.insert_append(
+                self.interval_summaries_table,
+                exp.select(
+                    "name",
+                    "version",
+                    exp.func("MIN", exp.column("start_ts")).as_("min_start_ts"),
+                    exp.func("MAX", exp.column("end_ts")).as_("max_end_ts"),
+                )
+                .from_(self.intervals_table)
+                .where(where)
+                .where(
+                    exp.and_(
+                        exp.column("is_dev").not_(),
+                        exp.column("is_removed").not_(),
+                        exp.column("is_pending_restatement").not_(),
+                    ),
+                    copy=False,
+                )
+                .group_by("name", "version", copy=False),
+                target_columns_to_types=self._interval_summary_columns_to_types,
+                track_rows_processed=False,
+            )
+
+
+class _IntervalIndex:
+    """Intervals of snapshot versions reconstructed from the rows of the intervals table.
+
+    Args:
+        created_ts: The time when the index was created.
+    """
+
+    def __init__(self, created_ts: t.Optional[int] = None):
+        self.created_ts = created_ts
+        self.intervals: t.Dict[IntervalKey, t.Dict[IntervalMergeKey, SnapshotIntervals]] = {}
+        # The largest creation timestamp among all applied rows
+        self.high_water_mark: t.Optional[int] = None
+        # The largest creation timestamp among applied rows of each snapshot version
+        self.last_created_ts: t.Dict[IntervalKey, int] = {}
+        # IDs of applied rows that will be read again by the next sync
+        self.recent_ids: t.Dict[str, int] = {}
+
+    def apply_rows(
+        self, rows: t.Iterable[t.Tuple], skip_recent: bool = True
+    ) -> t.Set[IntervalKey]:
+        """Applies interval rows to snapshot versions that are being indexed.
+
+        Args:
+            rows: Rows of the intervals table.
+            skip_recent: Whether to skip rows that have already been applied by a recent sync. Should be
+                disabled when snapshot versions are being fetched from scratch.
+
+        Returns:
+            Keys of snapshot versions which received rows that are older than the ones that have already been
+            applied. Their intervals can't be updated incrementally and must be fetched from scratch.
+        """
+        stale_keys: t.Set[IntervalKey] = set()
+        # Rows are sorted by their creation time, so only rows from previous calls can be out of order
+        updated_keys: t.Set[IntervalKey] = set()
+        for row in rows:
+            interval_id, name, version, created_ts = row[0], row[1], row[3], row[11]
+            key = (name, version)
+            if key not in self.intervals or key in stale_keys:
+                continue
+            if skip_recent and interval_id in self.recent_ids:
+                continue
+
+            last_created_ts = self.last_created_ts.get(key)
+            if key not in updated_keys and last_created_ts is not None:
+                if created_ts <= last_created_ts:
+                    stale_keys.add(key)
+                    continue
+
+            _apply_interval_row(self.intervals[key], row)
+            updated_keys.add(key)
+            self.last_created_ts[key] = created_ts
+            self.recent_ids[interval_id] = created_ts
+            if self.high_water_mark is None or created_ts > self.high_water_mark:
+                self.high_water_mark = created_ts
+
+        for key in stale_keys:
+            self.last_created_ts.pop(key, None)
+
+        return stale_keys
+
+    def advance(self, synced_ts: int, lookback_ms: int) -> None:
+        """Moves the high-water mark to the time when all visible rows have been applied."""
+        self.high_water_mark = max(self.high_water_mark or synced_ts, synced_ts)
+        threshold = self.high_water_mark - lookback_ms
+        self.recent_ids = {i: ts for i, ts in self.recent_ids.items() if ts >= threshold}
+
+
+def _apply_interval_row(
+    intervals: t.Dict[IntervalMergeKey, SnapshotIntervals], row: t.Tuple
+) -> None:
+    """Applies a single row of the intervals table to intervals of the row's snapshot version."""
+    (
+        _,
+        name,
+        identifier,
+        version,
+        dev_version,
+        start,
+        end,
+        is_dev,
+        is_removed,
+        is_pending_restatement,
+        last_altered_ts,
+        _,
+    ) = row
+    merge_key = (name, version, dev_version, identifier)
+    # Pending restatement intervals are merged by name and version
+    pending_restatement_interval_merge_key = (name, version, None, None)
+
+    if merge_key not in intervals:
+        intervals[merge_key] = SnapshotIntervals(
+            name=name,
+            identifier=identifier,
+            version=version,
+            dev_version=dev_version,
+        )
+
+    if pending_restatement_interval_merge_key not in intervals:
+        intervals[pending_restatement_interval_merge_key] = SnapshotIntervals(
+            name=name,
+            identifier=None,
+            version=version,
+            dev_version=None,
+        )
+
+    if is_removed:
+        if is_dev:
+            intervals[merge_key].remove_dev_interval(start, end)
+        else:
+            intervals[merge_key].remove_interval(start, end)
+    elif is_pending_restatement:
+        intervals[pending_restatement_interval_merge_key].add_pending_restatement_interval(
+            start, end
+        )
+    else:
+        if is_dev:
+            intervals[merge_key].add_dev_interval(start, end)
+            intervals[merge_key].update_dev_last_altered_ts(last_altered_ts)
+        else:
+            intervals[merge_key].add_interval(start, end)
+            intervals[merge_key].update_last_altered_ts(last_altered_ts)
+            # Remove all pending restatement intervals recorded before the current interval has been added
+            intervals[pending_restatement_interval_merge_key].remove_pending_restatement_interval(
+                start, end
+            )
 
 
 def _intervals_to_df(
@@ -477,10 +821,11 @@ def _interval_to_df(
     is_compacted: bool = False,
     is_pending_restatement: bool = False,
     last_altered_ts: t.Optional[int] = None,
+    created_ts: t.Optional[int] = None,
 ) -> t.Dict[str, t.Any]:
     return {
         "id": random_id(),
-        "created_ts": now_timestamp(),
+        "created_ts": created_ts if created_ts is not None else now_timestamp(),
         "name": snapshot.name,
         "identifier": snapshot.identifier if not is_pending_restatement else None,
         "version": snapshot.version,
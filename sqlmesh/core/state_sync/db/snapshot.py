@@ -7,6 +7,7 @@ from pathlib import Path
 from collections import defaultdict
 from sqlglot import exp
 
+from sqlmesh.core import constants as c
 from sqlmesh.core.engine_adapter import EngineAdapter
 from sqlmesh.core.state_sync.db.utils import (
     snapshot_name_filter,
@@ -15,8 +16,8 @@ from sqlmesh.core.state_sync.db.utils import (
     fetchone,
     fetchall,
     create_batches,
+    StateReadPool,
 )
-from sqlmesh.core.environment import Environment
 from sqlmesh.core.model import SeedModel, ModelKindName
 from sqlmesh.core.snapshot.cache import SnapshotCache
 from sqlmesh.core.snapshot import (
@@ -29,31 +30,44 @@ from sqlmesh.core.snapshot import (
     SnapshotIdAndVersion,
     SnapshotId,
     SnapshotFingerprint,
+    SnapshotTableInfo,
 )
+from sqlmesh.utils.cache import CacheCodec, CacheStore
 from sqlmesh.utils.migration import index_text_type, blob_text_type
 from sqlmesh.utils.date import now_timestamp, TimeLike, to_timestamp
-from sqlmesh.utils import unique
+from sqlmesh.utils.process import create_process_pool_executor
 
 if t.TYPE_CHECKING:
     import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 
 logger = logging.getLogger(__name__)
 
 
 class SnapshotState:
     SNAPSHOT_BATCH_SIZE = 1000
-    # Use a smaller batch size for expired snapshots to account for fetching
-    # of all snapshots that share the same version.
+    # The number of expired versions processed at a time. Use a smaller batch size to account for
+    # checking all snapshots that share the same version or dev version.
     EXPIRED_SNAPSHOT_BATCH_SIZE = 200
+    # Snapshots that are missing in the cache are parsed by forked workers once there are at least this many of them
+    PARALLEL_PARSE_THRESHOLD = 1000
 
     def __init__(
         self,
         engine_adapter: EngineAdapter,
         schema: t.Optional[str] = None,
         cache_dir: Path = Path(),
+        read_pool: t.Optional[StateReadPool] = None,
+        cache_store: t.Optional[CacheStore] = None,
+        cache_codec: t.Optional[CacheCodec] = None,
     ):
         self.engine_adapter = engine_adapter
+        self.read_pool = read_pool or StateReadPool()
         self.snapshots_table = exp.table_("_snapshots", db=schema)
         self.auto_restatements_table = exp.table_("_auto_restatements", db=schema)
 
@@ -72,6 +86,7 @@ class SnapshotState:
             "unrestorable": exp.DataType.build("boolean"),
             "forward_only": exp.DataType.build("boolean"),
             "fingerprint": exp.DataType.build(blob_type),
+            "table_info": exp.DataType.build(blob_type),
         }
 
         self._auto_restatement_columns_to_types = {
@@ -80,7 +95,7 @@ class SnapshotState:
             "next_auto_restatement_ts": exp.DataType.build("bigint"),
         }
 
-        self._snapshot_cache = SnapshotCache(cache_dir)
+        self._snapshot_cache = SnapshotCache(cache_dir, store=cache_store, codec=cache_codec)
 
     def push_snapshots(self, snapshots: t.Iterable[Snapshot], overwrite: bool = False) -> None:
         """Pushes snapshots to the state store.
@@ -101,11 +116,10 @@ class SnapshotState:
                 snapshot = snapshot.copy(update={"node": seed_model.to_dehydrated()})
             snapshots_to_store.append(snapshot)
 
-        self.engine_adapter.insert_append(
+        self.engine_adapter.bulk_insert(
             self.snapshots_table,
             _snapshots_to_df(snapshots_to_store),
             target_columns_to_types=self._snapshot_columns_to_types,
-            track_rows_processed=False,
         )
 
         for snapshot in snapshots:
@@ -164,7 +178,7 @@ class SnapshotState:
 
     def get_expired_snapshots(
         self,
-        environments: t.Iterable[Environment],
+        environment_snapshots_table: exp.Table,
         current_ts: int,
         ignore_ttl: bool = False,
     ) -> t.List[SnapshotTableCleanupTask]:
@@ -173,13 +187,17 @@ class SnapshotState:
         Expired snapshots are snapshots that have exceeded their time-to-live
         and are no longer in use within an environment.
 
+        Args:
+            environment_snapshots_table: The table which maps environments to snapshots they contain.
+            current_ts: The current timestamp.
+            ignore_ttl: Whether to ignore the time-to-live of snapshots.
+
         Returns:
-            The set of expired snapshot ids.
             The list of table cleanup tasks.
         """
         all_cleanup_targets = []
         for _, cleanup_targets in self._get_expired_snapshots(
-            environments=environments,
+            environment_snapshots_table=environment_snapshots_table,
             current_ts=current_ts,
             ignore_ttl=ignore_ttl,
         ):
@@ -188,89 +206,165 @@ class SnapshotState:
 
     def _get_expired_snapshots(
         self,
-        environments: t.Iterable[Environment],
+        environment_snapshots_table: exp.Table,
         current_ts: int,
         ignore_ttl: bool = False,
     ) -> t.Iterator[t.Tuple[t.Set[SnapshotId], t.List[SnapshotTableCleanupTask]]]:
-        expired_query = exp.select("name", "identifier", "version").from_(self.snapshots_table)
-
-        if not ignore_ttl:
-            expired_query = expired_query.where(
-                (exp.column("updated_ts") + exp.column("ttl_ms")) <= current_ts
+        def _is_expired(alias: str) -> exp.Expression:
+            # Snapshots that are part of at least one environment are excluded with an anti-join,
+            # so that environments don't have to be fetched and deserialized
+            in_environment_query = (
+                exp.select("1")
+                .from_(exp.to_table(environment_snapshots_table).as_("environment_snapshots"))
+                .where(
+                    exp.and_(
+                        exp.column("name", table="environment_snapshots").eq(
+                            exp.column("name", table=alias)
+                        ),
+                        exp.column("identifier", table="environment_snapshots").eq(
+                            exp.column("identifier", table=alias)
+                        ),
+                    )
+                )
+            )
+            expired: exp.Expression = exp.not_(exp.Exists(this=in_environment_query))
+            if not ignore_ttl:
+                expired = expired.and_(
+                    (exp.column("updated_ts", table=alias) + exp.column("ttl_ms", table=alias))
+                    <= current_ts
+                )
+            return expired
+
+        def _is_in_use(column: str) -> exp.Expression:
+            # Whether a snapshot which hasn't expired shares the same value of the column
+            used_query = (
+                exp.select("1")
+                .from_(exp.to_table(self.snapshots_table).as_("used"))
+                .where(
+                    exp.and_(
+                        exp.column("name", table="used").eq(exp.column("name", table="snapshots")),
+                        exp.column(column, table="used").eq(exp.column(column, table="snapshots")),
+                        exp.not_(_is_expired("used")),
+                    )
+                )
+            )
+            return (
+                exp.case()
+                .when(exp.Exists(this=used_query), exp.Literal.number(1))
+                .else_(exp.Literal.number(0))
             )
 
-        expired_candidates = {
-            SnapshotId(name=name, identifier=identifier): SnapshotNameVersion(
-                name=name, version=version
+        name_col = exp.column("name", table="snapshots")
+        version_col = exp.column("version", table="snapshots")
+
+        def _compare_version(name: str, version: str, op: t.Type[exp.Binary]) -> exp.Expression:
+            name_lit, version_lit = exp.Literal.string(name), exp.Literal.string(version)
+            return exp.or_(
+                op(this=name_col, expression=name_lit),
+                exp.and_(name_col.eq(name_lit), op(this=version_col, expression=version_lit)),
             )
-            for name, identifier, version in fetchall(self.engine_adapter, expired_query)
-        }
-        if not expired_candidates:
-            return
 
-        promoted_snapshot_ids = {
-            snapshot.snapshot_id
-            for environment in environments
-            for snapshot in environment.snapshots
-        }
+        is_expired = _is_expired("snapshots")
 
-        def _is_snapshot_used(snapshot: SnapshotIdAndVersion) -> bool:
-            return (
-                snapshot.snapshot_id in promoted_snapshot_ids
-                or snapshot.snapshot_id not in expired_candidates
+        # Expired versions are paged through by their (name, version) key instead of an offset,
+        # since snapshots from previous pages may be deleted by the caller in the meantime
+        after_last_page: t.Optional[exp.Expression] = None
+        while True:
+            page_query = (
+                exp.select(name_col, version_col)
+                .distinct()
+                .from_(exp.to_table(self.snapshots_table).as_("snapshots"))
+                .where(is_expired)
+                .where(after_last_page)
+                .order_by(name_col, version_col)
+                .limit(self.EXPIRED_SNAPSHOT_BATCH_SIZE)
             )
+            page = fetchall(self.engine_adapter, page_query)
+            if not page:
+                return
+
+            # Expired snapshots of all versions in the page fall into the same key range
+            last_name, last_version = page[-1]
+            in_page = exp.and_(is_expired, _compare_version(last_name, last_version, exp.LTE))
+            if after_last_page is not None:
+                in_page = in_page.and_(after_last_page)
+            yield from self._get_expired_snapshots_in_range(in_page, _is_in_use)
+
+            if len(page) < self.EXPIRED_SNAPSHOT_BATCH_SIZE:
+                return
+            after_last_page = _compare_version(last_name, last_version, exp.GT)
+
+    def _get_expired_snapshots_in_range(
+        self,
+        where: exp.Expression,
+        is_in_use: t.Callable[[str], exp.Expression],
+    ) -> t.Iterator[t.Tuple[t.Set[SnapshotId], t.List[SnapshotTableCleanupTask]]]:
+        """Determines which tables of the expired snapshots matching the filter can be dropped.
 
-        unique_expired_versions = unique(expired_candidates.values())
-        version_batches = create_batches(
-            unique_expired_versions, batch_size=self.EXPIRED_SNAPSHOT_BATCH_SIZE
+        A dev table can be dropped once none of the snapshots that share its dev version are in use. Among
+        expired snapshots that share the same version, only the most recently updated one gets its
+        non-dev table dropped, and only if none of the snapshots of this version are in use.
+        """
+        query = (
+            exp.select(
+                exp.column("name", table="snapshots"),
+                exp.column("identifier", table="snapshots"),
+                exp.column("version", table="snapshots"),
+                exp.column("dev_version", table="snapshots"),
+                is_in_use("version").as_("version_in_use"),
+                is_in_use("dev_version").as_("dev_version_in_use"),
+            )
+            .from_(exp.to_table(self.snapshots_table).as_("snapshots"))
+            .where(where)
+            .order_by(
+                exp.column("name", table="snapshots"),
+                exp.column("version", table="snapshots"),
+                exp.column("updated_ts", table="snapshots"),
+                exp.column("identifier", table="snapshots"),
+            )
         )
-        for versions_batch in version_batches:
-            snapshots = self._get_snapshots_with_same_version(versions_batch)
-
-            snapshots_by_version = defaultdict(set)
-            snapshots_by_dev_version = defaultdict(set)
-            for s in snapshots:
-                snapshots_by_version[(s.name, s.version)].add(s.snapshot_id)
-                snapshots_by_dev_version[(s.name, s.dev_version)].add(s.snapshot_id)
-
-            expired_snapshots = [s for s in snapshots if not _is_snapshot_used(s)]
-            all_expired_snapshot_ids = {s.snapshot_id for s in expired_snapshots}
-
-            cleanup_targets: t.List[t.Tuple[SnapshotId, bool]] = []
-            for snapshot in expired_snapshots:
-                shared_version_snapshots = snapshots_by_version[(snapshot.name, snapshot.version)]
-                shared_version_snapshots.discard(snapshot.snapshot_id)
-
-                shared_dev_version_snapshots = snapshots_by_dev_version[
-                    (snapshot.name, snapshot.dev_version)
-                ]
-                shared_dev_version_snapshots.discard(snapshot.snapshot_id)
-
-                if not shared_dev_version_snapshots:
-                    dev_table_only = bool(shared_version_snapshots)
-                    cleanup_targets.append((snapshot.snapshot_id, dev_table_only))
-
-            snapshot_ids_to_cleanup = [snapshot_id for snapshot_id, _ in cleanup_targets]
-            for snapshot_id_batch in create_batches(
-                snapshot_ids_to_cleanup, batch_size=self.SNAPSHOT_BATCH_SIZE
-            ):
-                snapshot_id_batch_set = set(snapshot_id_batch)
-                full_snapshots = self._get_snapshots(snapshot_id_batch_set)
-                cleanup_tasks = [
-                    SnapshotTableCleanupTask(
-                        snapshot=full_snapshots[snapshot_id].table_info,
-                        dev_table_only=dev_table_only,
-                    )
-                    for snapshot_id, dev_table_only in cleanup_targets
-                    if snapshot_id in full_snapshots
-                ]
-                all_expired_snapshot_ids -= snapshot_id_batch_set
-                yield snapshot_id_batch_set, cleanup_tasks
+        expired_rows = fetchall(self.engine_adapter, query)
+
+        all_expired_snapshot_ids: t.Set[SnapshotId] = set()
+        # Only the last expired snapshot of each dev version drops the dev table
+        last_by_dev_version: t.Dict[t.Tuple[str, str], str] = {}
+        for name, identifier, _, dev_version, _, dev_version_in_use in expired_rows:
+            all_expired_snapshot_ids.add(SnapshotId(name=name, identifier=identifier))
+            if not dev_version_in_use:
+                last_by_dev_version[(name, dev_version)] = identifier
+
+        cleanup_rows = [
+            row for row in expired_rows if last_by_dev_version.get((row[0], row[3])) == row[1]
+        ]
+        # Only the last cleanup target of each version drops the non-dev table
+        last_by_version = {(row[0], row[2]): row[1] for row in cleanup_rows}
+
+        cleanup_targets: t.List[t.Tuple[SnapshotId, bool]] = []
+        for name, identifier, version, _, version_in_use, _ in cleanup_rows:
+            dev_table_only = bool(version_in_use) or last_by_version[(name, version)] != identifier
+            cleanup_targets.append((SnapshotId(name=name, identifier=identifier), dev_table_only))
 
-            if all_expired_snapshot_ids:
-                # Remaining expired snapshots for which there are no tables
-                # to cleanup
-                yield all_expired_snapshot_ids, []
+        snapshot_ids_to_cleanup = [snapshot_id for snapshot_id, _ in cleanup_targets]
+        for snapshot_id_batch in create_batches(
+            snapshot_ids_to_cleanup, batch_size=self.SNAPSHOT_BATCH_SIZE
+        ):
+            snapshot_id_batch_set = set(snapshot_id_batch)
+            table_infos = self.get_snapshot_table_infos(snapshot_id_batch_set)
+            cleanup_tasks = [
+                SnapshotTableCleanupTask(
+                    snapshot=table_infos[snapshot_id],
+                    dev_table_only=dev_table_only,
+                )
+                for snapshot_id, dev_table_only in cleanup_targets
+                if snapshot_id in table_infos
+            ]
+            all_expired_snapshot_ids -= snapshot_id_batch_set
+            yield snapshot_id_batch_set, cleanup_tasks
+
+        if all_expired_snapshot_ids:
+            # Remaining expired snapshots for which there are no tables
+            # to cleanup
+            yield all_expired_snapshot_ids, []
 
     def delete_snapshots(self, snapshot_ids: t.Iterable[SnapshotIdLike]) -> None:
         """Deletes snapshots.
@@ -307,6 +401,49 @@ class SnapshotState:
         """
         return self._get_snapshots(snapshot_ids)
 
+    def get_snapshot_table_infos(
+        self,
+        snapshot_ids: t.Iterable[SnapshotIdLike],
+    ) -> t.Dict[SnapshotId, SnapshotTableInfo]:
+        """Fetches table infos of snapshots without loading their full payloads.
+
+        Args:
+            snapshot_ids: The snapshot IDs to fetch.
+
+        Returns:
+            A dictionary of snapshot IDs to table infos for snapshots that could be found.
+        """
+        table_infos: t.Dict[SnapshotId, SnapshotTableInfo] = {}
+        snapshot_ids_without_table_info: t.Set[SnapshotId] = set()
+
+        for rows in self.read_pool.fetchall(
+            self.engine_adapter,
+            (
+                exp.select("name", "identifier", "table_info", "forward_only")
+                .from_(self.snapshots_table)
+                .where(where)
+                for where in snapshot_id_filter(
+                    self.engine_adapter, snapshot_ids, batch_size=self.SNAPSHOT_BATCH_SIZE
+                )
+            ),
+        ):
+            for name, identifier, raw_table_info, forward_only in rows:
+                snapshot_id = SnapshotId(name=name, identifier=identifier)
+                if raw_table_info:
+                    table_infos[snapshot_id] = parse_table_info(raw_table_info, forward_only)
+                else:
+                    snapshot_ids_without_table_info.add(snapshot_id)
+
+        if snapshot_ids_without_table_info:
+            # Table infos of snapshots stored before the table_info column was added have to be derived from the
+            # full snapshots
+            for snapshot_id, snapshot in self._get_snapshots(
+                snapshot_ids_without_table_info
+            ).items():
+                table_infos[snapshot_id] = snapshot.table_info
+
+        return table_infos
+
     def get_snapshots_by_names(
         self,
         snapshot_names: t.Iterable[str],
@@ -445,6 +582,10 @@ class SnapshotState:
         """Clears the snapshot cache."""
         self._snapshot_cache.clear()
 
+    def close(self) -> None:
+        """Releases resources held by the snapshot cache."""
+        self._snapshot_cache.close()
+
     def _update_snapshots(
         self,
         snapshots: t.Iterable[SnapshotIdLike],
@@ -471,11 +612,10 @@ class SnapshotState:
                 snapshot = snapshot.copy(update={"node": seed_model.to_dehydrated()})
             snapshots_to_store.append(snapshot)
 
-        self.engine_adapter.insert_append(
+        self.engine_adapter.bulk_insert(
             self.snapshots_table,
             _snapshots_to_df(snapshots_to_store),
             target_columns_to_types=self._snapshot_columns_to_types,
-            track_rows_processed=False,
         )
 
     def _get_snapshots(
@@ -495,36 +635,26 @@ class SnapshotState:
         duplicates: t.Dict[SnapshotId, Snapshot] = {}
 
         def _loader(snapshot_ids_to_load: t.Set[SnapshotId]) -> t.Collection[Snapshot]:
+            rows = [
+                row
+                for batch in self.read_pool.fetchall(
+                    self.engine_adapter,
+                    self._get_snapshots_expressions(snapshot_ids_to_load, lock_for_update),
+                )
+                for row in batch
+            ]
+
             fetched_snapshots: t.Dict[SnapshotId, Snapshot] = {}
-            for query in self._get_snapshots_expressions(snapshot_ids_to_load, lock_for_update):
-                for (
-                    serialized_snapshot,
-                    _,
-                    _,
-                    _,
-                    updated_ts,
-                    unpaused_ts,
-                    unrestorable,
-                    forward_only,
-                    next_auto_restatement_ts,
-                ) in fetchall(self.engine_adapter, query):
-                    snapshot = parse_snapshot(
-                        serialized_snapshot=serialized_snapshot,
-                        updated_ts=updated_ts,
-                        unpaused_ts=unpaused_ts,
-                        unrestorable=unrestorable,
-                        forward_only=forward_only,
-                        next_auto_restatement_ts=next_auto_restatement_ts,
+            for snapshot in self._parse_snapshot_rows(rows):
+                snapshot_id = snapshot.snapshot_id
+                if snapshot_id in fetched_snapshots:
+                    other = duplicates.get(snapshot_id, fetched_snapshots[snapshot_id])
+                    duplicates[snapshot_id] = (
+                        snapshot if snapshot.updated_ts > other.updated_ts else other
                     )
-                    snapshot_id = snapshot.snapshot_id
-                    if snapshot_id in fetched_snapshots:
-                        other = duplicates.get(snapshot_id, fetched_snapshots[snapshot_id])
-                        duplicates[snapshot_id] = (
-                            snapshot if snapshot.updated_ts > other.updated_ts else other
-                        )
-                        fetched_snapshots[snapshot_id] = duplicates[snapshot_id]
-                    else:
-                        fetched_snapshots[snapshot_id] = snapshot
+                    fetched_snapshots[snapshot_id] = duplicates[snapshot_id]
+                else:
+                    fetched_snapshots[snapshot_id] = snapshot
             return fetched_snapshots.values()
 
         snapshots, cached_snapshots = self._snapshot_cache.get_or_load(
@@ -533,37 +663,10 @@ class SnapshotState:
 
         if cached_snapshots:
             cached_snapshots_in_state: t.Set[SnapshotId] = set()
-            for where in snapshot_id_filter(
-                self.engine_adapter, cached_snapshots, batch_size=self.SNAPSHOT_BATCH_SIZE
+            for rows in self.read_pool.fetchall(
+                self.engine_adapter,
+                self._get_snapshot_mutable_fields_expressions(cached_snapshots, lock_for_update),
             ):
-                query = (
-                    exp.select(
-                        "name",
-                        "identifier",
-                        "updated_ts",
-                        "unpaused_ts",
-                        "unrestorable",
-                        "forward_only",
-                        "next_auto_restatement_ts",
-                    )
-                    .from_(exp.to_table(self.snapshots_table).as_("snapshots"))
-                    .join(
-                        exp.to_table(self.auto_restatements_table).as_("auto_restatements"),
-                        on=exp.and_(
-                            exp.column("name", table="snapshots").eq(
-                                exp.column("snapshot_name", table="auto_restatements")
-                            ),
-                            exp.column("version", table="snapshots").eq(
-                                exp.column("snapshot_version", table="auto_restatements")
-                            ),
-                        ),
-                        join_type="left",
-                        copy=False,
-                    )
-                    .where(where)
-                )
-                if lock_for_update:
-                    query = query.lock(copy=False)
                 for (
                     name,
                     identifier,
@@ -572,7 +675,7 @@ class SnapshotState:
                     unrestorable,
                     forward_only,
                     next_auto_restatement_ts,
-                ) in fetchall(self.engine_adapter, query):
+                ) in rows:
                     snapshot_id = SnapshotId(name=name, identifier=identifier)
                     snapshot = snapshots[snapshot_id]
                     snapshot.updated_ts = updated_ts
@@ -592,6 +695,27 @@ class SnapshotState:
 
         return snapshots
 
+    def _parse_snapshot_rows(self, rows: t.List[t.Tuple]) -> t.Iterable[Snapshot]:
+        """Parses rows returned by queries from _get_snapshots_expressions into snapshots.
+
+        Parsing a snapshot validates its entire node, so large batches are spread across forked
+        workers. Workers also extract dependencies of models, which requires rendering their queries
+        and would otherwise happen in the current process when the snapshots are stored in the cache.
+        """
+        workers = c.MAX_FORK_WORKERS
+        if workers == 1 or len(rows) < self.PARALLEL_PARSE_THRESHOLD:
+            return [_parse_snapshot_row(row) for row in rows]
+
+        logger.debug("Parsing %s snapshots in parallel", len(rows))
+        with create_process_pool_executor(max_workers=workers) as pool:
+            return list(
+                pool.map(
+                    _load_snapshot_row,
+                    rows,
+                    chunksize=max(1, len(rows) // ((workers or 1) * 4)),
+                )
+            )
+
     def _get_snapshots_expressions(
         self,
         snapshot_ids: t.Iterable[SnapshotIdLike],
@@ -635,6 +759,44 @@ class SnapshotState:
                 query = query.lock(copy=False)
             yield query
 
+    def _get_snapshot_mutable_fields_expressions(
+        self,
+        snapshot_ids: t.Iterable[SnapshotIdLike],
+        lock_for_update: bool = False,
+    ) -> t.Iterator[exp.Expression]:
+        for where in snapshot_id_filter(
+            self.engine_adapter, snapshot_ids, batch_size=self.SNAPSHOT_BATCH_SIZE
+        ):
+            query = (
+                exp.select(
+                    "name",
+                    "identifier",
+                    "updated_ts",
+                    "unpaused_ts",
+                    "unrestorable",
+                    "forward_only",
+                    "next_auto_restatement_ts",
+                )
+                .from_(exp.to_table(self.snapshots_table).as_("snapshots"))
+                .join(
+                    exp.to_table(self.auto_restatements_table).as_("auto_restatements"),
+                    on=exp.and_(
+                        exp.column("name", table="snapshots").eq(
+                            exp.column("snapshot_name", table="auto_restatements")
+                        ),
+                        exp.column("version", table="snapshots").eq(
+                            exp.column("snapshot_version", table="auto_restatements")
+                        ),
+                    ),
+                    join_type="left",
+                    copy=False,
+                )
+                .where(where)
+            )
+            if lock_for_update:
+                query = query.lock(copy=False)
+            yield query
+
     def _get_snapshots_with_same_version(
         self,
         snapshots: t.Collection[SnapshotNameVersionLike],
@@ -699,7 +861,7 @@ def parse_snapshot(
 ) -> Snapshot:
     return Snapshot(
         **{
-            **json.loads(serialized_snapshot),
+            **_json_loads(serialized_snapshot),
             "updated_ts": updated_ts,
             "unpaused_ts": unpaused_ts,
             "unrestorable": unrestorable,
@@ -709,6 +871,55 @@ def parse_snapshot(
     )
 
 
+def parse_table_info(serialized_table_info: str, forward_only: bool) -> SnapshotTableInfo:
+    return SnapshotTableInfo(**{**_json_loads(serialized_table_info), "forward_only": forward_only})
+
+
+def _parse_snapshot_row(row: t.Tuple) -> Snapshot:
+    (
+        serialized_snapshot,
+        _,
+        _,
+        _,
+        updated_ts,
+        unpaused_ts,
+        unrestorable,
+        forward_only,
+        next_auto_restatement_ts,
+    ) = row
+    return parse_snapshot(
+        serialized_snapshot=serialized_snapshot,
+        updated_ts=updated_ts,
+        unpaused_ts=unpaused_ts,
+        unrestorable=unrestorable,
+        forward_only=forward_only,
+        next_auto_restatement_ts=next_auto_restatement_ts,
+    )
+
+
+def _load_snapshot_row(row: t.Tuple) -> Snapshot:
+    snapshot = _parse_snapshot_row(row)
+    if snapshot.is_model:
+        try:
+            # The result is pickled along with the model when it's sent back to the parent process
+            snapshot.model.full_depends_on
+        except Exception:
+            # Failures are reported once the snapshot is stored in the cache
+            pass
+    return snapshot
+
+
+def _json_loads(value: t.Union[str, bytes]) -> t.Any:
+    # orjson is considerably faster at decoding large snapshot payloads, but it doesn't support some
+    # inputs that the standard library does, eg. integers that exceed 64 bits
+    if orjson is not None:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(value)
+
+
 def _snapshot_to_json(snapshot: Snapshot) -> str:
     return snapshot.json(
         exclude={
@@ -742,12 +953,21 @@ def _snapshots_to_df(snapshots: t.Iterable[Snapshot]) -> pd.DataFrame:
                 "forward_only": snapshot.forward_only,
                 "dev_version": snapshot.dev_version,
                 "fingerprint": snapshot.fingerprint.json(),
+                "table_info": _table_info_to_json(snapshot),
             }
             for snapshot in snapshots
         ]
     )
 
 
+def _table_info_to_json(snapshot: Snapshot) -> t.Optional[str]:
+    if not snapshot.change_category or not snapshot.version:
+        # Table info is only available for categorized snapshots
+        return None
+    # The forward-only flag can change after the snapshot has been stored, so it's read from its own column
+    return snapshot.table_info.json(exclude={"forward_only"})
+
+
 def _auto_restatements_to_df(auto_restatements: t.Dict[SnapshotNameVersion, int]) -> pd.DataFrame:
     import pandas as pd
 
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import typing as t
 import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from sqlglot import exp
 from sqlmesh.core.engine_adapter import EngineAdapter
@@ -126,8 +128,91 @@ def create_batches(l: t.List[T], batch_size: int) -> t.List[t.List[T]]:
 def fetchone(
     engine_adapter: EngineAdapter, query: t.Union[exp.Expression, str]
 ) -> t.Optional[t.Tuple]:
-    return engine_adapter.fetchone(query, ignore_unsupported_errors=True, quote_identifiers=True)
+    start = time.perf_counter()
+    row = engine_adapter.fetchone(query, ignore_unsupported_errors=True, quote_identifiers=True)
+    _log_query_latency(start, 1 if row is not None else 0)
+    return row
 
 
 def fetchall(engine_adapter: EngineAdapter, query: t.Union[exp.Expression, str]) -> t.List[t.Tuple]:
-    return engine_adapter.fetchall(query, ignore_unsupported_errors=True, quote_identifiers=True)
+    start = time.perf_counter()
+    rows = engine_adapter.fetchall(query, ignore_unsupported_errors=True, quote_identifiers=True)
+    _log_query_latency(start, len(rows))
+    return rows
+
+
+class StateReadPool:
+    """Runs independent state reads concurrently.
+
+    Each worker thread gets its own connection from the adapter's thread-local connection pool. Workers are
+    kept alive between calls so that their connections are reused instead of being opened for every read.
+    Reads fall back to running serially in the calling thread if the adapter isn't multithreaded or if a
+    transaction is active, since rows written by the transaction are only visible to its own connection.
+
+    Args:
+        max_workers: The maximum number of reads that run at the same time.
+    """
+
+    def __init__(self, max_workers: int = 1):
+        self.max_workers = max_workers
+        self._executor: t.Optional[ThreadPoolExecutor] = None
+
+    def is_concurrent(self, engine_adapter: EngineAdapter) -> bool:
+        return (
+            self.max_workers > 1
+            and engine_adapter._multithreaded
+            and not engine_adapter._connection_pool.is_transaction_active
+        )
+
+    def fetchall(
+        self, engine_adapter: EngineAdapter, queries: t.Iterable[exp.Expression]
+    ) -> t.Iterator[t.List[t.Tuple]]:
+        """Runs the given queries and yields their results in the same order."""
+        if not self.is_concurrent(engine_adapter):
+            for query in queries:
+                yield fetchall(engine_adapter, query)
+            return
+
+        queries = list(queries)
+        if len(queries) < 2:
+            for query in queries:
+                yield fetchall(engine_adapter, query)
+            return
+
+        logger.debug("Running %s state queries concurrently", len(queries))
+        yield from self._get_executor().map(lambda q: fetchall(engine_adapter, q), queries)
+
+    def submit(
+        self, engine_adapter: EngineAdapter, func: t.Callable[..., T], *args: t.Any
+    ) -> Future[T]:
+        """Schedules a read in a worker thread, or runs it right away if reads are serial."""
+        if self.is_concurrent(engine_adapter):
+            return self._get_executor().submit(func, *args)
+
+        future: Future[T] = Future()
+        try:
+            future.set_result(func(*args))
+        except Exception as ex:
+            future.set_exception(ex)
+        return future
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="sqlmesh_state_read"
+            )
+        return self._executor
+
+
+def _log_query_latency(start: float, num_rows: int) -> None:
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "State query returned %s rows in %.1f ms",
+            num_rows,
+            (time.perf_counter() - start) * 1000,
+        )
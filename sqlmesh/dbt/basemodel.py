@@ -364,8 +364,10 @@ class BaseModelConfig(GeneralConfig):
     def _model_jinja_context(
         self, context: DbtContext, dependencies: Dependencies
     ) -> t.Dict[str, t.Any]:
-        if context._manifest and self.unique_id in context._manifest._manifest.nodes:
-            attributes = context._manifest._manifest.nodes[self.unique_id].to_dict()
+        attributes = (
+            context._manifest.node_attributes(self.unique_id) if context._manifest else None
+        )
+        if attributes is not None:
             if dependencies.model_attrs.all_attrs:
                 model_node: AttributeDict[str, t.Any] = AttributeDict(attributes)
             else:
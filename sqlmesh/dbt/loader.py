@@ -6,18 +6,20 @@ import typing as t
 import sqlmesh.core.dialect as d
 from pathlib import Path
 from collections import defaultdict
+from sqlmesh.core import constants as c
 from sqlmesh.core.config import (
     Config,
     ConnectionConfig,
     GatewayConfig,
     ModelDefaultsConfig,
 )
+from sqlmesh.core.config.common import VirtualEnvironmentMode
 from sqlmesh.core.environment import EnvironmentStatements
 from sqlmesh.core.loader import CacheBase, LoadedProject, Loader
 from sqlmesh.core.macros import MacroRegistry, macro
 from sqlmesh.core.model import Model, ModelCache
 from sqlmesh.core.signal import signal
-from sqlmesh.dbt.basemodel import BMC, BaseModelConfig
+from sqlmesh.dbt.basemodel import BaseModelConfig
 from sqlmesh.dbt.common import Dependencies
 from sqlmesh.dbt.context import DbtContext
 from sqlmesh.dbt.model import ModelConfig
@@ -30,6 +32,7 @@ from sqlmesh.utils.jinja import (
     JinjaMacroRegistry,
     make_jinja_registry,
 )
+from sqlmesh.utils.process import create_process_pool_executor
 
 if sys.version_info >= (3, 12):
     from importlib import metadata
@@ -38,10 +41,62 @@ else:
 
 if t.TYPE_CHECKING:
     from sqlmesh.core.audit import Audit, ModelAudit
+    from sqlmesh.core.console import Console
     from sqlmesh.core.context import GenericContext
 
+    PackageModels = t.Dict[str, t.Tuple[DbtContext, t.Dict[Path, t.List[BaseModelConfig]]]]
+
 logger = logging.getLogger(__name__)
 
+_package_models: t.Optional[PackageModels] = None
+_audits: t.Optional[t.Dict[str, ModelAudit]] = None
+_virtual_environment_mode: VirtualEnvironmentMode = VirtualEnvironmentMode.default
+_cache: t.Optional[CacheBase] = None
+
+
+def _init_model_conversion(
+    package_models: PackageModels,
+    audits: t.Dict[str, ModelAudit],
+    virtual_environment_mode: VirtualEnvironmentMode,
+    cache: CacheBase,
+    console: t.Optional[Console] = None,
+) -> None:
+    global _package_models, _audits, _virtual_environment_mode, _cache
+    _package_models = package_models
+    _audits = audits
+    _virtual_environment_mode = virtual_environment_mode
+    _cache = cache
+
+    # Set the console passed from the parent process
+    if console is not None:
+        from sqlmesh.core.console import set_console
+
+        set_console(console)
+
+
+def load_dbt_models(package_name: str, path: Path) -> t.List[Model]:
+    """Converts dbt models defined in the given file of a package into SQLMesh models.
+
+    The package contexts are set by `_init_model_conversion`, so that forked processes inherit them
+    instead of receiving them pickled for every file.
+    """
+    assert _package_models is not None
+    assert _cache is not None
+
+    context, models_by_path = _package_models[package_name]
+    models = []
+    for model in models_by_path[path]:
+        logger.debug("Converting '%s' to sqlmesh format", model.canonical_name(context))
+        models.append(
+            model.to_sqlmesh(
+                context,
+                audit_definitions=_audits,
+                virtual_environment_mode=_virtual_environment_mode,
+            )
+        )
+
+    return [] if _cache.put(models, path) else models
+
 
 def sqlmesh_config(
     project_root: t.Optional[Path] = None,
@@ -90,9 +145,9 @@ class DbtLoader(Loader):
         self._macros_max_mtime: t.Optional[float] = None
         super().__init__(context, path)
 
-    def load(self) -> LoadedProject:
+    def load(self, reuse_loaded_models: bool = False) -> LoadedProject:
         self._projects = []
-        return super().load()
+        return super().load(reuse_loaded_models=reuse_loaded_models)
 
     def _load_scripts(self) -> t.Tuple[MacroRegistry, JinjaMacroRegistry]:
         macro_files = list(Path(self.config_path, "macros").glob("**/*.sql"))
@@ -116,14 +171,6 @@ class DbtLoader(Loader):
     ) -> UniqueKeyDict[str, Model]:
         models: UniqueKeyDict[str, Model] = UniqueKeyDict("models")
 
-        def _to_sqlmesh(config: BMC, context: DbtContext) -> Model:
-            logger.debug("Converting '%s' to sqlmesh format", config.canonical_name(context))
-            return config.to_sqlmesh(
-                context,
-                audit_definitions=audits,
-                virtual_environment_mode=self.config.virtual_environment_mode,
-            )
-
         for project in self._load_projects():
             macros_max_mtime = self._macros_max_mtime
             yaml_max_mtimes = self._compute_yaml_max_mtime_per_subfolder(
@@ -133,27 +180,52 @@ class DbtLoader(Loader):
 
             logger.debug("Converting models to sqlmesh")
             # Now that config is rendered, create the sqlmesh models
+            package_models: PackageModels = {}
+            paths: t.List[t.Tuple[str, Path]] = []
             for package in project.packages.values():
                 package_context = project.context.copy()
                 package_context.set_and_render_variables(package.variables, package.name)
-                package_models: t.Dict[str, BaseModelConfig] = {**package.models, **package.seeds}
 
                 package_models_by_path: t.Dict[Path, t.List[BaseModelConfig]] = defaultdict(list)
-                for model in package_models.values():
+                for model in {**package.models, **package.seeds}.values():
                     if isinstance(model, ModelConfig) and not model.sql.strip():
                         logger.info(f"Skipping empty model '{model.name}' at path '{model.path}'.")
                         continue
                     package_models_by_path[model.path].append(model)
 
-                for path, path_models in package_models_by_path.items():
-                    sqlmesh_models = cache.get_or_load_models(
-                        path,
-                        loader=lambda: [
-                            _to_sqlmesh(model, package_context) for model in path_models
-                        ],
-                    )
-                    for sqlmesh_model in sqlmesh_models:
-                        models[sqlmesh_model.fqn] = sqlmesh_model
+                package_models[package.name] = (package_context, package_models_by_path)
+                paths.extend((package.name, path) for path in package_models_by_path)
+
+            loaded_models: t.Dict[t.Tuple[str, Path], t.List[Model]] = {}
+            for package_name, path in paths:
+                if cached_models := cache.get(path):
+                    loaded_models[(package_name, path)] = cached_models
+
+            if len(loaded_models) < len(paths):
+                with create_process_pool_executor(
+                    initializer=_init_model_conversion,
+                    initargs=(
+                        package_models,
+                        audits,
+                        self.config.virtual_environment_mode,
+                        cache,
+                        self._console,
+                    ),
+                    max_workers=c.MAX_FORK_WORKERS,
+                ) as pool:
+                    futures = {
+                        key: pool.submit(load_dbt_models, *key)
+                        for key in paths
+                        if key not in loaded_models
+                    }
+                    for key, future in futures.items():
+                        loaded_models[key] = future.result() or cache.get(key[1])
+
+            # Models are added in the same order regardless of where they have been loaded
+            for package_name, path in paths:
+                for sqlmesh_model in loaded_models[(package_name, path)]:
+                    sqlmesh_model._path = path
+                    models[sqlmesh_model.fqn] = sqlmesh_model
 
             models.update(self._load_external_models(audits, cache))
 
@@ -355,7 +427,9 @@ class DbtLoader(Loader):
 
             target = t.cast(TargetConfig, project.context.target)
             cache_dir = loader.context.cache_dir / target.name
-            self._model_cache = ModelCache(cache_dir)
+            self._model_cache = ModelCache(
+                cache_dir, store=loader.config.cache_store, codec=loader.config.cache_codec
+            )
 
         def get_or_load_models(
             self, target_path: Path, loader: t.Callable[[], t.List[Model]]
@@ -8,6 +8,7 @@ import re
 import typing as t
 from argparse import Namespace
 from collections import defaultdict
+from dataclasses import dataclass
 from functools import cached_property
 from pathlib import Path
 
@@ -53,8 +54,9 @@ from sqlmesh.dbt.source import SourceConfig
 from sqlmesh.dbt.target import TargetConfig
 from sqlmesh.dbt.test import TestConfig
 from sqlmesh.dbt.util import DBT_VERSION
-from sqlmesh.utils.cache import FileCache
+from sqlmesh.utils.cache import CacheCodec, CacheStore, FileCache
 from sqlmesh.utils.errors import ConfigError
+from sqlmesh.utils.hashing import md5
 from sqlmesh.utils.jinja import (
     MacroInfo,
     MacroReference,
@@ -81,6 +83,9 @@ MaterializationConfigs = t.Dict[str, MaterializationConfig]
 IGNORED_PACKAGES = {"elementary"}
 BUILTIN_CALLS = {*BUILTIN_GLOBALS, *BUILTIN_FILTERS}
 
+# Directories which dbt writes to while parsing and which therefore can't affect the manifest
+IGNORED_PROJECT_DIRS = {"target", "logs", "__pycache__"}
+
 # Patch Semantic Manifest to skip validation and avoid Pydantic v1 errors on DBT 1.6
 # We patch for 1.7+ since we don't care about semantic models
 if DBT_VERSION >= (1, 6, 0):
@@ -89,6 +94,30 @@ if DBT_VERSION >= (1, 6, 0):
     SemanticManifest.validate = lambda _: True  # type: ignore
 
 
+@dataclass
+class ManifestDigest:
+    """Everything SQLMesh extracts from a dbt manifest, cached to skip manifest parsing altogether.
+
+    Args:
+        fingerprint: The fingerprint of the project files and settings the digest was created from.
+        env_vars: The values of the environment variables referenced while parsing the project.
+    """
+
+    fingerprint: str
+    env_vars: t.Dict[str, t.Optional[str]]
+    project_name: str
+    tests_per_package: t.Dict[str, TestConfigs]
+    models_per_package: t.Dict[str, ModelConfigs]
+    seeds_per_package: t.Dict[str, SeedConfigs]
+    sources_per_package: t.Dict[str, SourceConfigs]
+    macros_per_package: t.Dict[str, MacroConfigs]
+    on_run_start_per_package: t.Dict[str, HookConfigs]
+    on_run_end_per_package: t.Dict[str, HookConfigs]
+    materializations: MaterializationConfigs
+    node_attributes: t.Dict[str, t.Dict[str, t.Any]]
+    flat_graph: t.Dict[str, t.Any]
+
+
 class ManifestHelper:
     def __init__(
         self,
@@ -99,6 +128,8 @@ class ManifestHelper:
         variable_overrides: t.Optional[t.Dict[str, t.Any]] = None,
         cache_dir: t.Optional[str] = None,
         model_defaults: t.Optional[ModelDefaultsConfig] = None,
+        cache_store: t.Optional[CacheStore] = None,
+        cache_codec: t.Optional[CacheCodec] = None,
     ):
         self.project_path = project_path
         self.profiles_path = profiles_path
@@ -122,6 +153,8 @@ class ManifestHelper:
         self._tests_by_owner: t.Dict[str, t.List[TestConfig]] = defaultdict(list)
         self._disabled_refs: t.Optional[t.Set[str]] = None
         self._disabled_sources: t.Optional[t.Set[str]] = None
+        self._node_attributes: t.Dict[str, t.Dict[str, t.Any]] = {}
+        self._env_vars: t.Set[str] = set()
 
         if cache_dir is not None:
             cache_path = Path(cache_dir)
@@ -129,10 +162,16 @@ class ManifestHelper:
                 cache_path = self.project_path / cache_path
         else:
             cache_path = self.project_path / c.CACHE
+        self._cache_path = cache_path
 
         self._call_cache: FileCache[t.Dict[str, t.List[CallNames]]] = FileCache(
-            cache_path, "jinja_calls"
+            cache_path, "jinja_calls", store=cache_store, codec=cache_codec
+        )
+        self._digest_cache: FileCache[ManifestDigest] = FileCache(
+            cache_path, "dbt_manifest", store=cache_store, codec=cache_codec
         )
+        # Projects may share a cache folder, so each one gets its own digest entry
+        self._digest_name = md5(str(self.project_path.absolute()))
 
         self._on_run_start_per_package: t.Dict[str, HookConfigs] = defaultdict(dict)
         self._on_run_end_per_package: t.Dict[str, HookConfigs] = defaultdict(dict)
@@ -170,6 +209,11 @@ class ManifestHelper:
         self._load_all()
         return self._materializations
 
+    def node_attributes(self, unique_id: str) -> t.Optional[t.Dict[str, t.Any]]:
+        """Returns the attributes of the model, seed or snapshot node with the given ID."""
+        self._load_all()
+        return self._node_attributes.get(unique_id)
+
     @property
     def all_macros(self) -> t.Dict[str, t.Dict[str, MacroInfo]]:
         self._load_all()
@@ -216,6 +260,11 @@ class ManifestHelper:
         if self._is_loaded:
             return
 
+        fingerprint = self._fingerprint()
+        if self._load_digest(fingerprint):
+            self._is_loaded = True
+            return
+
         self._calls = {k: (v, False) for k, v in (self._call_cache.get("") or {}).items()}
 
         self._load_macros()
@@ -227,6 +276,95 @@ class ManifestHelper:
         self._is_loaded = True
 
         self._call_cache.put("", value={k: v for k, (v, used) in self._calls.items() if used})
+        self._store_digest(fingerprint)
+
+    def _fingerprint(self) -> str:
+        """Returns a fingerprint of the project files and the settings used to parse them.
+
+        Files are identified by their modification times and sizes, so that the fingerprint can be
+        computed without reading the content of every file in the project.
+        """
+        data = [
+            ".".join(str(v) for v in DBT_VERSION),
+            self.profile_name,
+            self.target.json(),
+            json.dumps(self.variable_overrides, sort_keys=True, default=str),
+            str(self.model_defaults.start),
+        ]
+
+        profiles_file = self.profiles_path / "profiles.yml"
+        if profiles_file.exists():
+            stat = profiles_file.stat()
+            data.append(f"{profiles_file}:{stat.st_mtime_ns}:{stat.st_size}")
+
+        cache_path = self._cache_path.absolute()
+        # Packages are often symlinked, so real paths are tracked to guard against symlink cycles
+        visited: t.Set[str] = set()
+        for root, dirs, files in os.walk(self.project_path, followlinks=True):
+            root_path = Path(root)
+            visited.add(os.path.realpath(root))
+            dirs[:] = sorted(
+                d
+                for d in dirs
+                if not d.startswith(".")
+                and d not in IGNORED_PROJECT_DIRS
+                and (root_path / d).absolute() != cache_path
+                and os.path.realpath(root_path / d) not in visited
+            )
+            for file in sorted(files):
+                try:
+                    stat = (root_path / file).stat()
+                except OSError:
+                    continue
+                data.append(f"{root_path / file}:{stat.st_mtime_ns}:{stat.st_size}")
+
+        return md5(data)
+
+    def _load_digest(self, fingerprint: str) -> bool:
+        digest = self._digest_cache.get(self._digest_name)
+        if (
+            digest is None
+            or digest.fingerprint != fingerprint
+            or any(os.environ.get(name) != value for name, value in digest.env_vars.items())
+        ):
+            return False
+
+        self._project_name = digest.project_name
+        self._tests_per_package.update(digest.tests_per_package)
+        self._models_per_package.update(digest.models_per_package)
+        self._seeds_per_package.update(digest.seeds_per_package)
+        self._sources_per_package.update(digest.sources_per_package)
+        self._macros_per_package.update(digest.macros_per_package)
+        self._on_run_start_per_package.update(digest.on_run_start_per_package)
+        self._on_run_end_per_package.update(digest.on_run_end_per_package)
+        self._materializations = digest.materializations
+        self._node_attributes = digest.node_attributes
+        self.__dict__["flat_graph"] = digest.flat_graph
+        return True
+
+    def _store_digest(self, fingerprint: str) -> None:
+        env_vars = self._env_vars | set(getattr(self._manifest, "env_vars", None) or {})
+        for file in self._manifest.files.values():
+            env_vars |= _env_var_names(getattr(file, "env_vars", None))
+
+        self._digest_cache.put(
+            self._digest_name,
+            value=ManifestDigest(
+                fingerprint=fingerprint,
+                env_vars={name: os.environ.get(name) for name in sorted(env_vars)},
+                project_name=self._project_name,
+                tests_per_package=dict(self._tests_per_package),
+                models_per_package=dict(self._models_per_package),
+                seeds_per_package=dict(self._seeds_per_package),
+                sources_per_package=dict(self._sources_per_package),
+                macros_per_package=dict(self._macros_per_package),
+                on_run_start_per_package=dict(self._on_run_start_per_package),
+                on_run_end_per_package=dict(self._on_run_end_per_package),
+                materializations=self._materializations,
+                node_attributes=self._node_attributes,
+                flat_graph=self.flat_graph,
+            ),
+        )
 
     def _load_sources(self) -> None:
         for source in self._manifest.sources.values():
@@ -373,6 +511,7 @@ class ManifestHelper:
             ):
                 continue
 
+            self._node_attributes[node.unique_id] = node.to_dict()
             macro_references = _macro_references(self._manifest, node)
             all_tests = (
                 self._tests_by_owner[node.name]
@@ -504,6 +643,10 @@ class ManifestHelper:
         runtime_config = RuntimeConfig.from_parts(project, profile, args)
 
         self._project_name = project.project_name
+        self._env_vars = {
+            *(getattr(project, "project_env_vars", None) or {}),
+            *(getattr(profile, "profile_env_vars", None) or {}),
+        }
 
         if DBT_VERSION >= (1, 8, 0):
             from dbt.mp_context import get_mp_context  # type: ignore
@@ -683,6 +826,17 @@ class ManifestHelper:
         return dependencies
 
 
+def _env_var_names(env_vars: t.Any) -> t.Set[str]:
+    """Collects environment variable names from the nested structures dbt tracks them in."""
+    if isinstance(env_vars, str):
+        return {env_vars}
+    if isinstance(env_vars, dict):
+        env_vars = list(env_vars.values())
+    if isinstance(env_vars, (list, tuple, set)):
+        return set().union(*(_env_var_names(v) for v in env_vars))
+    return set()
+
+
 def _macro_reference_if_not_overridden(
     package: t.Optional[str], name: str, if_not_overridden: t.Callable[[MacroReference], None]
 ) -> None:
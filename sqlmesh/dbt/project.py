@@ -74,6 +74,8 @@ class Project:
             target=profile.target,
             variable_overrides=variable_overrides,
             cache_dir=context.sqlmesh_config.cache_dir,
+            cache_store=context.sqlmesh_config.cache_store,
+            cache_codec=context.sqlmesh_config.cache_codec,
             model_defaults=context.sqlmesh_config.model_defaults,
         )
 
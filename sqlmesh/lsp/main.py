@@ -477,7 +477,7 @@ class SQLMeshLanguageServer:
             # Reload the context if it was successfully loaded
             try:
                 context = self.context_state.lsp_context.context
-                context.load()
+                context.load(incremental=True)
                 # Create new LSPContext which will have fresh, empty caches
                 self.context_state = ContextLoaded(lsp_context=LSPContext(context))
             except Exception as e:
@@ -1153,7 +1153,7 @@ class SQLMeshLanguageServer:
                     context = self.context_class(paths=paths)
             else:
                 context = self.context_state.lsp_context.context
-                context.load()
+                context.load(incremental=True)
             self.context_state = ContextLoaded(lsp_context=LSPContext(context))
             return self.context_state.lsp_context
         except Exception as e:
@@ -982,12 +982,17 @@ class SQLMeshMagics(Magics):
         action="store_true",
         help="Cleanup snapshots that are not referenced in any environment, regardless of when they're set to expire",
     )
+    @argument(
+        "--time-budget",
+        type=int,
+        help="The number of seconds after which the janitor stops cleaning up expired snapshots. The remaining snapshots are cleaned up during the next run.",
+    )
     @line_magic
     @pass_sqlmesh_context
     def janitor(self, context: Context, line: str) -> None:
         """Run the janitor process to clean up old environments and expired snapshots."""
         args = parse_argstring(self.janitor, line)
-        context.run_janitor(ignore_ttl=args.ignore_ttl)
+        context.run_janitor(ignore_ttl=args.ignore_ttl, time_budget=args.time_budget)
 
     @magic_arguments()
     @argument("model", type=str)
@@ -0,0 +1,85 @@
+"""Add the environment snapshots table which maps environments to snapshots they contain."""
+
+import json
+
+from sqlglot import exp
+
+from sqlmesh.utils.hashing import hash_data
+from sqlmesh.utils.migration import index_text_type
+
+
+def migrate_schemas(state_sync, **kwargs):  # type: ignore
+    engine_adapter = state_sync.engine_adapter
+    schema = state_sync.schema
+    environment_snapshots_table = "_environment_snapshots"
+
+    if schema:
+        environment_snapshots_table = f"{schema}.{environment_snapshots_table}"
+
+    index_type = index_text_type(engine_adapter.dialect)
+
+    engine_adapter.create_state_table(
+        environment_snapshots_table,
+        {
+            "environment_name": exp.DataType.build(index_type),
+            "name": exp.DataType.build(index_type),
+            "identifier": exp.DataType.build(index_type),
+            "version": exp.DataType.build(index_type),
+        },
+        primary_key=("environment_name", "name", "identifier"),
+    )
+    engine_adapter.create_index(
+        environment_snapshots_table,
+        "_environment_snapshots_name_identifier_idx",
+        ("name", "identifier"),
+    )
+
+
+def migrate_rows(state_sync, **kwargs):  # type: ignore
+    import pandas as pd
+
+    engine_adapter = state_sync.engine_adapter
+    schema = state_sync.schema
+    environments_table = "_environments"
+    environment_snapshots_table = "_environment_snapshots"
+
+    if schema:
+        environments_table = f"{schema}.{environments_table}"
+        environment_snapshots_table = f"{schema}.{environment_snapshots_table}"
+
+    index_type = index_text_type(engine_adapter.dialect)
+
+    environment_snapshots = []
+    for environment_name, snapshots in engine_adapter.fetchall(
+        exp.select("name", "snapshots").from_(environments_table),
+        quote_identifiers=True,
+    ):
+        for snapshot in json.loads(snapshots):
+            fingerprint = snapshot["fingerprint"]
+            environment_snapshots.append(
+                {
+                    "environment_name": environment_name,
+                    "name": snapshot["name"],
+                    "identifier": hash_data(
+                        [
+                            fingerprint["data_hash"],
+                            fingerprint["metadata_hash"],
+                            fingerprint["parent_data_hash"],
+                            fingerprint["parent_metadata_hash"],
+                        ]
+                    ),
+                    "version": snapshot["version"],
+                }
+            )
+
+    if environment_snapshots:
+        engine_adapter.insert_append(
+            environment_snapshots_table,
+            pd.DataFrame(environment_snapshots),
+            target_columns_to_types={
+                "environment_name": exp.DataType.build(index_type),
+                "name": exp.DataType.build(index_type),
+                "identifier": exp.DataType.build(index_type),
+                "version": exp.DataType.build(index_type),
+            },
+        )
@@ -0,0 +1,18 @@
+"""Add an index on the name and dev version of snapshots, which is used to find expired dev tables."""
+
+
+def migrate_schemas(state_sync, **kwargs):  # type: ignore
+    engine_adapter = state_sync.engine_adapter
+    schema = state_sync.schema
+    snapshots_table = "_snapshots"
+
+    if schema:
+        snapshots_table = f"{schema}.{snapshots_table}"
+
+    engine_adapter.create_index(
+        snapshots_table, "_snapshots_name_dev_version_idx", ("name", "dev_version")
+    )
+
+
+def migrate_rows(state_sync, **kwargs):  # type: ignore
+    pass
@@ -0,0 +1,33 @@
+"""Add the table_info column to the snapshots table.
+
+Rows of existing snapshots are left empty, in which case the table info is derived from the full snapshot
+payload when it's requested.
+"""
+
+from sqlglot import exp
+
+from sqlmesh.utils.migration import blob_text_type
+
+
+def migrate_schemas(state_sync, **kwargs):  # type: ignore
+    engine_adapter = state_sync.engine_adapter
+    schema = state_sync.schema
+    snapshots_table = "_snapshots"
+    if schema:
+        snapshots_table = f"{schema}.{snapshots_table}"
+
+    alter_table_exp = exp.Alter(
+        this=exp.to_table(snapshots_table),
+        kind="TABLE",
+        actions=[
+            exp.ColumnDef(
+                this=exp.to_column("table_info"),
+                kind=exp.DataType.build(blob_text_type(engine_adapter.dialect)),
+            )
+        ],
+    )
+    engine_adapter.execute(alter_table_exp)
+
+
+def migrate_rows(state_sync, **kwargs):  # type: ignore
+    pass
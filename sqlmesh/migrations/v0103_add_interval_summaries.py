@@ -0,0 +1,66 @@
+"""Add the interval summaries table which keeps the earliest start and the latest end of intervals per snapshot version."""
+
+from sqlglot import exp
+
+from sqlmesh.utils.migration import index_text_type
+
+
+def migrate_schemas(state_sync, **kwargs):  # type: ignore
+    engine_adapter = state_sync.engine_adapter
+    schema = state_sync.schema
+    interval_summaries_table = "_interval_summaries"
+
+    if schema:
+        interval_summaries_table = f"{schema}.{interval_summaries_table}"
+
+    index_type = index_text_type(engine_adapter.dialect)
+
+    engine_adapter.create_state_table(
+        interval_summaries_table,
+        {
+            "name": exp.DataType.build(index_type),
+            "version": exp.DataType.build(index_type),
+            "min_start_ts": exp.DataType.build("bigint"),
+            "max_end_ts": exp.DataType.build("bigint"),
+        },
+        primary_key=("name", "version"),
+    )
+
+
+def migrate_rows(state_sync, **kwargs):  # type: ignore
+    engine_adapter = state_sync.engine_adapter
+    schema = state_sync.schema
+    intervals_table = "_intervals"
+    interval_summaries_table = "_interval_summaries"
+
+    if schema:
+        intervals_table = f"{schema}.{intervals_table}"
+        interval_summaries_table = f"{schema}.{interval_summaries_table}"
+
+    index_type = index_text_type(engine_adapter.dialect)
+
+    engine_adapter.insert_append(
+        interval_summaries_table,
+        exp.select(
+            "name",
+            "version",
+            exp.func("MIN", exp.column("start_ts")).as_("min_start_ts"),
+            exp.func("MAX", exp.column("end_ts")).as_("max_end_ts"),
+        )
+        .from_(intervals_table)
+        .where(
+            exp.and_(
+                exp.column("is_dev").not_(),
+                exp.column("is_removed").not_(),
+                exp.column("is_pending_restatement").not_(),
+            )
+        )
+        .group_by("name", "version"),
+        target_columns_to_types={
+            "name": exp.DataType.build(index_type),
+            "version": exp.DataType.build(index_type),
+            "min_start_ts": exp.DataType.build("bigint"),
+            "max_end_ts": exp.DataType.build("bigint"),
+        },
+        track_rows_processed=False,
+    )
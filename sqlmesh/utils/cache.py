@@ -1,15 +1,24 @@
 from __future__ import annotations
 
 import gzip
+import io
 import logging
+import os
 import pickle
 import shutil
+import sqlite3
+import threading
+import time
 import typing as t
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from enum import Enum
 from pathlib import Path
 
-from sqlglot import __version__ as SQLGLOT_VERSION
+from sqlglot import __version__ as SQLGLOT_VERSION, exp
 
-from sqlmesh.utils import sanitize_name
+from sqlmesh.utils import classproperty, sanitize_name
 from sqlmesh.utils.date import to_datetime
 from sqlmesh.utils.errors import SQLMeshError
 from sqlmesh.utils.windows import IS_WINDOWS, fix_windows_path
@@ -17,12 +26,122 @@ from sqlmesh.utils.windows import IS_WINDOWS, fix_windows_path
 logger = logging.getLogger(__name__)
 
 T = t.TypeVar("T")
+R = t.TypeVar("R")
 
 
 SQLGLOT_VERSION_TUPLE = tuple(SQLGLOT_VERSION.split("."))
 SQLGLOT_MAJOR_VERSION = SQLGLOT_VERSION_TUPLE[0]
 SQLGLOT_MINOR_VERSION = SQLGLOT_VERSION_TUPLE[1]
 
+SQLITE_CACHE_FILE_NAME = "cache.db"
+"""The name of the database file used by the SQLite cache store."""
+SQLITE_CACHE_MAX_SIZE = 2 * 1024**3
+"""The maximum total size of entries in the SQLite cache store in bytes."""
+CACHE_IO_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+"""The number of threads used to read and decode, or encode and write, batches of cache entries."""
+CACHE_IO_BATCH_THRESHOLD = 32
+"""Batches smaller than this are processed sequentially since threads wouldn't pay off."""
+
+
+class CacheStore(str, Enum):
+    """The storage layout of the file cache.
+
+    FILE: Each entry is stored in its own gzip-compressed pickle file.
+    SQLITE: All entries are stored in a single indexed SQLite database file.
+    """
+
+    FILE = "file"
+    SQLITE = "sqlite"
+
+    @property
+    def is_file(self) -> bool:
+        return self == CacheStore.FILE
+
+    @property
+    def is_sqlite(self) -> bool:
+        return self == CacheStore.SQLITE
+
+    @classproperty
+    def default(cls) -> CacheStore:
+        return CacheStore.FILE
+
+    def __str__(self) -> str:
+        return self.name
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class CacheCodec(str, Enum):
+    """The encoding of cache entries.
+
+    GZIP: Entries are pickled and compressed with gzip.
+    NONE: Entries are pickled using a compact encoding of SQLGlot expressions and aren't compressed.
+    LZ4: Same as NONE, but entries are compressed with LZ4. Requires the `lz4` package.
+    ZSTD: Same as NONE, but entries are compressed with Zstandard. Requires the `zstandard` package.
+    """
+
+    GZIP = "gzip"
+    NONE = "none"
+    LZ4 = "lz4"
+    ZSTD = "zstd"
+
+    @property
+    def is_gzip(self) -> bool:
+        return self == CacheCodec.GZIP
+
+    @classproperty
+    def default(cls) -> CacheCodec:
+        return CacheCodec.GZIP
+
+    def ensure_available(self) -> None:
+        """Raises an error if the package required by this codec is not installed."""
+        try:
+            if self == CacheCodec.LZ4:
+                import lz4.frame  # noqa
+            elif self == CacheCodec.ZSTD:
+                import zstandard  # noqa
+        except ImportError:
+            package = "lz4" if self == CacheCodec.LZ4 else "zstandard"
+            raise SQLMeshError(
+                f"The '{self.value}' cache codec requires the '{package}' package. Install it with `pip install {package}`."
+            )
+
+    def dumps(self, value: t.Any) -> bytes:
+        if self.is_gzip:
+            return zlib.compress(pickle.dumps(value), 1)
+
+        data = _dumps_compact(value)
+        if self == CacheCodec.LZ4:
+            import lz4.frame
+
+            return lz4.frame.compress(data)
+        if self == CacheCodec.ZSTD:
+            import zstandard
+
+            return zstandard.ZstdCompressor().compress(data)
+        return data
+
+    def loads(self, data: bytes) -> t.Any:
+        if self.is_gzip:
+            return pickle.loads(zlib.decompress(data))
+
+        if self == CacheCodec.LZ4:
+            import lz4.frame
+
+            data = lz4.frame.decompress(data)
+        elif self == CacheCodec.ZSTD:
+            import zstandard
+
+            data = zstandard.ZstdDecompressor().decompress(data)
+        return pickle.loads(data)
+
+    def __str__(self) -> str:
+        return self.name
+
+    def __repr__(self) -> str:
+        return str(self)
+
 
 class FileCache(t.Generic[T]):
     """Generic file-based cache implementation.
@@ -32,10 +151,22 @@ class FileCache(t.Generic[T]):
         entry_class: The type of cached entries.
         prefix: The prefix shared between all entries to distinguish them from other entries
             stored in the same cache folder.
+        store: The storage layout of the cache.
+        codec: The encoding of cache entries.
     """
 
-    def __init__(self, path: Path, prefix: t.Optional[str] = None):
+    def __init__(
+        self,
+        path: Path,
+        prefix: t.Optional[str] = None,
+        store: t.Optional[CacheStore] = None,
+        codec: t.Optional[CacheCodec] = None,
+    ):
         self._path = path / prefix if prefix else path
+        self._prefix = prefix or ""
+        self._store = store or CacheStore.default
+        self._codec = codec or CacheCodec.default
+        self._codec.ensure_available()
 
         from sqlmesh.core.state_sync.base import SCHEMA_VERSION
 
@@ -53,10 +184,19 @@ class FileCache(t.Generic[T]):
                 SQLGLOT_MAJOR_VERSION,
                 SQLGLOT_MINOR_VERSION,
                 str(SCHEMA_VERSION),
+                # Entries written with a different codec can't be decoded
+                *([] if self._codec.is_gzip else [self._codec.value]),
             ]
         )
 
         threshold = to_datetime("1 week ago").timestamp()
+
+        self._sqlite_store: t.Optional[SQLiteCacheStore] = None
+        if self._store.is_sqlite:
+            self._sqlite_store = SQLiteCacheStore(path / SQLITE_CACHE_FILE_NAME)
+            self._sqlite_store.evict(self._prefix, self._cache_version, threshold)
+            return
+
         # delete all old cache files
         for file in self._path.glob("*"):
             if not file.stem.startswith(self._cache_version) or file.stat().st_atime < threshold:
@@ -91,8 +231,15 @@ class FileCache(t.Generic[T]):
         Returns:
             The entry or None if no entry was found in the cache.
         """
+        if self._sqlite_store:
+            data = self._sqlite_store.get(self._prefix, self._entry_key(name, entry_id))
+            return self._decode(name, data) if data is not None else None
+
         cache_entry_path = self._cache_entry_path(name, entry_id)
         if cache_entry_path.exists():
+            if not self._codec.is_gzip:
+                return self._decode(name, cache_entry_path.read_bytes())
+
             with gzip.open(cache_entry_path, "rb") as fd:
                 try:
                     return pickle.load(fd)
@@ -101,6 +248,33 @@ class FileCache(t.Generic[T]):
 
         return None
 
+    def get_many(self, names: t.Collection[str], entry_id: str = "") -> t.Dict[str, T]:
+        """Returns all cached entries that exist for the given names.
+
+        Entries are read and decoded concurrently. The SQLite store fetches them with batched queries.
+
+        Args:
+            names: The names of the entries.
+            entry_id: The unique entry identifier shared by all entries. Used for cache invalidation.
+
+        Returns:
+            A dictionary which maps names to the entries that were found in the cache.
+        """
+        if self._sqlite_store:
+            keys = {self._entry_key(name, entry_id): name for name in names}
+            data = self._sqlite_store.get_many(self._prefix, keys)
+            decoded = _map_concurrently(
+                lambda item: self._decode(keys[item[0]], item[1]), list(data.items())
+            )
+            entries = {keys[key]: entry for key, entry in zip(data, decoded)}
+        else:
+            names = list(names)
+            entries = dict(
+                zip(names, _map_concurrently(lambda name: self.get(name, entry_id), names))
+            )
+
+        return {name: entry for name, entry in entries.items() if entry is not None}
+
     def put(self, name: str, entry_id: str = "", *, value: T) -> None:
         """Stores the given value in the cache.
 
@@ -109,13 +283,52 @@ class FileCache(t.Generic[T]):
             entry_id: The unique entry identifier. Used for cache invalidation.
             value: The value to store in the cache.
         """
+        if self._sqlite_store:
+            self._sqlite_store.put(
+                self._prefix,
+                self._entry_key(name, entry_id),
+                self._cache_version,
+                self._codec.dumps(value),
+            )
+            return
+
         self._path.mkdir(parents=True, exist_ok=True)
         if not self._path.is_dir():
             raise SQLMeshError(f"Cache path '{self._path}' is not a directory.")
 
+        if not self._codec.is_gzip:
+            self._cache_entry_path(name, entry_id).write_bytes(self._codec.dumps(value))
+            return
+
         with gzip.open(self._cache_entry_path(name, entry_id), "wb", compresslevel=1) as fd:
             pickle.dump(value, fd)
 
+    def put_many(self, values: t.Dict[str, T], entry_id: str = "") -> None:
+        """Stores the given values in the cache.
+
+        Entries are encoded and written concurrently. The SQLite store writes them in a single transaction.
+
+        Args:
+            values: A dictionary which maps entry names to the values to store in the cache.
+            entry_id: The unique entry identifier shared by all entries. Used for cache invalidation.
+        """
+        if self._sqlite_store:
+            items = list(values.items())
+            encoded = _map_concurrently(lambda item: self._codec.dumps(item[1]), items)
+            self._sqlite_store.put_many(
+                self._prefix,
+                {
+                    self._entry_key(name, entry_id): data
+                    for (name, _), data in zip(items, encoded)
+                },
+                self._cache_version,
+            )
+            return
+
+        _map_concurrently(
+            lambda item: self.put(item[0], entry_id, value=item[1]), list(values.items())
+        )
+
     def exists(self, name: str, entry_id: str = "") -> bool:
         """Returns true if the cache entry with the given name and ID exists, false otherwise.
 
@@ -123,14 +336,30 @@ class FileCache(t.Generic[T]):
             name: The name of the entry.
             entry_id: The unique entry identifier. Used for cache invalidation.
         """
+        if self._sqlite_store:
+            return self._sqlite_store.exists(self._prefix, self._entry_key(name, entry_id))
         return self._cache_entry_path(name, entry_id).exists()
 
     def clear(self) -> None:
+        if self._sqlite_store:
+            self._sqlite_store.clear(self._prefix)
+            return
+
         try:
             shutil.rmtree(str(self._path.absolute()))
         except Exception:
             pass
 
+    def _decode(self, name: str, data: bytes) -> t.Optional[T]:
+        try:
+            return self._codec.loads(data)
+        except Exception as ex:
+            logger.warning("Failed to load a cache entry '%s': %s", name, ex)
+            return None
+
+    def _entry_key(self, name: str, entry_id: str = "") -> str:
+        return "__".join(p for p in (self._cache_version, name, entry_id) if p)
+
     def _cache_entry_path(self, name: str, entry_id: str = "") -> Path:
         entry_file_name = "__".join(p for p in (self._cache_version, name, entry_id) if p)
         full_path = self._path / sanitize_name(entry_file_name)
@@ -138,3 +367,265 @@ class FileCache(t.Generic[T]):
             # handle paths longer than 260 chars
             full_path = fix_windows_path(full_path)
         return full_path
+
+
+class SQLiteCacheStore:
+    """Stores cache entries in a single SQLite database file.
+
+    Entries are grouped into namespaces and looked up through the table's primary key, so opening
+    the cache doesn't require listing or inspecting individual entries. Once the total size of the
+    stored entries exceeds the limit, the least recently accessed entries are evicted.
+
+    Connections are created lazily for each thread and process, which makes the store safe to use
+    from thread pools and forked processes alike.
+
+    Args:
+        path: The path to the database file.
+        max_size: The maximum total size of the stored entries in bytes.
+    """
+
+    # Access times are only refreshed once they are older than this many seconds to keep reads read-only
+    ACCESS_TIME_RESOLUTION = 3600
+    # Stays well below SQLite's limit on the number of bound parameters
+    BATCH_SIZE = 500
+    # How often, in seconds, each connection checks whether the database file has been removed
+    FILE_CHECK_INTERVAL = 1.0
+
+    def __init__(self, path: Path, max_size: int = SQLITE_CACHE_MAX_SIZE):
+        self._path = path
+        self._max_size = max_size
+        self._local = threading.local()
+
+    def get(self, namespace: str, key: str) -> t.Optional[bytes]:
+        row = self._connection.execute(
+            "SELECT value, accessed_at FROM entries WHERE namespace = ? AND key = ?",
+            (namespace, key),
+        ).fetchone()
+        if row is None:
+            return None
+
+        value, accessed_at = row
+        now = int(time.time())
+        if now - accessed_at > self.ACCESS_TIME_RESOLUTION:
+            self._connection.execute(
+                "UPDATE entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                (now, namespace, key),
+            )
+        return value
+
+    def put(self, namespace: str, key: str, version: str, value: bytes) -> None:
+        self._connection.execute(
+            "INSERT OR REPLACE INTO entries (namespace, key, version, value, size, accessed_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (namespace, key, version, value, len(value), int(time.time())),
+        )
+
+        self._local.written_size = getattr(self._local, "written_size", 0) + len(value)
+        # Checking the total size is cheap thanks to the covering index, but there's no need to do it on every write
+        if self._local.written_size > self._max_size // 100:
+            self._local.written_size = 0
+            self._evict_to_max_size()
+
+    def get_many(self, namespace: str, keys: t.Collection[str]) -> t.Dict[str, bytes]:
+        result = {}
+        stale_keys = []
+        now = int(time.time())
+
+        keys = list(keys)
+        for i in range(0, len(keys), self.BATCH_SIZE):
+            batch = keys[i : i + self.BATCH_SIZE]
+            placeholders = ", ".join("?" * len(batch))
+            for key, value, accessed_at in self._connection.execute(
+                f"SELECT key, value, accessed_at FROM entries WHERE namespace = ? AND key IN ({placeholders})",
+                (namespace, *batch),
+            ):
+                result[key] = value
+                if now - accessed_at > self.ACCESS_TIME_RESOLUTION:
+                    stale_keys.append(key)
+
+        if stale_keys:
+            with self._transaction():
+                self._connection.executemany(
+                    "UPDATE entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                    ((now, namespace, key) for key in stale_keys),
+                )
+        return result
+
+    def put_many(self, namespace: str, values: t.Dict[str, bytes], version: str) -> None:
+        now = int(time.time())
+        with self._transaction():
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO entries (namespace, key, version, value, size, accessed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    (namespace, key, version, value, len(value), now)
+                    for key, value in values.items()
+                ),
+            )
+
+        self._local.written_size = getattr(self._local, "written_size", 0) + sum(
+            len(value) for value in values.values()
+        )
+        if self._local.written_size > self._max_size // 100:
+            self._local.written_size = 0
+            self._evict_to_max_size()
+
+    def exists(self, namespace: str, key: str) -> bool:
+        return (
+            self._connection.execute(
+                "SELECT 1 FROM entries WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+            is not None
+        )
+
+    def clear(self, namespace: str) -> None:
+        self._connection.execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+
+    def evict(self, namespace: str, version: str, accessed_before: float) -> None:
+        """Deletes entries of the namespace that were created by a different cache version, as well as
+        entries of any namespace that haven't been accessed since the given timestamp.
+        """
+        self._connection.execute(
+            "DELETE FROM entries WHERE namespace = ? AND version <> ?", (namespace, version)
+        )
+        self._connection.execute(
+            "DELETE FROM entries WHERE accessed_at < ?", (int(accessed_before),)
+        )
+
+    def _evict_to_max_size(self) -> None:
+        (total_size,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        if total_size <= self._max_size:
+            return
+
+        # Leave some headroom to avoid evicting again on the very next write
+        size_to_free = total_size - int(self._max_size * 0.8)
+        cursor = self._connection.execute(
+            "SELECT accessed_at, size FROM entries ORDER BY accessed_at ASC"
+        )
+        threshold = None
+        for accessed_at, size in cursor:
+            size_to_free -= size
+            threshold = accessed_at
+            if size_to_free <= 0:
+                break
+        cursor.close()
+
+        if threshold is not None:
+            self._connection.execute("DELETE FROM entries WHERE accessed_at <= ?", (threshold,))
+
+    @contextmanager
+    def _transaction(self) -> t.Iterator[None]:
+        self._connection.execute("BEGIN")
+        try:
+            yield
+        except Exception:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        local = self._local
+        connection = getattr(local, "connection", None)
+        if connection is not None and local.pid != os.getpid():
+            # Connections must never be shared between a parent process and its forks. The inherited
+            # connection isn't closed since it still belongs to the parent.
+            connection = None
+        elif connection is not None and time.monotonic() > local.next_check_at:
+            # The database file might have been removed together with the rest of the cache folder
+            local.next_check_at = time.monotonic() + self.FILE_CHECK_INTERVAL
+            if not os.path.exists(self._path):
+                connection.close()
+                connection = None
+
+        if connection is None:
+            local.connection = connection = self._connect()
+            local.pid = os.getpid()
+            local.next_check_at = time.monotonic() + self.FILE_CHECK_INTERVAL
+        return connection
+
+    def _connect(self) -> sqlite3.Connection:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        if not self._path.parent.is_dir():
+            raise SQLMeshError(f"Cache path '{self._path.parent}' is not a directory.")
+
+        connection = sqlite3.connect(
+            str(self._path), timeout=60, isolation_level=None, check_same_thread=False
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                version TEXT NOT NULL,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                accessed_at INTEGER NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+            """
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS entries_accessed_at_idx ON entries (accessed_at, size)"
+        )
+        return connection
+
+
+def _map_concurrently(fn: t.Callable[[t.Any], R], values: t.List[t.Any]) -> t.List[R]:
+    if len(values) < CACHE_IO_BATCH_THRESHOLD:
+        return [fn(value) for value in values]
+    with ThreadPoolExecutor(max_workers=CACHE_IO_WORKERS) as pool:
+        return list(pool.map(fn, values))
+
+
+class _CompactPickler(pickle.Pickler):
+    """Pickles SQLGlot expressions as nested constructor calls.
+
+    SQLGlot's own pickling support serializes every node into a dictionary, and then reassembles
+    the tree node by node when unpickling. Passing the arguments of each node straight to its
+    constructor produces smaller payloads that are also faster to load.
+    """
+
+    def reducer_override(self, obj: t.Any) -> t.Any:
+        if isinstance(obj, exp.Expression):
+            return _load_expression, (
+                type(obj),
+                {
+                    k: v
+                    for k, v in obj.args.items()
+                    if v is not None and not (type(v) is list and not v)
+                },
+                obj.comments,
+                obj._meta,
+                obj._type,
+            )
+        return NotImplemented
+
+
+def _dumps_compact(value: t.Any) -> bytes:
+    buffer = io.BytesIO()
+    try:
+        _CompactPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(value)
+    except RecursionError:
+        # Nested constructor calls are as deep as the expression tree itself, so very deep trees fall back
+        # to SQLGlot's own pickling support, which serializes them iteratively
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    return buffer.getvalue()
+
+
+def _load_expression(
+    expression_type: t.Type[exp.Expression],
+    args: t.Dict[str, t.Any],
+    comments: t.Optional[t.List[str]],
+    meta: t.Optional[t.Dict[str, t.Any]],
+    data_type: t.Optional[exp.DataType],
+) -> exp.Expression:
+    expression = expression_type.__new__(expression_type)
+    # Some expression types normalize their arguments in the constructor, which must not happen twice
+    exp.Expression.__init__(expression, **args)
+    expression.comments = comments
+    expression._meta = meta
+    expression._type = data_type
+    return expression
@@ -1,4 +1,7 @@
+import heapq
+import itertools
 import typing as t
+from collections import deque
 from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from threading import Lock
 
@@ -23,6 +26,10 @@ class ConcurrentDAGExecutor(t.Generic[H]):
 
     If `raise_on_error` is set to False maintains a state of execution errors as well as of skipped nodes.
 
+    The executor keeps a reverse adjacency list and in-degree counters for each node, so that a completion
+    of a node only touches its direct dependents. Nodes which are ready to be executed are kept in a queue
+    ordered by the optional `priority` key.
+
     Args:
         dag: The target DAG.
         fn: The function that will be applied concurrently to each snapshot.
@@ -30,6 +37,9 @@ class ConcurrentDAGExecutor(t.Generic[H]):
         raise_on_error: If set to True raises an exception on a first encountered error,
             otherwises returns a tuple which contains a list of failed nodes and a list of
             skipped nodes.
+        priority: An optional function which returns a sort key for a node. Ready nodes with
+            lower keys are executed first. If not provided, ready nodes are executed in the order
+            in which they became ready.
     """
 
     def __init__(
@@ -38,11 +48,13 @@ class ConcurrentDAGExecutor(t.Generic[H]):
         fn: t.Callable[[H], None],
         tasks_num: int,
         raise_on_error: bool,
+        priority: t.Optional[t.Callable[[H], t.Any]] = None,
     ):
         self.dag = dag
         self.fn = fn
         self.tasks_num = tasks_num
         self.raise_on_error = raise_on_error
+        self.priority = priority
 
         self._init_state()
 
@@ -70,7 +82,12 @@ class ConcurrentDAGExecutor(t.Generic[H]):
 
             with self._unprocessed_nodes_lock:
                 self._unprocessed_nodes_num -= 1
-                self._submit_next_nodes(executor, node)
+                self._running_nodes_num -= 1
+                for next_node in self._downstream[node]:
+                    self._in_degree[next_node] -= 1
+                    if not self._in_degree[next_node]:
+                        self._push_ready_node(next_node)
+                self._submit_next_nodes(executor)
         except Exception as ex:
             error = NodeExecutionFailedError(node)
             error.__cause__ = ex
@@ -81,56 +98,106 @@ class ConcurrentDAGExecutor(t.Generic[H]):
 
             with self._unprocessed_nodes_lock:
                 self._unprocessed_nodes_num -= 1
+                self._running_nodes_num -= 1
                 self._node_errors.append(error)
                 self._skip_next_nodes(node)
+                self._submit_next_nodes(executor)
 
-    def _submit_next_nodes(self, executor: Executor, processed_node: t.Optional[H] = None) -> None:
-        if not self._unprocessed_nodes_num:
-            self._finished_future.set_result(None)
+    def _submit_next_nodes(self, executor: Executor) -> None:
+        if self._finished_future.done():
             return
 
-        submitted_nodes = []
-        for next_node, deps in self._unprocessed_nodes.items():
-            if processed_node:
-                deps.discard(processed_node)
-            if not deps:
-                submitted_nodes.append(next_node)
-
-        for submitted_node in submitted_nodes:
-            self._unprocessed_nodes.pop(submitted_node)
-            executor.submit(self._process_node, submitted_node, executor)
-
-    def _skip_next_nodes(self, parent: H) -> None:
         if not self._unprocessed_nodes_num:
             self._finished_future.set_result(None)
             return
 
-        skipped_nodes = {node for node, deps in self._unprocessed_nodes.items() if parent in deps}
+        while self._ready_nodes and self._running_nodes_num < self.tasks_num:
+            _, _, next_node = heapq.heappop(self._ready_nodes)
+            self._running_nodes_num += 1
+            executor.submit(self._process_node, next_node, executor)
 
-        while skipped_nodes:
-            self._skipped_nodes.extend(skipped_nodes)
-
-            for skipped_node in skipped_nodes:
-                self._unprocessed_nodes_num -= 1
-                self._unprocessed_nodes.pop(skipped_node)
-
-            skipped_nodes = {
-                node
-                for node, deps in self._unprocessed_nodes.items()
-                if skipped_nodes.intersection(deps)
-            }
-
-        if not self._unprocessed_nodes_num:
-            self._finished_future.set_result(None)
+    def _skip_next_nodes(self, parent: H) -> None:
+        # Only the subgraph downstream of the failed node is visited. A node can't become ready
+        # once any of its dependencies has been skipped, since its in-degree never drops to zero.
+        queue = deque(self._downstream[parent])
+        while queue:
+            node = queue.popleft()
+            if node in self._skipped_nodes_set:
+                continue
+            self._skipped_nodes_set.add(node)
+            self._skipped_nodes.append(node)
+            self._unprocessed_nodes_num -= 1
+            queue.extend(self._downstream[node])
+
+    def _push_ready_node(self, node: H) -> None:
+        key = self.priority(node) if self.priority else 0
+        heapq.heappush(self._ready_nodes, (key, next(self._ready_nodes_counter), node))
 
     def _init_state(self) -> None:
-        self._unprocessed_nodes = self.dag.graph
-        self._unprocessed_nodes_num = len(self._unprocessed_nodes)
+        graph = self.dag.graph
+
+        self._in_degree: t.Dict[H, int] = {}
+        self._downstream: t.Dict[H, t.List[H]] = {node: [] for node in graph}
+        for node, deps in graph.items():
+            self._in_degree[node] = len(deps)
+            for dep in deps:
+                self._downstream[dep].append(node)
+
+        # The counter is used as a tie breaker, so that nodes themselves never get compared
+        self._ready_nodes: t.List[t.Tuple[t.Any, int, H]] = []
+        self._ready_nodes_counter = itertools.count()
+        for node, in_degree in self._in_degree.items():
+            if not in_degree:
+                self._push_ready_node(node)
+
+        self._unprocessed_nodes_num = len(graph)
+        self._running_nodes_num = 0
         self._unprocessed_nodes_lock = Lock()
         self._finished_future = Future()  # type: ignore
 
         self._node_errors: t.List[NodeExecutionFailedError[H]] = []
         self._skipped_nodes: t.List[H] = []
+        self._skipped_nodes_set: t.Set[H] = set()
+
+
+def critical_path_priority(
+    dag: DAG[H], cost: t.Optional[t.Callable[[H], float]] = None
+) -> t.Callable[[H], float]:
+    """Returns a priority function which favors nodes on the longest path to the end of the DAG.
+
+    The length of a path is the sum of costs of all nodes on that path. Scheduling nodes with the
+    longest remaining path first minimizes the total run time when the number of concurrent tasks is limited.
+
+    Args:
+        dag: The target DAG.
+        cost: An optional function which returns the estimated cost of a node, eg. based on the
+            execution history. Every node has the cost of 1 by default.
+
+    Returns:
+        The priority function that can be passed to `concurrent_apply_to_dag`.
+    """
+    graph = dag.graph
+    downstream: t.Dict[H, t.List[H]] = {node: [] for node in graph}
+    out_degree: t.Dict[H, int] = {node: 0 for node in graph}
+    for node, deps in graph.items():
+        for dep in deps:
+            downstream[dep].append(node)
+            out_degree[dep] += 1
+
+    path_lengths: t.Dict[H, float] = {}
+    # Traverse the DAG from leaves to roots, so that each node's dependents are processed before the node itself
+    queue = deque(node for node, degree in out_degree.items() if not degree)
+    while queue:
+        node = queue.popleft()
+        path_lengths[node] = (cost(node) if cost else 1) + max(
+            (path_lengths[d] for d in downstream[node]), default=0
+        )
+        for dep in graph[node]:
+            out_degree[dep] -= 1
+            if not out_degree[dep]:
+                queue.append(dep)
+
+    return lambda node: -path_lengths.get(node, 0)
 
 
 def concurrent_apply_to_snapshots(
@@ -180,6 +247,7 @@ def concurrent_apply_to_dag(
     fn: t.Callable[[H], None],
     tasks_num: int,
     raise_on_error: bool = True,
+    priority: t.Optional[t.Callable[[H], t.Any]] = None,
 ) -> t.Tuple[t.List[NodeExecutionFailedError[H]], t.List[H]]:
     """Applies a function to the given DAG concurrently while preserving the topological
     order between snapshots.
@@ -191,6 +259,8 @@ def concurrent_apply_to_dag(
         raise_on_error: If set to True raises an exception on a first encountered error,
             otherwises returns a tuple which contains a list of failed nodes and a list of
             skipped nodes.
+        priority: An optional function which returns a sort key for a node. Ready nodes with lower keys
+            are executed first. See `critical_path_priority`.
 
     Raises:
         NodeExecutionFailedError if `raise_on_error` is set to True and execution fails for any snapshot.
@@ -209,6 +279,7 @@ def concurrent_apply_to_dag(
         fn,
         tasks_num,
         raise_on_error,
+        priority=priority,
     ).run()
 
 
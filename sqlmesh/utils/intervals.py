@@ -0,0 +1,152 @@
+"""
+# Intervals
+
+Vectorized operations on collections of [start, end) intervals of epoch millisecond timestamps.
+
+The functions in this module are backed by NumPy int64 arrays and produce exactly the same results as
+their pure Python counterparts in `sqlmesh.core.snapshot.definition`. Since converting small collections
+into arrays costs more than processing them in Python, callers are expected to only use these functions
+once the number of intervals or timestamps exceeds `VECTORIZE_THRESHOLD`.
+"""
+
+from __future__ import annotations
+
+import typing as t
+
+if t.TYPE_CHECKING:
+    import numpy as np
+
+Interval = t.Tuple[int, int]
+Intervals = t.List[Interval]
+
+VECTORIZE_THRESHOLD = 64
+
+
+def merge_intervals(intervals: t.Collection[Interval]) -> Intervals:
+    """Merge a collection of intervals.
+
+    Args:
+        intervals: A collection of intervals to merge together.
+
+    Returns:
+        A new list of sorted and merged intervals.
+    """
+    import numpy as np
+
+    if not intervals:
+        return []
+
+    starts, ends = _to_arrays(intervals)
+    order = np.lexsort((ends, starts))
+    starts, ends = starts[order], ends[order]
+
+    max_ends = np.maximum.accumulate(ends)
+    # A new group begins whenever an interval starts after the furthest end seen so far
+    group_starts = np.flatnonzero(starts[1:] > max_ends[:-1]) + 1
+    group_ends = np.append(group_starts - 1, len(starts) - 1)
+    group_starts = np.insert(group_starts, 0, 0)
+
+    return _to_intervals(starts[group_starts], max_ends[group_ends])
+
+
+def remove_interval(intervals: t.Collection[Interval], remove_start: int, remove_end: int) -> Intervals:
+    """Remove an interval from a collection of intervals.
+
+    Args:
+        intervals: A collection of exclusive intervals.
+        remove_start: The inclusive start to remove.
+        remove_end: The exclusive end to remove.
+
+    Returns:
+        A new list of intervals.
+    """
+    import numpy as np
+
+    if not intervals:
+        return []
+
+    starts, ends = _to_arrays(intervals)
+
+    has_left = remove_start > starts
+    has_right = remove_end < ends
+    has_both = has_left & has_right
+
+    left_ends = np.where(has_both, remove_start, np.minimum(remove_start, ends))
+    right_starts = np.where(has_both, remove_end, np.maximum(remove_end, starts))
+
+    # Interleave the left and the right parts of each interval to preserve the original order
+    result_starts = np.column_stack((starts, right_starts)).ravel()
+    result_ends = np.column_stack((left_ends, ends)).ravel()
+    mask = np.column_stack((has_left, has_right)).ravel()
+
+    return _to_intervals(result_starts[mask], result_ends[mask])
+
+
+def missing_mask(
+    timestamps: np.ndarray, intervals: t.Collection[Interval]
+) -> t.Optional[np.ndarray]:
+    """Computes which of the consecutive [timestamps[i], timestamps[i + 1]) ranges are not covered by the intervals.
+
+    A range is covered if it's fully contained by at least one of the intervals.
+
+    Args:
+        timestamps: A sorted array of timestamps.
+        intervals: A collection of intervals sorted by their start.
+
+    Returns:
+        A boolean array which is set to True for each missing range, or None if the intervals are not sorted.
+    """
+    import numpy as np
+
+    range_starts = timestamps[:-1]
+    range_ends = timestamps[1:]
+
+    if not intervals:
+        return np.ones(len(range_starts), dtype=bool)
+
+    lows, highs = _to_arrays(intervals)
+    if np.any(lows[1:] < lows[:-1]):
+        return None
+
+    # For each range find the furthest end of all intervals that start at or before the range's start
+    max_highs = np.maximum.accumulate(highs)
+    idx = np.searchsorted(lows, range_starts, side="right") - 1
+    covered = (idx >= 0) & (range_ends <= max_highs[np.maximum(idx, 0)])
+    return ~covered
+
+
+def apply_lookback(mask: np.ndarray, lookback: int) -> np.ndarray:
+    """Marks a range as missing if the range `lookback` positions ahead of it is missing or doesn't exist.
+
+    Args:
+        mask: A boolean array of missing ranges.
+        lookback: The lookback window.
+
+    Returns:
+        A new boolean array of missing ranges.
+    """
+    import numpy as np
+
+    shifted = np.ones(len(mask), dtype=bool)
+    if lookback < len(mask):
+        shifted[: len(mask) - lookback] = mask[lookback:]
+    return mask | shifted
+
+
+def contiguous_breaks(intervals: t.Sequence[Interval]) -> t.List[int]:
+    """Returns positions of intervals which don't start at the end of the preceding interval."""
+    import numpy as np
+
+    starts, ends = _to_arrays(intervals)
+    return (np.flatnonzero(starts[1:] != ends[:-1]) + 1).tolist()
+
+
+def _to_arrays(intervals: t.Collection[Interval]) -> t.Tuple[np.ndarray, np.ndarray]:
+    import numpy as np
+
+    array = np.array(intervals, dtype=np.int64).reshape(-1, 2)
+    return array[:, 0], array[:, 1]
+
+
+def _to_intervals(starts: np.ndarray, ends: np.ndarray) -> Intervals:
+    return list(zip(starts.tolist(), ends.tolist()))
@@ -7,11 +7,13 @@ import typing as t
 import zlib
 from collections import defaultdict
 from enum import Enum
+from functools import lru_cache, partial
 from sys import exc_info
 from traceback import walk_tb
+from types import CodeType
 
-from jinja2 import Environment, Template, nodes, UndefinedError
-from jinja2.runtime import Macro
+from jinja2 import Environment, Template, nodes, pass_context, UndefinedError
+from jinja2.runtime import Context, Macro
 from sqlglot import Dialect, Expression, Parser, TokenType
 
 from sqlmesh.core import constants as c
@@ -25,18 +27,62 @@ if t.TYPE_CHECKING:
     CallNames = t.Tuple[t.Tuple[str, ...], t.Union[nodes.Call, nodes.Getattr]]
 
 SQLMESH_JINJA_PACKAGE = "sqlmesh.utils.jinja"
+# The global which refers to the context that macros of a built environment are evaluated with
+MACRO_CONTEXT = "__sqlmesh_macro_context__"
 
 
-def environment(**kwargs: t.Any) -> Environment:
+def environment(
+    environment_class: t.Type[Environment] = Environment, **kwargs: t.Any
+) -> Environment:
     extensions = kwargs.pop("extensions", [])
     extensions.append("jinja2.ext.do")
     extensions.append("jinja2.ext.loopcontrols")
-    return Environment(extensions=extensions, **kwargs)
+    return environment_class(extensions=extensions, **kwargs)
 
 
 ENVIRONMENT = environment()
 
 
+class _Environment(Environment):
+    """A Jinja environment which reuses compiled code of templates with the same source."""
+
+    def compile(  # type: ignore
+        self,
+        source: t.Union[str, nodes.Template],
+        name: t.Optional[str] = None,
+        filename: t.Optional[str] = None,
+        raw: bool = False,
+        defer_init: bool = False,
+    ) -> t.Union[str, CodeType]:
+        if (
+            isinstance(source, str)
+            and name is None
+            and filename is None
+            and not raw
+            and not defer_init
+        ):
+            # Overlays share filters and extensions with the environment they were created from,
+            # so the code compiled by that environment can be reused
+            return _compile_template(self.linked_to or self, source)
+        return super().compile(source, name, filename, raw, defer_init)
+
+
+@lru_cache(maxsize=4096)
+def _compile_template(env: Environment, source: str) -> CodeType:
+    return Environment.compile(env, source)
+
+
+@lru_cache(maxsize=None)
+def _base_environment(create_builtins_module: t.Optional[str]) -> Environment:
+    """Creates a Jinja environment with builtin filters defined in the provided module."""
+    env = environment(environment_class=_Environment)
+    if create_builtins_module is not None:
+        module = importlib.import_module(create_builtins_module)
+        if hasattr(module, "create_builtin_filters"):
+            env.filters.update(module.create_builtin_filters())
+    return env
+
+
 class MacroReference(PydanticModel, frozen=True):
     package: t.Optional[str] = None
     name: str
@@ -246,14 +292,21 @@ class JinjaMacroRegistry(PydanticModel):
     top_level_packages: t.List[str] = []
 
     _parser_cache: t.Dict[t.Tuple[t.Optional[str], str], Template] = {}
+    _macro_wrappers_cache: t.Optional[
+        t.Tuple[
+            JinjaMacroRegistry,
+            t.Tuple[t.Optional[str], t.Tuple[str, ...]],
+            t.Dict[str, t.Any],
+            t.Dict[str, AttributeDict],
+        ]
+    ] = None
     _trimmed: bool = False
-    __environment: t.Optional[Environment] = None
 
     def __getstate__(self) -> t.Dict[t.Any, t.Any]:
         state = super().__getstate__()
         private = state[PRIVATE_FIELDS]
         private["_parser_cache"] = {}
-        private["_JinjaMacroRegistry__environment"] = None
+        private["_macro_wrappers_cache"] = None
         return state
 
     @field_validator("global_objs", mode="before")
@@ -303,6 +356,7 @@ class JinjaMacroRegistry(PydanticModel):
             self.packages[package] = package_macros
         else:
             self.root_macros.update(macros)
+        self._macro_wrappers_cache = None
 
     def add_globals(self, globals: t.Dict[str, JinjaGlobalAttribute]) -> None:
         """Adds global objects to the registry.
@@ -326,34 +380,26 @@ class JinjaMacroRegistry(PydanticModel):
         env: Environment = self.build_environment(**kwargs)
         if reference.package is not None:
             package = env.globals.get(reference.package, {})
-            return package.get(reference.name)  # type: ignore
-        return env.globals.get(reference.name)  # type: ignore
+            macro = package.get(reference.name)  # type: ignore
+        else:
+            macro = env.globals.get(reference.name)
+        if isinstance(macro, self._MacroWrapper):
+            return macro.bind(env.globals[MACRO_CONTEXT])
+        return macro  # type: ignore
 
     def build_environment(self, **kwargs: t.Any) -> Environment:
         """Builds a new Jinja environment based on this registry."""
 
-        context: t.Dict[str, t.Any] = {}
-
-        root_macros = {
-            name: self._MacroWrapper(name, None, self, context)
-            for name, macro in self.root_macros.items()
-        }
-
-        package_macros: t.Dict[str, t.Any] = defaultdict(AttributeDict)
-        for package_name, macros in self.packages.items():
-            for macro_name, macro in macros.items():
-                macro_wrapper = self._MacroWrapper(macro_name, package_name, self, context)
-                package_macros[package_name][macro_name] = macro_wrapper
-                if macro.is_top_level and macro_name not in root_macros:
-                    root_macros[macro_name] = macro_wrapper
+        # Macro wrappers and the base environment are shared, only globals are built per call
+        shared_root_macros, shared_package_macros = self._macro_wrappers()
+        root_macros = shared_root_macros.copy()
+        package_macros = shared_package_macros.copy()
 
         top_level_packages = self.top_level_packages.copy()
-
         if self.root_package_name is not None:
-            package_macros[self.root_package_name].update(root_macros)
             top_level_packages.append(self.root_package_name)
 
-        env = environment()
+        env = self._environment.overlay()
 
         builtin_globals = self._create_builtin_globals(kwargs)
         for top_level_package_name in top_level_packages:
@@ -366,13 +412,14 @@ class JinjaMacroRegistry(PydanticModel):
             )
             root_macros.update(package_macros[top_level_package_name])
 
+        context: t.Dict[str, t.Any] = {}
         context.update(builtin_globals)
         context.update(root_macros)
         context.update(package_macros)
         context["render"] = lambda input: env.from_string(input).render()
+        context[MACRO_CONTEXT] = context
 
-        env.globals.update(context)
-        env.filters.update(self._environment.filters)
+        env.globals = {**env.globals, **context}
         return env
 
     def trim(
@@ -492,6 +539,35 @@ class JinjaMacroRegistry(PydanticModel):
     def __deepcopy__(self, memo: t.Optional[t.Dict[int, t.Any]] = None) -> JinjaMacroRegistry:
         return JinjaMacroRegistry.parse_obj(self.dict())
 
+    def _macro_wrappers(self) -> t.Tuple[t.Dict[str, t.Any], t.Dict[str, AttributeDict]]:
+        """Returns wrappers of root macros and of macros grouped by package.
+
+        Builtin globals of top-level packages are merged in by `build_environment`.
+        """
+        # Copies of this registry share the cache, so it's only used by the registry that created it.
+        # Registries unpickled from caches written by earlier versions don't have the attribute.
+        # The package fields can be reassigned after the registry has been created, eg. by the dbt context.
+        cache_key = (self.root_package_name, tuple(self.top_level_packages))
+        cache = getattr(self, "_macro_wrappers_cache", None)
+        if cache is None or cache[0] is not self or cache[1] != cache_key:
+            root_macros = {name: self._MacroWrapper(name, None, self) for name in self.root_macros}
+
+            package_macros: t.Dict[str, AttributeDict] = defaultdict(AttributeDict)
+            for package_name, macros in self.packages.items():
+                for macro_name, macro in macros.items():
+                    macro_wrapper = self._MacroWrapper(macro_name, package_name, self)
+                    package_macros[package_name][macro_name] = macro_wrapper
+                    if macro.is_top_level and macro_name not in root_macros:
+                        root_macros[macro_name] = macro_wrapper
+
+            if self.root_package_name is not None:
+                package_macros[self.root_package_name].update(root_macros)
+
+            cache = (self, cache_key, root_macros, dict(package_macros))
+            self._macro_wrappers_cache = cache
+
+        return cache[2], cache[3]
+
     def _parse_macro(self, name: str, package: t.Optional[str]) -> Template:
         cache_key = (package, name)
         if cache_key not in self._parser_cache:
@@ -507,10 +583,7 @@ class JinjaMacroRegistry(PydanticModel):
 
     @property
     def _environment(self) -> Environment:
-        if self.__environment is None:
-            self.__environment = environment()
-            self.__environment.filters.update(self._create_builtin_filters())
-        return self.__environment
+        return _base_environment(self.create_builtins_module)
 
     def _trim_macros(
         self,
@@ -575,29 +648,28 @@ class JinjaMacroRegistry(PydanticModel):
                 return module.create_builtin_globals(self, global_vars, engine_adapter)
         return global_vars
 
-    def _create_builtin_filters(self) -> t.Dict[str, t.Any]:
-        """Creates Jinja builtin filters using a factory function defined in the provided module."""
-        if self.create_builtins_module is not None:
-            module = importlib.import_module(self.create_builtins_module)
-            if hasattr(module, "create_builtin_filters"):
-                return module.create_builtin_filters()
-        return {}
-
     class _MacroWrapper:
         def __init__(
             self,
             name: str,
             package: t.Optional[str],
             registry: JinjaMacroRegistry,
-            context: t.Dict[str, t.Any],
         ):
             self.name = name
             self.package = package
-            self.context = context
             self.registry = registry
 
-        def __call__(self, *args: t.Any, **kwargs: t.Any) -> t.Any:
-            context = self.context.copy()
+        @pass_context
+        def __call__(self, jinja_context: Context, *args: t.Any, **kwargs: t.Any) -> t.Any:
+            # Wrappers are shared between environments, so the context comes from the caller
+            return self.call(jinja_context[MACRO_CONTEXT], *args, **kwargs)
+
+        def bind(self, context: t.Dict[str, t.Any]) -> t.Callable:
+            """Returns a callable which evaluates this macro with the given context."""
+            return partial(self.call, context)
+
+        def call(self, context: t.Dict[str, t.Any], *args: t.Any, **kwargs: t.Any) -> t.Any:
+            context = context.copy()
             if self.package is not None and self.package in context:
                 context.update(context[self.package])
 
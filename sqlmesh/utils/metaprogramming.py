@@ -14,6 +14,7 @@ import types
 import typing as t
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from numbers import Number
 from pathlib import Path
 
@@ -543,15 +544,26 @@ def prepare_env(
         python_env.items(), key=lambda item: 0 if item[1].is_import else 1
     ):
         if executable.is_value:
-            env[name] = eval(executable.payload)
+            env[name] = eval(_compile_payload(executable.payload, "eval"))
         else:
-            exec(executable.payload, env)
+            exec(_compile_payload(executable.payload, "exec"), env)
             if executable.alias and executable.name:
                 env[executable.alias] = env[executable.name]
 
     return env
 
 
+@lru_cache(maxsize=16384)
+def _compile_payload(payload: str, mode: str) -> types.CodeType:
+    """Compiles the payload of an executable.
+
+    Python environments are prepared for every render, but only their compiled code is shared. The code is
+    executed in a fresh namespace every time, so state of one environment never leaks into another one.
+    """
+    # The file name is used to locate evaluated code in tracebacks, see format_evaluated_code_exception
+    return compile(payload, "<string>", mode)
+
+
 def format_evaluated_code_exception(
     exception: Exception,
     python_env: t.Dict[str, Executable],
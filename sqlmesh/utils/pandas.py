@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 import typing as t
 from functools import lru_cache
 
@@ -51,6 +52,13 @@ def columns_to_types_from_df(df: pd.DataFrame) -> t.Dict[str, exp.DataType]:
     return columns_to_types_from_dtypes(df.dtypes.items())
 
 
+def is_arrow_table(value: t.Any) -> bool:
+    """Checks whether the value is a PyArrow table without importing PyArrow."""
+    # If PyArrow hasn't been imported yet, the value can't be one of its tables
+    pyarrow = sys.modules.get("pyarrow")
+    return pyarrow is not None and isinstance(value, pyarrow.Table)
+
+
 def columns_to_types_from_dtypes(
     dtypes: t.Iterable[t.Tuple[t.Hashable, t.Any]],
 ) -> t.Dict[str, exp.DataType]:
@@ -67,3 +75,32 @@ def columns_to_types_from_dtypes(
             raise ValueError(f"Unsupported pandas type '{column_type}'")
         result[str(column_name)] = exp_type
     return result
+
+
+def restore_integer_columns(
+    df: pd.DataFrame, columns_to_types: t.Dict[str, exp.DataType]
+) -> pd.DataFrame:
+    """Converts float columns which are stored as integers back into nullable integer columns.
+
+    Pandas upcasts integer columns that contain missing values to floats, whose text representation can't be
+    parsed as an integer by the engine.
+    """
+    from pandas.api.types import is_float_dtype
+
+    integer_columns = {
+        column: "Int64"
+        for column, column_type in columns_to_types.items()
+        if column in df.columns
+        and column_type.is_type(*exp.DataType.INTEGER_TYPES)
+        and is_float_dtype(df.dtypes[column])
+    }
+    return df.astype(integer_columns) if integer_columns else df
+
+
+def df_to_query_params(
+    df: pd.DataFrame, columns_to_types: t.Dict[str, exp.DataType]
+) -> t.List[t.Tuple[t.Any, ...]]:
+    """Converts rows of the DataFrame into tuples of Python values that can be passed to a DB-API driver as
+    query parameters. Missing values are replaced with None."""
+    df = restore_integer_columns(df, columns_to_types).astype(object)
+    return list(df.where(df.notna(), None).itertuples(index=False, name=None))
@@ -58,7 +58,9 @@ PoolExecutor = t.Union[SynchronousPoolExecutor, ProcessPoolExecutor]
 
 
 def create_process_pool_executor(
-    initializer: t.Callable, initargs: t.Tuple, max_workers: t.Optional[int]
+    initializer: t.Optional[t.Callable] = None,
+    initargs: t.Tuple = (),
+    max_workers: t.Optional[int] = None,
 ) -> PoolExecutor:
     if max_workers == 1 or IS_WINDOWS:
         return SynchronousPoolExecutor(
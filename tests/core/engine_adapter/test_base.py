@@ -190,6 +190,35 @@ def test_columns(make_mocked_engine_adapter: t.Callable):
     adapter.cursor.execute.assert_called_once_with('DESCRIBE "test_table"')
 
 
+def test_fetch_arrow(make_mocked_engine_adapter: t.Callable):
+    adapter = make_mocked_engine_adapter(EngineAdapter)
+    adapter.cursor.description = [("id", None), ("name", None)]
+    adapter.cursor.fetchall.return_value = [(1, "a"), (2, None)]
+
+    table = adapter.fetch_arrow("SELECT id, name FROM tbl")
+    assert table.column_names == ["id", "name"]
+    assert table.to_pydict() == {"id": [1, 2], "name": ["a", None]}
+
+    adapter.cursor.fetchall.return_value = []
+    table = adapter.fetch_arrow("SELECT id, name FROM tbl")
+    assert table.column_names == ["id", "name"]
+    assert table.num_rows == 0
+
+
+def test_fetch_record_batches(make_mocked_engine_adapter: t.Callable):
+    adapter = make_mocked_engine_adapter(EngineAdapter)
+    adapter.cursor.description = [("id", None)]
+    adapter.cursor.fetchmany.side_effect = [[(1,), (2,)], [(3,)], []]
+
+    batches = adapter.fetch_record_batches("SELECT id FROM tbl", batch_size=2)
+    # Nothing is executed until the first batch is requested
+    adapter.cursor.execute.assert_not_called()
+
+    assert [batch.to_pydict() for batch in batches] == [{"id": [1, 2]}, {"id": [3]}]
+    adapter.cursor.execute.assert_called_once_with("SELECT id FROM tbl")
+    assert adapter.cursor.fetchmany.call_args_list == [call(2), call(2), call(2)]
+
+
 def test_iceberg_corrupt(make_mocked_engine_adapter: t.Callable):
     adapter = make_mocked_engine_adapter(EngineAdapter)
     adapter.cursor.fetchall.return_value = [
@@ -571,6 +600,25 @@ def test_insert_append_pandas_batches(make_mocked_engine_adapter: t.Callable):
     ]
 
 
+def test_bulk_insert_falls_back_to_insert_append(make_mocked_engine_adapter: t.Callable):
+    adapter = make_mocked_engine_adapter(EngineAdapter)
+
+    df = pd.DataFrame({"b": [4, 5], "a": [1, 2]})
+    adapter.bulk_insert(
+        "test_table",
+        df,
+        target_columns_to_types={
+            "a": exp.DataType.build("INT"),
+            "b": exp.DataType.build("INT"),
+        },
+    )
+
+    adapter.cursor.executemany.assert_not_called()
+    assert to_sql_calls(adapter) == [
+        'INSERT INTO "test_table" ("a", "b") SELECT CAST("a" AS INT) AS "a", CAST("b" AS INT) AS "b" FROM (VALUES (1, 4), (2, 5)) AS "t"("a", "b")',
+    ]
+
+
 def test_insert_append_pandas_source_columns(make_mocked_engine_adapter: t.Callable):
     adapter = make_mocked_engine_adapter(EngineAdapter)
     df = pd.DataFrame({"a": [1, 2, 3], "ignored_source": [4, 5, 6]})
@@ -68,6 +68,53 @@ def test_replace_query_pandas(adapter: EngineAdapter, duck_conn):
     pd.testing.assert_frame_equal(adapter.fetchdf("SELECT * FROM test_table"), df)
 
 
+def test_replace_query_arrow(adapter: EngineAdapter, duck_conn):
+    import pyarrow as pa
+
+    table = pa.table({"a": [1, 2, 3], "b": ["x", None, "z"]})
+    adapter.replace_query("test_table", table)  # type: ignore
+
+    assert adapter.columns("test_table") == {
+        "a": exp.DataType.build("BIGINT"),
+        "b": exp.DataType.build("TEXT"),
+    }
+    pd.testing.assert_frame_equal(adapter.fetchdf("SELECT * FROM test_table"), table.to_pandas())
+    # The registered view is only needed while the data is being copied
+    assert not duck_conn.execute(
+        "SELECT 1 FROM information_schema.tables WHERE table_type = 'VIEW' AND table_name LIKE '%test_table%'"
+    ).fetchall()
+
+
+def test_bulk_insert(adapter: EngineAdapter, duck_conn):
+    columns_to_types = {
+        "id": exp.DataType.build("text"),
+        "ts": exp.DataType.build("bigint"),
+        "flag": exp.DataType.build("boolean"),
+    }
+    adapter.create_table("test_table", columns_to_types)
+
+    # Integer columns with missing values are upcast to floats
+    df = pd.DataFrame([{"id": "a", "ts": 1, "flag": True}, {"id": None, "ts": None, "flag": False}])
+    adapter.bulk_insert("test_table", df, columns_to_types)
+
+    assert duck_conn.execute("SELECT * FROM test_table ORDER BY ts").fetchall() == [
+        ("a", 1, True),
+        (None, None, False),
+    ]
+    assert not duck_conn.execute(
+        "SELECT 1 FROM information_schema.tables WHERE table_type = 'VIEW' AND table_name LIKE '%test_table%'"
+    ).fetchall()
+
+
+def test_fetch_arrow(adapter: EngineAdapter):
+    table = adapter.fetch_arrow("SELECT range AS id, 'a' AS name FROM range(3)")
+    assert table.to_pydict() == {"id": [0, 1, 2], "name": ["a", "a", "a"]}
+
+    batches = list(adapter.fetch_record_batches("SELECT range AS id FROM range(5)", batch_size=2))
+    assert sum(batch.num_rows for batch in batches) == 5
+    assert all(batch.num_rows <= 2 for batch in batches)
+
+
 def test_set_current_catalog(make_mocked_engine_adapter: t.Callable, duck_conn):
     adapter = make_mocked_engine_adapter(DuckDBEngineAdapter)
     adapter.set_current_catalog("test_catalog")
@@ -84,3 +84,24 @@ def test_create_table_like(make_mocked_engine_adapter: t.Callable):
     adapter.cursor.execute.assert_called_once_with(
         "CREATE TABLE IF NOT EXISTS `target_table` LIKE `source_table`"
     )
+
+
+def test_bulk_insert(make_mocked_engine_adapter: t.Callable):
+    import pandas as pd  # noqa: TID253
+
+    adapter = make_mocked_engine_adapter(MySQLEngineAdapter)
+    adapter.BULK_INSERT_BATCH_SIZE = 2
+
+    df = pd.DataFrame({"a": [1.0, None, 3.0], "b": ["x", None, "z"]})
+    adapter.bulk_insert(
+        "test_table",
+        df,
+        {"a": exp.DataType.build("BIGINT"), "b": exp.DataType.build("TEXT")},
+    )
+
+    sql = "INSERT INTO `test_table` (`a`, `b`) VALUES (%s, %s)"
+    assert adapter.cursor.executemany.call_args_list == [
+        ((sql, [(1, "x"), (None, None)]),),
+        ((sql, [(3, "z")]),),
+    ]
+    adapter.cursor.execute.assert_not_called()
@@ -177,3 +177,146 @@ def test_server_version(make_mocked_engine_adapter: t.Callable, mocker: MockerFi
     del adapter.server_version
     fetchone_mock.return_value = ("15.13 (Debian 15.13-1.pgdg120+1)",)
     assert adapter.server_version == (15, 13)
+
+
+def test_insert_append_pandas_uses_copy(
+    make_mocked_engine_adapter: t.Callable, mocker: MockerFixture
+):
+    import pandas as pd  # noqa: TID253
+
+    adapter = make_mocked_engine_adapter(PostgresEngineAdapter)
+    mocker.patch.object(adapter, "COPY_BATCH_SIZE", 2)
+    mocker.patch("sqlmesh.core.engine_adapter.base.random_id", return_value="abcdefgh")
+
+    copied = []
+    adapter.cursor.copy_expert.side_effect = lambda sql, buffer: copied.append(
+        (sql, buffer.read())
+    )
+
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "", None]})
+    adapter.insert_append(
+        "test_table",
+        df,
+        target_columns_to_types={
+            "a": exp.DataType.build("INT"),
+            "b": exp.DataType.build("TEXT"),
+        },
+    )
+
+    copy_sql = 'COPY "__temp_test_table_abcdefgh" ("a", "b") FROM STDIN WITH (FORMAT CSV, NULL \'\\N\')'
+    # Only \N is read back as NULL, so empty strings are preserved
+    assert copied == [(copy_sql, "1,x\n2,\n"), (copy_sql, "3,\\N\n")]
+    assert to_sql_calls(adapter) == [
+        'CREATE TABLE IF NOT EXISTS "__temp_test_table_abcdefgh" ("a" BIGINT, "b" TEXT)',
+        'INSERT INTO "test_table" ("a", "b") SELECT CAST("a" AS INT) AS "a", CAST("b" AS TEXT) AS "b" FROM "__temp_test_table_abcdefgh"',
+        'DROP TABLE IF EXISTS "__temp_test_table_abcdefgh"',
+    ]
+
+
+def test_bulk_insert_uses_copy(make_mocked_engine_adapter: t.Callable):
+    import pandas as pd  # noqa: TID253
+
+    adapter = make_mocked_engine_adapter(PostgresEngineAdapter)
+
+    copied = []
+    adapter.cursor.copy_expert.side_effect = lambda sql, buffer: copied.append(
+        (sql, buffer.read())
+    )
+
+    df = pd.DataFrame({"b": ["x", None], "a": [1, None], "c": [True, False]})
+    adapter.bulk_insert(
+        "test_table",
+        df,
+        target_columns_to_types={
+            "a": exp.DataType.build("BIGINT"),
+            "b": exp.DataType.build("TEXT"),
+            "c": exp.DataType.build("BOOLEAN"),
+        },
+    )
+
+    # Rows are copied straight into the target table and integers aren't written as floats
+    assert copied == [
+        (
+            'COPY "test_table" ("a", "b", "c") FROM STDIN WITH (FORMAT CSV, NULL \'\\N\')',
+            "1,x,True\n\\N,\\N,False\n",
+        )
+    ]
+    assert to_sql_calls(adapter) == []
+
+
+def test_fetch_record_batches_uses_named_cursor(
+    make_mocked_engine_adapter: t.Callable, mocker: MockerFixture
+):
+    adapter = make_mocked_engine_adapter(PostgresEngineAdapter)
+    mocker.patch("sqlmesh.core.engine_adapter.postgres.random_id", return_value="abcdefgh")
+
+    named_cursor = mocker.Mock()
+    named_cursor.description = [("id", None)]
+    named_cursor.fetchmany.side_effect = [[(1,), (2,)], [(3,)], []]
+    cursor = adapter.cursor
+    connection = adapter._connection_pool.get()
+    connection.cursor.side_effect = lambda name=None: named_cursor if name else cursor
+
+    batches = list(adapter.fetch_record_batches("SELECT id FROM tbl", batch_size=2))
+
+    assert [batch.to_pydict() for batch in batches] == [{"id": [1, 2]}, {"id": [3]}]
+    connection.cursor.assert_called_with(name="sqlmesh_abcdefgh")
+    named_cursor.execute.assert_called_once_with("SELECT id FROM tbl")
+    assert named_cursor.itersize == 2
+    named_cursor.close.assert_called_once()
+
+
+
+def test_insert_append_pandas_without_copy_support(make_mocked_engine_adapter: t.Callable):
+    import pandas as pd  # noqa: TID253
+
+    adapter = make_mocked_engine_adapter(PostgresEngineAdapter)
+    # Drivers other than psycopg2, like pg8000, don't support COPY
+    del adapter.cursor.copy_expert
+
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", None]})
+    adapter.insert_append(
+        "test_table",
+        df,
+        target_columns_to_types={
+            "a": exp.DataType.build("BIGINT"),
+            "b": exp.DataType.build("TEXT"),
+        },
+    )
+
+    assert to_sql_calls(adapter) == [
+        'INSERT INTO "test_table" ("a", "b") SELECT CAST("a" AS BIGINT) AS "a", CAST("b" AS TEXT) AS "b" FROM (VALUES (1, \'x\'), (2, NULL)) AS "t"("a", "b")',
+    ]
+
+
+def test_fetch_record_batches_without_named_cursors(make_mocked_engine_adapter: t.Callable):
+    adapter = make_mocked_engine_adapter(PostgresEngineAdapter)
+    del adapter.cursor.itersize
+    adapter.cursor.description = [("id", None)]
+    adapter.cursor.fetchmany.side_effect = [[(1,), (2,)], [(3,)], []]
+
+    batches = list(adapter.fetch_record_batches("SELECT id FROM tbl", batch_size=2))
+
+    assert [batch.to_pydict() for batch in batches] == [{"id": [1, 2]}, {"id": [3]}]
+    adapter.cursor.execute.assert_called_once_with("SELECT id FROM tbl")
+    # No named cursor is created
+    adapter._connection_pool.get().cursor.assert_called_once_with()
+
+
+def test_bulk_insert_without_copy_support(make_mocked_engine_adapter: t.Callable):
+    import pandas as pd  # noqa: TID253
+
+    adapter = make_mocked_engine_adapter(PostgresEngineAdapter)
+    # Drivers other than psycopg2, like pg8000, don't support COPY
+    del adapter.cursor.copy_expert
+
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", None]})
+    target_columns_to_types = {
+        "a": exp.DataType.build("BIGINT"),
+        "b": exp.DataType.build("TEXT"),
+    }
+    adapter.bulk_insert("test_table", df, target_columns_to_types=target_columns_to_types)
+
+    adapter.cursor.executemany.assert_called_once_with(
+        'INSERT INTO "test_table" ("a", "b") VALUES (%s, %s)', [(1, "x"), (2, None)]
+    )
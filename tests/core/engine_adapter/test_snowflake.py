@@ -869,3 +869,17 @@ def test_drop_catalog(snowflake_mocked_engine_adapter: SnowflakeEngineAdapter) -
         """SELECT 1 FROM "INFORMATION_SCHEMA"."DATABASES" WHERE "DATABASE_NAME" = 'foo' AND "COMMENT" = 'sqlmesh_managed'""",
         'DROP DATABASE IF EXISTS "foo"',
     ]
+
+
+def test_fetch_record_batches_default_batch_size(
+    snowflake_mocked_engine_adapter: SnowflakeEngineAdapter, mocker: MockerFixture
+):
+    import pyarrow as pa
+
+    adapter = snowflake_mocked_engine_adapter
+    mocker.patch.object(adapter, "DEFAULT_FETCH_BATCH_SIZE", 2)
+    adapter.cursor.fetch_arrow_batches.return_value = [pa.table({"id": [1, 2, 3]})]
+
+    batches = list(adapter.fetch_record_batches("SELECT id FROM tbl"))
+
+    assert [batch.to_pydict() for batch in batches] == [{"id": [1, 2]}, {"id": [3]}]
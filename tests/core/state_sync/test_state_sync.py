@@ -2,7 +2,7 @@ import json
 import logging
 import re
 import typing as t
-from unittest.mock import call, patch
+from unittest.mock import PropertyMock, call, patch
 
 import duckdb  # noqa: TID253
 import pandas as pd  # noqa: TID253
@@ -46,7 +46,15 @@ from sqlmesh.core.state_sync.base import (
     PromotionResult,
     Versions,
 )
+from sqlmesh.core.state_sync.common import IntervalSummary
+from sqlmesh.core.state_sync.db.interval import IntervalCompactionStats
+from sqlmesh.core.state_sync.db.snapshot import (
+    _json_loads,
+    _parse_snapshot_row,
+    parse_snapshot,
+)
 from sqlmesh.utils.date import now_timestamp, to_datetime, to_timestamp
+from sqlmesh.utils.process import SynchronousPoolExecutor
 from sqlmesh.utils.errors import SQLMeshError, StateMigrationError
 
 pytestmark = pytest.mark.slow
@@ -60,6 +68,8 @@ def state_sync(duck_conn, tmp_path):
         cache_dir=tmp_path / c.CACHE,
     )
     state_sync.migrate()
+    # Compact rows right after they've been written
+    state_sync.interval_state.COMPACTION_LAG_MS = 0
     return state_sync
 
 
@@ -490,9 +500,10 @@ def test_compact_intervals(
     assert get_snapshot_intervals(snapshot).intervals == expected_intervals
 
 
-def test_compact_intervals_delete_batches(
+def test_interval_index(
     state_sync: EngineAdapterStateSync,
     make_snapshot: t.Callable,
+    get_snapshot_intervals: t.Callable,
     mocker: MockerFixture,
 ) -> None:
     snapshot = make_snapshot(
@@ -503,23 +514,280 @@ def test_compact_intervals_delete_batches(
         ),
         version="a",
     )
+    state_sync.push_snapshots([snapshot])
+    state_sync.add_interval(snapshot, "2020-01-01", "2020-01-05")
 
-    delete_from_mock = mocker.patch.object(state_sync.engine_adapter, "delete_from")
-    state_sync.interval_state.INTERVAL_BATCH_SIZE = 2
+    interval_state = state_sync.interval_state
+    assert get_snapshot_intervals(snapshot).intervals == [
+        (to_timestamp("2020-01-01"), to_timestamp("2020-01-06")),
+    ]
 
-    state_sync.push_snapshots([snapshot])
+    # Indexed versions are only synced with rows that were added since the last read
+    fetch_rows_spy = mocker.spy(interval_state, "_fetch_interval_rows")
+    state_sync.add_interval(snapshot, "2020-01-06", "2020-01-07")
+    state_sync.remove_intervals(
+        [(snapshot, snapshot.inclusive_exclusive("2020-01-01", "2020-01-01"))]
+    )
+    assert get_snapshot_intervals(snapshot).intervals == [
+        (to_timestamp("2020-01-02"), to_timestamp("2020-01-08")),
+    ]
+    fetch_rows_spy.assert_not_called()
 
-    state_sync.add_interval(snapshot, "2020-01-01", "2020-01-11")
-    state_sync.add_interval(snapshot, "2020-01-01", "2020-01-12")
-    state_sync.add_interval(snapshot, "2020-01-01", "2020-01-13")
-    state_sync.add_interval(snapshot, "2020-01-01", "2020-01-14")
-    state_sync.add_interval(snapshot, "2020-01-01", "2020-01-15")
+    # A row that is older than the ones already applied forces the version to be reloaded
+    last_created_ts = interval_state._index.last_created_ts[(snapshot.name, snapshot.version)]
+    now_mock = mocker.patch(
+        "sqlmesh.core.state_sync.db.interval.now_timestamp", return_value=last_created_ts - 1
+    )
+    state_sync.remove_intervals(
+        [(snapshot, snapshot.inclusive_exclusive("2020-01-07", "2020-01-07"))]
+    )
+    mocker.stop(now_mock)
+    assert get_snapshot_intervals(snapshot).intervals == [
+        (to_timestamp("2020-01-02"), to_timestamp("2020-01-07")),
+    ]
+    fetch_rows_spy.assert_called_once()
 
+    # Compaction rewrites rows, so the index is rebuilt from scratch
     state_sync.compact_intervals()
+    assert not interval_state._index.intervals
+    assert get_snapshot_intervals(snapshot).intervals == [
+        (to_timestamp("2020-01-02"), to_timestamp("2020-01-07")),
+    ]
 
-    delete_from_mock.assert_has_calls(
-        [call(state_sync.interval_state.intervals_table, mocker.ANY)] * 3
+
+def test_concurrent_reads(
+    duck_conn, tmp_path, make_snapshot: t.Callable, mocker: MockerFixture, caplog
+) -> None:
+    state_sync = EngineAdapterStateSync(
+        create_engine_adapter(
+            lambda: duck_conn, "duckdb", multithreaded=True, shared_connection=True
+        ),
+        schema=c.SQLMESH,
+        cache_dir=tmp_path / c.CACHE,
+        max_concurrent_reads=4,
     )
+    state_sync.migrate()
+    state_sync.snapshot_state.SNAPSHOT_BATCH_SIZE = 2
+    state_sync.interval_state.SNAPSHOT_BATCH_SIZE = 2
+
+    snapshots = [
+        make_snapshot(
+            SqlModel(name=f"model_{i}", cron="@daily", query=parse_one(f"select {i}, ds")),
+            version=str(i),
+        )
+        for i in range(7)
+    ]
+    for snapshot in snapshots:
+        snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+    state_sync.push_snapshots(snapshots)
+    for snapshot in snapshots:
+        state_sync.add_interval(snapshot, "2020-01-01", "2020-01-02")
+
+    read_pool = state_sync.read_pool
+    assert read_pool.is_concurrent(state_sync.engine_adapter)
+    # Rows written by an ongoing transaction are only visible to its own connection
+    with patch.object(
+        type(state_sync.engine_adapter._connection_pool),
+        "is_transaction_active",
+        new_callable=PropertyMock,
+        return_value=True,
+    ):
+        assert not read_pool.is_concurrent(state_sync.engine_adapter)
+
+    get_executor_spy = mocker.spy(read_pool, "_get_executor")
+    with caplog.at_level(logging.DEBUG, logger="sqlmesh.core.state_sync.db.utils"):
+        fetched = state_sync.get_snapshots(snapshots)
+    get_executor_spy.assert_called()
+    assert "Running 4 state queries concurrently" in caplog.text
+    assert re.search(r"State query returned \d+ rows in [\d.]+ ms", caplog.text)
+
+    assert set(fetched) == {s.snapshot_id for s in snapshots}
+    for snapshot in snapshots:
+        assert fetched[snapshot.snapshot_id] == snapshot
+        assert fetched[snapshot.snapshot_id].intervals == [
+            (to_timestamp("2020-01-01"), to_timestamp("2020-01-03")),
+        ]
+    assert state_sync.get_snapshot_table_infos(snapshots) == {
+        s.snapshot_id: s.table_info for s in snapshots
+    }
+
+    state_sync.close()
+    assert read_pool._executor is None
+
+
+def test_compact_intervals_batches(
+    state_sync: EngineAdapterStateSync,
+    make_snapshot: t.Callable,
+    get_snapshot_intervals: t.Callable,
+    mocker: MockerFixture,
+) -> None:
+    snapshots = [
+        make_snapshot(
+            SqlModel(
+                name=name,
+                cron="@daily",
+                query=parse_one("select 1, ds"),
+            ),
+            version=name,
+        )
+        for name in ("a", "b", "c")
+    ]
+    state_sync.push_snapshots(snapshots)
+    for snapshot in snapshots:
+        state_sync.add_interval(snapshot, "2020-01-01", "2020-01-01")
+        state_sync.add_interval(snapshot, "2020-01-02", "2020-01-02")
+        state_sync.add_interval(snapshot, "2020-01-04", "2020-01-04")
+
+    interval_state = state_sync.interval_state
+    interval_state.COMPACTION_BATCH_SIZE = 2
+    delete_from_spy = mocker.spy(state_sync.engine_adapter, "delete_from")
+
+    def interval_deletes() -> t.List[t.Any]:
+        return [
+            call
+            for call in delete_from_spy.call_args_list
+            if call[0][0] == interval_state.intervals_table
+        ]
+
+    mocker.patch.object(state_sync.engine_adapter, "SUPPORTS_TRANSACTIONS", True)
+    connection_pool = state_sync.engine_adapter._connection_pool
+    commit = connection_pool.commit
+    deletes_at_commit = []
+
+    def commit_and_count() -> None:
+        deletes_at_commit.append(len(interval_deletes()))
+        commit()
+
+    mocker.patch.object(connection_pool, "commit", side_effect=commit_and_count)
+
+    stats = state_sync.compact_intervals()
+
+    assert stats == IntervalCompactionStats(snapshot_versions=3, rows_read=9, rows_written=6)
+    # Each batch of snapshot versions is committed separately, before the next one is deleted
+    assert 1 in deletes_at_commit
+    assert deletes_at_commit[-1] == 2
+    # Only the rows that have been read are deleted
+    deletes = interval_deletes()
+    assert len(deletes) == 2
+    assert {col.name for col in deletes[-1][0][1].find_all(exp.Column)} == {"id"}
+    for snapshot in snapshots:
+        assert get_snapshot_intervals(snapshot).intervals == [
+            (to_timestamp("2020-01-01"), to_timestamp("2020-01-03")),
+            (to_timestamp("2020-01-04"), to_timestamp("2020-01-05")),
+        ]
+
+    # Rows added after the watermark are left for the next pass
+    interval_state.COMPACTION_LAG_MS = 60 * 60 * 1000
+    state_sync.add_interval(snapshots[0], "2020-01-03", "2020-01-03")
+    assert interval_state.compact_intervals() == IntervalCompactionStats()
+
+    interval_state.COMPACTION_LAG_MS = 0
+    assert interval_state.compact_intervals([snapshots[1], snapshots[0]]) == IntervalCompactionStats(
+        snapshot_versions=1, rows_read=3, rows_written=1
+    )
+    assert get_snapshot_intervals(snapshots[0]).intervals == [
+        (to_timestamp("2020-01-01"), to_timestamp("2020-01-05")),
+    ]
+    assert state_sync.engine_adapter.fetchone(
+        "SELECT COUNT(*) FROM sqlmesh._intervals WHERE NOT is_compacted"
+    ) == (0,)
+
+
+def test_compact_intervals_keeps_rows_visible_after_read(
+    state_sync: EngineAdapterStateSync,
+    make_snapshot: t.Callable,
+    get_snapshot_intervals: t.Callable,
+    mocker: MockerFixture,
+) -> None:
+    snapshot = make_snapshot(
+        SqlModel(name="a", cron="@daily", query=parse_one("select 1, ds")), version="a"
+    )
+    state_sync.push_snapshots([snapshot])
+    state_sync.add_interval(snapshot, "2020-01-01", "2020-01-01")
+
+    interval_state = state_sync.interval_state
+    fetch_interval_rows = interval_state._fetch_interval_rows
+
+    def fetch_interval_rows_then_write(*args: t.Any, **kwargs: t.Any) -> t.Iterator[t.Tuple]:
+        rows = list(fetch_interval_rows(*args, **kwargs))
+        # A row of a long-running transaction becomes visible once the rows have been read, even though it
+        # was created before the watermark
+        interval_state._push_snapshot_intervals(
+            [
+                SnapshotIntervals(
+                    name=snapshot.name,
+                    identifier=snapshot.identifier,
+                    version=snapshot.version,
+                    dev_version=snapshot.dev_version,
+                    intervals=[(to_timestamp("2020-01-03"), to_timestamp("2020-01-04"))],
+                )
+            ],
+            created_ts=rows[0][-1],
+        )
+        return iter(rows)
+
+    mocker.patch.object(
+        interval_state, "_fetch_interval_rows", side_effect=fetch_interval_rows_then_write
+    )
+    assert interval_state.compact_intervals() == IntervalCompactionStats(
+        snapshot_versions=1, rows_read=1, rows_written=1
+    )
+    mocker.stopall()
+
+    assert get_snapshot_intervals(snapshot).intervals == [
+        (to_timestamp("2020-01-01"), to_timestamp("2020-01-02")),
+        (to_timestamp("2020-01-03"), to_timestamp("2020-01-04")),
+    ]
+    assert interval_state.compact_intervals() == IntervalCompactionStats(
+        snapshot_versions=1, rows_read=2, rows_written=2
+    )
+
+
+def test_compact_intervals_threshold(
+    state_sync: EngineAdapterStateSync,
+    make_snapshot: t.Callable,
+    get_snapshot_intervals: t.Callable,
+    mocker: MockerFixture,
+) -> None:
+    snapshot_a = make_snapshot(
+        SqlModel(name="a", cron="@daily", query=parse_one("select 1, ds")), version="a"
+    )
+    snapshot_b = make_snapshot(
+        SqlModel(name="b", cron="@daily", query=parse_one("select 1, ds")), version="b"
+    )
+    state_sync.push_snapshots([snapshot_a, snapshot_b])
+    state_sync.interval_state.COMPACTION_THRESHOLD = 3
+
+    def uncompacted_rows(snapshot: Snapshot) -> int:
+        return state_sync.engine_adapter.fetchone(  # type: ignore
+            "SELECT COUNT(*) FROM sqlmesh._intervals WHERE NOT is_compacted AND name = "
+            f"'{snapshot.name}'"
+        )[0]
+
+    state_sync.add_interval(snapshot_b, "2020-01-01", "2020-01-01")
+    state_sync.add_interval(snapshot_a, "2020-01-01", "2020-01-01")
+    state_sync.add_interval(snapshot_a, "2020-01-02", "2020-01-02")
+    assert uncompacted_rows(snapshot_a) == 2
+
+    # Reaching the threshold triggers compaction
+    state_sync.add_interval(snapshot_a, "2020-01-03", "2020-01-03")
+    assert uncompacted_rows(snapshot_a) == 0
+
+    state_sync.add_interval(snapshot_a, "2020-01-04", "2020-01-04")
+    assert uncompacted_rows(snapshot_a) == 1
+    # Only the snapshot versions to which intervals have been added are compacted
+    assert uncompacted_rows(snapshot_b) == 1
+
+    # Compaction doesn't extend the caller's transaction
+    mocker.patch.object(state_sync.engine_adapter, "SUPPORTS_TRANSACTIONS", True)
+    with state_sync.engine_adapter.transaction():
+        state_sync.add_interval(snapshot_b, "2020-01-02", "2020-01-02")
+        state_sync.add_interval(snapshot_b, "2020-01-03", "2020-01-03")
+    assert uncompacted_rows(snapshot_b) == 3
+
+    assert get_snapshot_intervals(snapshot_a).intervals == [
+        (to_timestamp("2020-01-01"), to_timestamp("2020-01-05")),
+    ]
 
 
 def test_promote_snapshots(state_sync: EngineAdapterStateSync, make_snapshot: t.Callable):
@@ -1124,6 +1392,50 @@ def test_delete_expired_environments(state_sync: EngineAdapterStateSync, make_sn
     # Deleting the environments should remove the corresponding environment's statements
     assert state_sync.get_environment_statements(env_a.name) == []
 
+    # As well as the membership of its snapshots
+    assert state_sync.engine_adapter.fetchall(
+        exp.select("environment_name", "name", "identifier").from_(
+            state_sync.environment_state.environment_snapshots_table
+        )
+    ) == [(env_b.name, snapshot.name, snapshot.identifier)]
+
+
+def test_environment_snapshots_migration(
+    state_sync: EngineAdapterStateSync, make_snapshot: t.Callable
+):
+    from sqlmesh.migrations import v0100_add_environment_snapshots
+
+    snapshot_a = make_snapshot(SqlModel(name="a", query=parse_one("select 1 as a")))
+    snapshot_b = make_snapshot(SqlModel(name="b", query=parse_one("select 1 as b")))
+    for snapshot in (snapshot_a, snapshot_b):
+        snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+    state_sync.push_snapshots([snapshot_a, snapshot_b])
+
+    environment = Environment(
+        name="test_environment",
+        snapshots=[snapshot_a.table_info, snapshot_b.table_info],
+        start_at="2022-01-01",
+        end_at="2022-01-01",
+        plan_id="test_plan_id",
+    )
+    state_sync.promote(environment)
+
+    environment_snapshots_table = state_sync.environment_state.environment_snapshots_table
+    query = (
+        exp.select("environment_name", "name", "identifier", "version")
+        .from_(environment_snapshots_table)
+        .order_by("name")
+    )
+    expected = [
+        (environment.name, s.name, s.identifier, s.version) for s in (snapshot_a, snapshot_b)
+    ]
+    assert state_sync.engine_adapter.fetchall(query) == expected
+
+    # Rows of existing environments are backfilled by the migration
+    state_sync.engine_adapter.delete_from(environment_snapshots_table, where=exp.true())
+    v0100_add_environment_snapshots.migrate_rows(state_sync)
+    assert state_sync.engine_adapter.fetchall(query) == expected
+
 
 def test_delete_expired_snapshots(state_sync: EngineAdapterStateSync, make_snapshot: t.Callable):
     now_ts = now_timestamp()
@@ -1237,6 +1549,36 @@ def test_delete_expired_snapshots_batching(
     assert not state_sync.get_snapshots(all_snapshots)
 
 
+def test_delete_expired_snapshots_paging(
+    state_sync: EngineAdapterStateSync, make_snapshot: t.Callable
+):
+    state_sync.snapshot_state.EXPIRED_SNAPSHOT_BATCH_SIZE = 1
+    now_ts = now_timestamp()
+
+    snapshots = []
+    for name in ("a", "b", "c"):
+        snapshot = make_snapshot(SqlModel(name=name, query=parse_one("select a, ds")))
+        snapshot.ttl = "in 10 seconds"
+        snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+        snapshot.updated_ts = now_ts - 15000
+        snapshots.append(snapshot)
+
+    unexpired_snapshot = make_snapshot(SqlModel(name="b", query=parse_one("select b, ds")))
+    unexpired_snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+
+    state_sync.push_snapshots([*snapshots, unexpired_snapshot])
+
+    assert state_sync.get_expired_snapshots() == [
+        SnapshotTableCleanupTask(snapshot=snapshot.table_info, dev_table_only=False)
+        for snapshot in snapshots
+    ]
+
+    # Expired snapshots are deleted while the following pages are being fetched
+    state_sync.delete_expired_snapshots()
+    assert not state_sync.get_snapshots(snapshots)
+    assert state_sync.get_snapshots([unexpired_snapshot])
+
+
 def test_delete_expired_snapshots_promoted(
     state_sync: EngineAdapterStateSync, make_snapshot: t.Callable, mocker: MockerFixture
 ):
@@ -2429,6 +2771,85 @@ def test_nodes_exist(state_sync: EngineAdapterStateSync, make_snapshot: t.Callab
     assert state_sync.nodes_exist([snapshot.name]) == {snapshot.name}
 
 
+def test_get_snapshot_table_infos(
+    state_sync: EngineAdapterStateSync, make_snapshot: t.Callable, mocker: MockerFixture
+):
+    snapshot_a = make_snapshot(SqlModel(name="a", query=parse_one("select 1, ds")))
+    snapshot_a.categorize_as(SnapshotChangeCategory.BREAKING)
+    snapshot_b = make_snapshot(SqlModel(name="b", query=parse_one("select 2, ds")))
+    snapshot_b.categorize_as(SnapshotChangeCategory.BREAKING)
+    state_sync.push_snapshots([snapshot_a, snapshot_b])
+    state_sync.snapshot_state.clear_cache()
+
+    parse_snapshot_spy = mocker.patch(
+        "sqlmesh.core.state_sync.db.snapshot.parse_snapshot", side_effect=parse_snapshot
+    )
+    table_infos = state_sync.get_snapshot_table_infos(
+        [snapshot_a.snapshot_id, snapshot_b.snapshot_id]
+    )
+    assert table_infos == {
+        snapshot_a.snapshot_id: snapshot_a.table_info,
+        snapshot_b.snapshot_id: snapshot_b.table_info,
+    }
+    assert table_infos[snapshot_a.snapshot_id].physical_schema == snapshot_a.physical_schema
+    assert table_infos[snapshot_a.snapshot_id].table_name() == snapshot_a.table_name()
+    parse_snapshot_spy.assert_not_called()
+
+    # The forward-only flag is read from its own column
+    state_sync.engine_adapter.execute("UPDATE sqlmesh._snapshots SET forward_only = TRUE")
+    assert state_sync.get_snapshot_table_infos([snapshot_a])[snapshot_a.snapshot_id].forward_only
+
+    # Snapshots stored without table infos fall back to their full payloads
+    state_sync.engine_adapter.execute(
+        f"UPDATE sqlmesh._snapshots SET table_info = NULL WHERE name = '{snapshot_b.name}'"
+    )
+    table_info_b = state_sync.get_snapshot_table_infos([snapshot_b])[snapshot_b.snapshot_id]
+    assert table_info_b == snapshot_b.table_info
+    assert table_info_b.forward_only
+    parse_snapshot_spy.assert_called_once()
+
+    assert not state_sync.get_snapshot_table_infos([SnapshotId(name="c", identifier="1")])
+
+
+def test_get_snapshots_parallel_parse(
+    state_sync: EngineAdapterStateSync, make_snapshot: t.Callable, mocker: MockerFixture
+):
+    snapshots = [
+        make_snapshot(SqlModel(name=name, query=parse_one("select 1, ds"))) for name in "abc"
+    ]
+    for snapshot in snapshots:
+        snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+    state_sync.push_snapshots(snapshots)
+    state_sync.snapshot_state.clear_cache()
+
+    mocker.patch("sqlmesh.core.constants.MAX_FORK_WORKERS", 2)
+    # Use a synchronous executor in place of the fork pool to be able to spy on the workers
+    pool_mock = mocker.patch(
+        "sqlmesh.core.state_sync.db.snapshot.create_process_pool_executor",
+        side_effect=lambda max_workers: SynchronousPoolExecutor(),
+    )
+    parse_row_spy = mocker.patch(
+        "sqlmesh.core.state_sync.db.snapshot._parse_snapshot_row", side_effect=_parse_snapshot_row
+    )
+
+    state_sync.snapshot_state.PARALLEL_PARSE_THRESHOLD = 3
+    assert state_sync.get_snapshots(snapshots) == {s.snapshot_id: s for s in snapshots}
+    pool_mock.assert_called_once_with(max_workers=2)
+    assert parse_row_spy.call_count == 3
+
+    # Small batches are parsed in the current process
+    state_sync.snapshot_state.clear_cache()
+    state_sync.get_snapshots(snapshots[:2])
+    pool_mock.assert_called_once()
+    assert parse_row_spy.call_count == 5
+
+
+def test_json_loads_large_integers():
+    # Integers that don't fit into 64 bits aren't supported by all JSON parsers
+    assert _json_loads('{"a": 18446744073709551616}') == {"a": 2**64}
+    assert _json_loads(b'{"a": [1, "b"]}') == {"a": [1, "b"]}
+
+
 def test_invalidate_environment(state_sync: EngineAdapterStateSync, make_snapshot: t.Callable):
     snapshot = make_snapshot(
         SqlModel(
@@ -2580,6 +3001,56 @@ def test_cache(state_sync, make_snapshot, mocker):
         mock.assert_called()
 
 
+def test_cache_lru(state_sync, make_snapshot, mocker):
+    cache = CachingStateSync(state_sync, ttl=10, max_size=2)
+
+    snapshots = []
+    for name in ("a", "b", "c"):
+        snapshot = make_snapshot(SqlModel(name=name, query=parse_one("select 1, ds")))
+        snapshot.categorize_as(SnapshotChangeCategory.BREAKING)
+        snapshots.append(snapshot)
+    snapshot_a, snapshot_b, snapshot_c = snapshots
+    state_sync.push_snapshots(snapshots)
+
+    now_timestamp = mocker.patch("sqlmesh.core.state_sync.cache.now_timestamp")
+    now_timestamp.return_value = to_timestamp("2023-01-01 00:00:00")
+
+    cache.get_snapshots([snapshot_a, snapshot_b])
+    # Touch a so that b becomes the least recently used snapshot
+    cache.get_snapshots([snapshot_a])
+    cache.get_snapshots([snapshot_c])
+
+    assert list(cache.snapshot_cache) == [snapshot_a.snapshot_id, snapshot_c.snapshot_id]
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 3
+    assert cache.stats.evictions == 1
+
+    # Table infos don't depend on mutable fields, so they're served after the TTL has passed
+    now_timestamp.return_value = to_timestamp("2023-01-01 00:00:11")
+    with patch.object(state_sync, "get_snapshot_table_infos") as mock:
+        assert cache.get_snapshot_table_infos([snapshot_a]) == {
+            snapshot_a.snapshot_id: snapshot_a.table_info
+        }
+        mock.assert_not_called()
+    assert cache.stats.hits == 2
+
+    # Whereas snapshots are refreshed
+    with patch.object(state_sync, "get_snapshots", return_value={}) as mock:
+        cache.get_snapshots([snapshot_a])
+        mock.assert_called_once_with({snapshot_a.snapshot_id})
+    assert cache.stats.misses == 4
+
+    # Snapshots that are known not to exist are served from the cache too
+    assert cache.snapshots_exist([snapshot_a, snapshot_c]) == {snapshot_c.snapshot_id}
+    assert cache.stats.hits == 3
+    assert cache.stats.misses == 5
+
+    # Unpausing snapshots modifies all snapshots with the same name
+    cache.get_snapshots([snapshot_c])
+    cache.unpause_snapshots([snapshot_c], "2023-01-01")
+    assert snapshot_c.snapshot_id not in cache.snapshot_cache
+
+
 def test_cleanup_expired_views(
     mocker: MockerFixture, state_sync: EngineAdapterStateSync, make_snapshot: t.Callable
 ):
@@ -2879,6 +3350,50 @@ def test_max_interval_end_per_model_ensure_finalized_snapshots(
     assert state_sync.max_interval_end_per_model(environment_name, set()) == {}
 
 
+def test_get_interval_summaries(
+    state_sync: EngineAdapterStateSync, make_snapshot: t.Callable
+) -> None:
+    snapshot_a = make_snapshot(SqlModel(name="a", cron="@daily", query=parse_one("select 1, ds")))
+    snapshot_a.categorize_as(SnapshotChangeCategory.BREAKING)
+    snapshot_b = make_snapshot(SqlModel(name="b", cron="@daily", query=parse_one("select 2, ds")))
+    snapshot_b.categorize_as(SnapshotChangeCategory.BREAKING)
+    state_sync.push_snapshots([snapshot_a, snapshot_b])
+
+    assert state_sync.get_interval_summaries([snapshot_a, snapshot_b]) == {}
+
+    state_sync.add_interval(snapshot_a, "2023-01-01", "2023-01-02")
+    state_sync.add_interval(snapshot_a, "2023-01-05", "2023-01-05")
+    state_sync.add_interval(snapshot_b, "2023-01-03", "2023-01-03", is_dev=True)
+
+    assert state_sync.get_interval_summaries([snapshot_a, snapshot_b]) == {
+        snapshot_a.name_version: IntervalSummary(
+            name=snapshot_a.name,
+            version=snapshot_a.version,
+            min_start_ts=to_timestamp("2023-01-01"),
+            max_end_ts=to_timestamp("2023-01-06"),
+        ),
+    }
+
+    # Removed intervals are reflected once they've been merged with the added ones
+    state_sync.remove_intervals(
+        [(snapshot_a, snapshot_a.get_removal_interval("2023-01-05", "2023-01-05"))]
+    )
+    state_sync.compact_intervals()
+    assert state_sync.get_interval_summaries([snapshot_a]) == {
+        snapshot_a.name_version: IntervalSummary(
+            name=snapshot_a.name,
+            version=snapshot_a.version,
+            min_start_ts=to_timestamp("2023-01-01"),
+            max_end_ts=to_timestamp("2023-01-03"),
+        ),
+    }
+
+    state_sync.interval_state.cleanup_intervals(
+        [SnapshotTableCleanupTask(snapshot=snapshot_a.table_info, dev_table_only=False)], []
+    )
+    assert state_sync.get_interval_summaries([snapshot_a, snapshot_b]) == {}
+
+
 def test_get_snapshots(mocker):
     mock = mocker.MagicMock()
     cache = CachingStateSync(mock)
@@ -1,7 +1,9 @@
 import logging
+import os
 import pathlib
 import typing as t
 import re
+import sqlite3
 from datetime import date, timedelta, datetime
 from tempfile import TemporaryDirectory
 from unittest.mock import PropertyMock, call, patch
@@ -39,12 +41,16 @@ from sqlmesh.core.environment import Environment, EnvironmentNamingInfo, Environ
 from sqlmesh.core.plan.definition import Plan
 from sqlmesh.core.macros import MacroEvaluator, RuntimeStage
 from sqlmesh.core.model import load_sql_based_model, model, SqlModel, Model
+from sqlmesh.core.model import schema
 from sqlmesh.core.model.common import ParsableSql
 from sqlmesh.core.model.cache import OptimizedQueryCache
 from sqlmesh.core.renderer import render_statements
 from sqlmesh.core.model.kind import ModelKindName
 from sqlmesh.core.state_sync.cache import CachingStateSync
+from sqlmesh.core.state_sync.common import ExpiredSnapshotBatch
+from sqlmesh.core.snapshot import SnapshotId
 from sqlmesh.core.state_sync.db import EngineAdapterStateSync
+from sqlmesh.utils.cache import CacheCodec, FileCache
 from sqlmesh.utils.connection_pool import SingletonConnectionPool, ThreadLocalSharedConnectionPool
 from sqlmesh.utils.date import (
     make_inclusive_end,
@@ -722,6 +728,28 @@ def test_cache_path_configurations(tmp_path: pathlib.Path):
     assert context.cache_dir == project_dir / ".cache"
 
 
+def test_cache_store_configuration(tmp_path: pathlib.Path):
+    project_dir = tmp_path / "project"
+    (project_dir / "models").mkdir(parents=True)
+    (project_dir / "models" / "a.sql").write_text("MODEL (name test.a); SELECT 1 AS col")
+    (project_dir / "config.yaml").write_text(
+        "model_defaults:\n  dialect: duckdb\ncache_store: sqlite\ncache_codec: none"
+    )
+
+    context = Context(paths=str(project_dir))
+    assert (context.cache_dir / "cache.db").exists()
+    assert not (context.cache_dir / "model_definition").exists()
+    with sqlite3.connect(context.cache_dir / "cache.db") as connection:
+        versions = [row[0] for row in connection.execute("SELECT DISTINCT version FROM entries")]
+    assert versions and all(version.endswith("_none") for version in versions)
+
+    # The store and codec only apply to the caches of this context
+    other_cache: FileCache[str] = FileCache(tmp_path / "other_cache", prefix="test")
+    other_cache.put("name", value="value")
+    assert (tmp_path / "other_cache" / "test").is_dir()
+    assert other_cache._codec == CacheCodec.GZIP
+
+
 def test_plan_apply_populates_cache(copy_to_temp_path, mocker):
     sushi_paths = copy_to_temp_path("examples/sushi")
     sushi_path = sushi_paths[0]
@@ -1030,7 +1058,7 @@ def test_janitor(sushi_context, mocker: MockerFixture) -> None:
     sushi_context._engine_adapter = adapter_mock
     sushi_context.engine_adapters = {sushi_context.config.default_gateway: adapter_mock}
     sushi_context._state_sync = state_sync_mock
-    state_sync_mock.get_expired_snapshots.return_value = []
+    state_sync_mock.get_expired_snapshot_batches.return_value = []
 
     sushi_context._run_janitor()
     # Assert that the schemas are dropped just twice for the schema based environment
@@ -1057,6 +1085,38 @@ def test_janitor(sushi_context, mocker: MockerFixture) -> None:
     )
 
 
+def test_janitor_batches_and_time_budget(mocker: MockerFixture) -> None:
+    context = Context(config=Config())
+    state_sync_mock = mocker.MagicMock()
+    state_sync_mock.get_expired_environments.return_value = []
+    context._state_sync = state_sync_mock
+    cleanup_mock = mocker.patch("sqlmesh.core.snapshot.evaluator.SnapshotEvaluator.cleanup")
+
+    batches = [
+        ExpiredSnapshotBatch(
+            snapshot_ids={SnapshotId(name=f"a{i}", identifier="1")}, cleanup_tasks=[]
+        )
+        for i in range(3)
+    ]
+    state_sync_mock.get_expired_snapshot_batches.side_effect = lambda **kwargs: iter(batches)
+
+    # Records of each batch are deleted as soon as its tables are dropped
+    context._run_janitor()
+    assert cleanup_mock.call_count == 3
+    assert state_sync_mock.delete_expired_snapshot_batch.call_args_list == [
+        call(batch) for batch in batches
+    ]
+    state_sync_mock.compact_intervals.assert_called_once()
+
+    # The janitor stops after the first batch once the time budget is exceeded
+    cleanup_mock.reset_mock()
+    state_sync_mock.reset_mock()
+    context._run_janitor(time_budget=0)
+    assert cleanup_mock.call_count == 1
+    assert state_sync_mock.delete_expired_snapshot_batch.call_args_list == [call(batches[0])]
+    state_sync_mock.compact_intervals.assert_not_called()
+
+
 @pytest.mark.slow
 def test_plan_default_end(sushi_context_pre_scheduling: Context):
     prod_plan_builder = sushi_context_pre_scheduling.plan_builder("prod")
@@ -1405,6 +1465,40 @@ def test_wildcard(copy_to_temp_path: t.Callable):
     assert len(context.models) == 5
 
 
+def test_incremental_load(tmp_path: Path, mocker: MockerFixture):
+    config = Config(model_defaults=ModelDefaultsConfig(dialect="duckdb"))
+    create_temp_file(tmp_path, Path("models/a.sql"), "MODEL (name test.a); SELECT 1 AS col_a")
+    create_temp_file(tmp_path, Path("models/b.sql"), "MODEL (name test.b); SELECT * FROM test.a")
+    create_temp_file(tmp_path, Path("models/c.sql"), "MODEL (name test.c); SELECT 1 AS col_c")
+
+    context = Context(paths=tmp_path, config=config)
+    previous_models = dict(context._models)
+
+    # Nothing has changed, so the previous instances are reused without recomputing any schemas
+    load_spy = mocker.spy(schema, "load_optimized_query_and_mapping")
+    context.load(incremental=True)
+    assert load_spy.call_count == 0
+    assert all(context._models[name] is model for name, model in previous_models.items())
+
+    a_path = create_temp_file(
+        tmp_path, Path("models/a.sql"), "MODEL (name test.a); SELECT 1 AS col_a, 2 AS col_b"
+    )
+    mtime = a_path.stat().st_mtime + 10
+    os.utime(a_path, (mtime, mtime))
+
+    context.refresh()
+
+    # Only the changed model and its downstream model have been processed again
+    assert {call.args[0].fqn for call in load_spy.call_args_list} == {
+        '"memory"."test"."a"',
+        '"memory"."test"."b"',
+    }
+    assert context._models['"memory"."test"."c"'] is previous_models['"memory"."test"."c"']
+    assert context._models['"memory"."test"."b"'] is not previous_models['"memory"."test"."b"']
+    assert list(context.get_model("test.b").columns_to_types) == ["col_a", "col_b"]
+    assert list(previous_models['"memory"."test"."b"'].columns_to_types) == ["col_a"]
+
+
 def test_duckdb_state_connection_automatic_multithreaded_mode(tmp_path):
     single_threaded_config = Config(
         model_defaults=ModelDefaultsConfig(dialect="duckdb"),
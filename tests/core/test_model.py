@@ -11498,6 +11498,87 @@ def test_render_query_optimize_query_false(assert_exp_eq, sushi_context):
     )
 
 
+def test_render_query_from_time_template(mocker: MockerFixture):
+    model = load_sql_based_model(
+        d.parse(
+            """
+            MODEL (name db.model, kind INCREMENTAL_BY_TIME_RANGE (time_column ds));
+
+            SELECT a, ds, @start_ts AS start_ts FROM db.source WHERE ds BETWEEN @start_ds AND @end_ds
+            """
+        )
+    )
+    renderer = model._query_renderer
+    render_spy = mocker.spy(renderer, "_render_query")
+
+    def render(day: int, **kwargs: t.Any) -> exp.Query:
+        start = to_timestamp("2024-01-01") + day * 86400000
+        return model.render_query_or_raise(
+            start=start,
+            end=start + 86400000 - 1,
+            execution_time="2024-02-01",
+            runtime_stage=RuntimeStage.EVALUATING,
+            **kwargs,
+        )
+
+    # The first batch is rendered in full and the template is only rendered for the second one
+    render(0)
+    assert render_spy.call_count == 1
+    render(1)
+    assert render_spy.call_count == 2
+    expected = render(2)
+    assert render_spy.call_count == 2
+    assert expected.sql() == renderer._render_query(
+        to_timestamp("2024-01-03"),
+        to_timestamp("2024-01-04") - 1,
+        "2024-02-01",
+        runtime_stage=RuntimeStage.EVALUATING,
+    ).sql()
+    assert "'2024-01-03 00:00:00' AS \"start_ts\"" in expected.sql()
+
+    # Different render arguments require a new template
+    render_spy.reset_mock()
+    render(3, table_mapping={'"db"."source"': "db.other"})
+    assert render_spy.call_count == 1
+    render(4, table_mapping={'"db"."source"': "db.other"})
+    assert render_spy.call_count == 2
+    assert "'2024-01-06'" in render(5, table_mapping={'"db"."source"': "db.other"}).sql()
+    assert render_spy.call_count == 2
+
+    # Queries that don't reference time variables are rendered once
+    model = load_sql_based_model(
+        d.parse(
+            """
+            MODEL (name db.model, kind FULL);
+
+            SELECT a, ds FROM db.source
+            """
+        )
+    )
+    render_spy = mocker.spy(model._query_renderer, "_render_query")
+    expected = render(0)
+    assert render_spy.call_count == 1
+    assert render(1).sql() == expected.sql()
+    assert render(1) is not render(1)
+    assert render_spy.call_count == 1
+
+    # Time variables passed to macro functions can only be rendered in full
+    model = load_sql_based_model(
+        d.parse(
+            """
+            MODEL (name db.model, kind INCREMENTAL_BY_TIME_RANGE (time_column ds));
+
+            SELECT a, ds FROM db.source WHERE ds BETWEEN @start_ds AND @end_ds AND @IF(@start_ds > '2024-01-02', TRUE, FALSE)
+            """
+        )
+    )
+    render_spy = mocker.spy(model._query_renderer, "_render_query")
+    assert "FALSE" in render(0).sql()
+    assert "TRUE" in render(2).sql()
+    assert render_spy.call_count == 2
+    assert model._query_renderer._supports_time_template is False
+
+
 def test_each_macro_with_paren_expression_arg(assert_exp_eq):
     expressions = d.parse(
         """
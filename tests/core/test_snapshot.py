@@ -1,5 +1,6 @@
 import pickle
 import json
+import random
 import typing as t
 from copy import deepcopy
 from datetime import datetime, timedelta
@@ -54,6 +55,8 @@ from sqlmesh.core.snapshot import (
     has_paused_forward_only,
     missing_intervals,
 )
+from sqlmesh.core.model.cache import _init_optimized_query_cache
+from sqlmesh.core.snapshot import cache as snapshot_cache
 from sqlmesh.core.snapshot.cache import SnapshotCache
 from sqlmesh.core.snapshot.categorizer import categorize_change
 from sqlmesh.core.snapshot.definition import (
@@ -61,16 +64,19 @@ from sqlmesh.core.snapshot.definition import (
     display_name,
     get_next_model_interval_start,
     check_ready_intervals,
+    expand_range,
     _contiguous_intervals,
     table_name,
     TableNamingConvention,
 )
 from sqlmesh.core.config.common import VirtualEnvironmentMode
 from sqlmesh.utils import AttributeDict
+from sqlmesh.utils.cron import CroniterCache
 from sqlmesh.utils.date import DatetimeRanges, to_date, to_datetime, to_timestamp
 from sqlmesh.utils.errors import SQLMeshError, SignalEvalError
 from sqlmesh.utils.jinja import JinjaMacroRegistry, MacroInfo
 from sqlmesh.utils.hashing import md5
+from sqlmesh.utils.process import SynchronousPoolExecutor
 from sqlmesh.core.console import get_console
 
 
@@ -2720,6 +2726,39 @@ def test_snapshot_cache(make_snapshot, tmp_path):
     assert loader_called_times == 2
 
 
+def test_snapshot_cache_reuses_pool_and_skips_hydrated_models(make_snapshot, tmp_path, mocker):
+    mocker.patch("sqlmesh.core.constants.MAX_FORK_WORKERS", 2)
+    # Use a synchronous executor in place of the fork pool to be able to spy on the workers
+    pool_mock = mocker.patch.object(
+        snapshot_cache,
+        "optimized_query_cache_pool",
+        side_effect=lambda cache: SynchronousPoolExecutor(
+            initializer=_init_optimized_query_cache, initargs=(cache,)
+        ),
+    )
+    load_spy = mocker.spy(snapshot_cache, "load_optimized_query")
+    cache = SnapshotCache(tmp_path / "snapshot_cache")
+
+    snapshot = make_snapshot(SqlModel(name="test_model_name", query=parse_one("SELECT 1")))
+    snapshot.model.render_query()
+
+    # The loaded model has already been rendered, so there's nothing to hydrate
+    cache.get_or_load({snapshot.snapshot_id}, lambda _: [snapshot])
+    assert pool_mock.call_count == 0
+    assert load_spy.call_count == 0
+
+    # Models unpickled from the cache are hydrated using the same pool across calls
+    for _ in range(2):
+        snapshots, cache_hits = cache.get_or_load({snapshot.snapshot_id}, lambda _: [])
+        assert cache_hits == {snapshot.snapshot_id}
+        assert snapshots[snapshot.snapshot_id].model._query_renderer._optimized_cache is not None
+
+    assert pool_mock.call_count == 1
+    assert load_spy.call_count == 2
+
+    cache.close()
+
+
 def test_snapshot_pickle_intervals(make_snapshot):
     snapshot = make_snapshot(
         SqlModel(
@@ -3592,3 +3631,90 @@ def test_snapshot_id_and_version_optional_kind_name():
     assert snapshot.model_kind_name
     assert snapshot.is_incremental_unmanaged
     assert snapshot.full_history_restatement_only
+
+
+FIXED_INTERVAL_UNITS = [
+    IntervalUnit.DAY,
+    IntervalUnit.HOUR,
+    IntervalUnit.HALF_HOUR,
+    IntervalUnit.QUARTER_HOUR,
+    IntervalUnit.FIVE_MINUTE,
+]
+
+
+def _croniter_expand_range(start_ts: int, end_ts: int, interval_unit: IntervalUnit) -> t.List[int]:
+    croniter = CroniterCache(interval_unit.cron_expr, start_ts)
+    timestamps = [start_ts]
+    while True:
+        ts = to_timestamp(croniter.get_next(estimate=True))
+        if ts > end_ts:
+            if timestamps[-1] != end_ts:
+                timestamps.append(end_ts)
+            break
+        timestamps.append(ts)
+    return timestamps
+
+
+@pytest.mark.parametrize("interval_unit", FIXED_INTERVAL_UNITS)
+@pytest.mark.parametrize("seed", range(10))
+def test_expand_range_fixed_interval_unit(interval_unit: IntervalUnit, seed: int):
+    rng = random.Random(seed)
+    unit_ms = interval_unit.milliseconds
+    start_ts = to_timestamp("2020-01-01") + rng.randint(0, 1000) * unit_ms
+    if seed % 2:
+        # Start in the middle of an interval
+        start_ts += rng.randint(1, unit_ms - 1)
+    end_ts = start_ts + rng.randint(0, 500) * unit_ms + rng.choice([0, rng.randint(1, unit_ms - 1)])
+
+    expand_range.cache_clear()
+    assert expand_range(start_ts, end_ts, interval_unit) == _croniter_expand_range(
+        start_ts, end_ts, interval_unit
+    )
+
+
+@pytest.mark.parametrize("interval_unit", FIXED_INTERVAL_UNITS)
+def test_expand_range_fixed_interval_unit_edge_cases(interval_unit: IntervalUnit):
+    start_ts = to_timestamp("2024-03-10")
+    for end_ts in (start_ts, start_ts + 1, start_ts - 1, start_ts + interval_unit.milliseconds):
+        expand_range.cache_clear()
+        assert expand_range(start_ts, end_ts, interval_unit) == _croniter_expand_range(
+            start_ts, end_ts, interval_unit
+        )
+
+
+@pytest.mark.parametrize("interval_unit", FIXED_INTERVAL_UNITS)
+@pytest.mark.parametrize("seed", range(10))
+def test_fixed_interval_unit_cron_matches_croniter(interval_unit: IntervalUnit, seed: int):
+    rng = random.Random(seed)
+    unit_ms = interval_unit.milliseconds
+    value = to_datetime("2020-01-01") + timedelta(
+        milliseconds=rng.randint(0, 1000) * unit_ms + rng.choice([0, 1, rng.randint(1, unit_ms - 1)]),
+        microseconds=rng.choice([0, rng.randint(1, 999)]),
+    )
+
+    assert interval_unit.fixed_interval_seconds == interval_unit.seconds
+    for estimate in (False, True):
+        croniter = interval_unit.croniter(value)
+        croniter.get_next(estimate=estimate)
+        assert interval_unit.cron_floor(value, estimate=estimate) == croniter.get_prev(estimate=True)
+        assert interval_unit.cron_next(value, estimate=estimate) == interval_unit.croniter(
+            value
+        ).get_next(estimate=estimate)
+        assert interval_unit.cron_prev(value, estimate=estimate) == interval_unit.croniter(
+            value
+        ).get_prev(estimate=estimate)
+
+
+def test_variable_interval_unit_uses_croniter():
+    assert IntervalUnit.MONTH.fixed_interval_seconds == 0
+    assert IntervalUnit.YEAR.fixed_interval_seconds == 0
+
+    expand_range.cache_clear()
+    assert expand_range(
+        to_timestamp("2024-01-15"), to_timestamp("2024-04-01"), IntervalUnit.MONTH
+    ) == [
+        to_timestamp("2024-01-15"),
+        to_timestamp("2024-02-01"),
+        to_timestamp("2024-03-01"),
+        to_timestamp("2024-04-01"),
+    ]
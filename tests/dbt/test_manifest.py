@@ -168,12 +168,56 @@ def test_call_cache():
 
     unused = "0000"
     helper._call_cache.put("", value={unused: "unused"})
+    helper._digest_cache.clear()
     helper._load_all()
     calls = set(helper._call_cache.get("").keys())
     assert len(calls) >= 300
     assert unused not in calls
 
 
+@pytest.mark.slow
+def test_manifest_digest(create_empty_project, mocker, monkeypatch):
+    project_path, models_path = create_empty_project(project_name="local")
+    model_file = models_path / "model_a.sql"
+    model_file.write_text("SELECT '{{ env_var(\"TEST_MANIFEST_DIGEST\") }}' AS a")
+    monkeypatch.setenv("TEST_MANIFEST_DIGEST", "a")
+
+    profile = Profile.load(DbtContext(project_path))
+    load_manifest_spy = mocker.spy(ManifestHelper, "_load_manifest")
+
+    def load_models():
+        helper = ManifestHelper(
+            project_path,
+            project_path,
+            "local",
+            profile.target,
+            model_defaults=ModelDefaultsConfig(start="2020-01-01"),
+        )
+        models = helper.models()
+        assert helper.node_attributes("model.local.model_a")["name"] == "model_a"
+        assert helper.flat_graph["nodes"]["model.local.model_a"]["name"] == "model_a"
+        return models
+
+    models = load_models()
+    assert load_manifest_spy.call_count == 1
+
+    # Nothing changed, so the manifest isn't parsed again
+    assert load_models() == models
+    assert load_manifest_spy.call_count == 1
+
+    # Environment variables referenced by the project invalidate the digest
+    monkeypatch.setenv("TEST_MANIFEST_DIGEST", "b")
+    assert load_models()["model_a"].sql == models["model_a"].sql
+    assert load_manifest_spy.call_count == 2
+
+    # So do changes to project files
+    model_file.write_text("SELECT 'updated' AS a")
+    assert load_models()["model_a"].sql == "SELECT 'updated' AS a"
+    assert load_manifest_spy.call_count == 3
+    assert load_models()["model_a"].sql == "SELECT 'updated' AS a"
+    assert load_manifest_spy.call_count == 3
+
+
 @pytest.mark.xdist_group("dbt_manifest")
 def test_variable_override():
     project_path = Path("tests/fixtures/dbt/sushi_test")
@@ -1,8 +1,10 @@
 import os
+import shutil
 import pytest
 
 from sqlmesh import Context
 from sqlmesh.core.model import schema
+from sqlmesh.dbt import loader as dbt_loader
 import concurrent.futures
 
 
@@ -86,3 +88,29 @@ def test_parallel_load_multi_repo(assert_exp_eq, mocker):
     )
 
     context.plan(no_prompts=True, auto_apply=True)
+
+
+def test_parallel_load_dbt(mocker, tmp_path):
+    shutil.copytree(
+        "examples/sushi_dbt",
+        tmp_path / "sushi_dbt",
+        symlinks=True,
+        ignore=shutil.ignore_patterns(".cache", "target", "logs"),
+    )
+
+    serial_context = Context(paths=tmp_path / "sushi_dbt")
+    serial_context.clear_caches()
+
+    mocker.patch("sqlmesh.core.constants.MAX_FORK_WORKERS", 2)
+    create_pool = mocker.spy(dbt_loader, "create_process_pool_executor")
+    context = Context(paths=tmp_path / "sushi_dbt")
+
+    create_pool.assert_called_once()
+    assert create_pool.call_args[1]["max_workers"] == 2
+
+    # Models are loaded in the same order as when they're converted serially
+    assert list(context.models) == list(serial_context.models)
+    assert [model.data_hash for model in context.models.values()] == [
+        model.data_hash for model in serial_context.models.values()
+    ]
+    assert all(model._path for model in context.models.values())
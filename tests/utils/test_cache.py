@@ -1,13 +1,19 @@
+import os
+import pickle
+import sqlite3
+import sys
 import typing as t
 from pathlib import Path
 
+import pytest
 from pytest_mock.plugin import MockerFixture
-from sqlglot import parse_one
+from sqlglot import exp, parse_one
 
 from sqlmesh.core import dialect as d
 from sqlmesh.core.model import SqlModel, load_sql_based_model
 from sqlmesh.core.model.cache import OptimizedQueryCache
-from sqlmesh.utils.cache import FileCache
+from sqlmesh.utils.cache import CacheCodec, CacheStore, FileCache, SQLiteCacheStore
+from sqlmesh.utils.errors import SQLMeshError
 from sqlmesh.utils.pydantic import PydanticModel
 
 
@@ -15,8 +21,10 @@ class _TestEntry(PydanticModel):
     value: str
 
 
-def test_file_cache(tmp_path: Path, mocker: MockerFixture):
-    cache: FileCache[_TestEntry] = FileCache(tmp_path)
+@pytest.mark.parametrize("store", [CacheStore.FILE, CacheStore.SQLITE])
+@pytest.mark.parametrize("codec", [CacheCodec.GZIP, CacheCodec.NONE])
+def test_file_cache(tmp_path: Path, mocker: MockerFixture, store: CacheStore, codec: CacheCodec):
+    cache: FileCache[_TestEntry] = FileCache(tmp_path, store=store, codec=codec)
 
     test_entry_a = _TestEntry(value="value_a")
     test_entry_b = _TestEntry(value="value_b")
@@ -40,6 +48,136 @@ def test_file_cache(tmp_path: Path, mocker: MockerFixture):
 
     assert "___test_model_" in cache._cache_entry_path('"test_model"').name
 
+    assert cache.exists("test_name", "test_entry_b")
+    cache.clear()
+    assert not cache.exists("test_name", "test_entry_b")
+    assert cache.get("test_name", "test_entry_a") is None
+
+
+@pytest.mark.parametrize("store", [CacheStore.FILE, CacheStore.SQLITE])
+@pytest.mark.parametrize("num_entries", [3, 100])
+def test_file_cache_get_put_many(tmp_path: Path, store: CacheStore, num_entries: int):
+    cache: FileCache[_TestEntry] = FileCache(tmp_path, store=store)
+
+    entries = {f"name_{i}": _TestEntry(value=f"value_{i}") for i in range(num_entries)}
+    cache.put_many(entries, "entry_id")
+
+    names = [*entries, "missing"]
+    assert cache.get_many(names, "entry_id") == entries
+    assert cache.get_many(names, "other_entry_id") == {}
+    assert all(cache.get(name, "entry_id") == entry for name, entry in entries.items())
+
+
+def test_cache_codec_compact_expressions():
+    query = parse_one("SELECT DATE_TRUNC('q', a) /* comment */ AS a, CAST(b AS INT) AS b FROM tbl")
+    query.selects[0].type = "date"
+    query.meta["key"] = "value"
+
+    decoded = CacheCodec.NONE.loads(CacheCodec.NONE.dumps({"query": query}))["query"]
+
+    assert decoded == query
+    assert decoded.sql() == query.sql()
+    assert decoded.selects[0].type.sql() == "DATE"
+    assert decoded.selects[0].comments == query.selects[0].comments == [" comment "]
+    assert decoded.meta == {"key": "value"}
+    assert decoded.parent is None
+    assert all(
+        child.parent is node for node in decoded.walk() for child in node.iter_expressions()
+    )
+
+    # Compact encoding of expressions makes entries smaller
+    assert len(CacheCodec.NONE.dumps(query)) < len(pickle.dumps(query))
+
+
+@pytest.mark.parametrize("codec", [CacheCodec.GZIP, CacheCodec.NONE])
+def test_cache_codec_deep_expressions(tmp_path: Path, codec: CacheCodec):
+    query = parse_one(f"SELECT {' + '.join(f'c{i}' for i in range(3000))} FROM t")
+
+    # Expressions this deep can't be compared directly without exceeding the recursion limit
+    decoded = codec.loads(codec.dumps({"query": query}))["query"]
+    assert decoded.sql() == query.sql()
+
+    cache: FileCache[exp.Expression] = FileCache(tmp_path, codec=codec)
+    cache.put("query", value=query)
+    assert cache.get("query").sql() == query.sql()  # type: ignore
+
+
+def test_cache_codec_invalidates_entries(tmp_path: Path):
+    FileCache(tmp_path, codec=CacheCodec.GZIP).put("name", value="gzip_value")
+    none_cache: FileCache[str] = FileCache(tmp_path, codec=CacheCodec.NONE)
+
+    assert none_cache.get("name") is None
+    none_cache.put("name", value="none_value")
+    assert none_cache.get("name") == "none_value"
+
+
+def test_cache_codec_missing_package(mocker: MockerFixture):
+    mocker.patch.dict(sys.modules, {"lz4": None, "lz4.frame": None})
+    with pytest.raises(SQLMeshError, match="requires the 'lz4' package"):
+        CacheCodec.LZ4.ensure_available()
+
+
+def test_sqlite_cache_store(tmp_path: Path, mocker: MockerFixture):
+    cache_a: FileCache[str] = FileCache(tmp_path, prefix="a", store=CacheStore.SQLITE)
+    cache_b: FileCache[str] = FileCache(tmp_path, prefix="b", store=CacheStore.SQLITE)
+
+    cache_a.put("name", value="value_a")
+    cache_b.put("name", value="value_b")
+    assert cache_a.get("name") == "value_a"
+    assert cache_b.get("name") == "value_b"
+
+    # All namespaces share a single database file
+    assert [p.name for p in tmp_path.iterdir() if not p.name.startswith("cache.db-")] == [
+        "cache.db"
+    ]
+
+    cache_b.clear()
+    assert cache_a.get("name") == "value_a"
+    assert cache_b.get("name") is None
+
+    # Entries created by a different cache version are evicted when the cache is opened
+    cache_a._cache_version = "old_version"
+    cache_a.put("name", value="old_value")
+    assert FileCache(tmp_path, prefix="a", store=CacheStore.SQLITE).get("name") == "value_a"
+    assert cache_a.get("name") is None
+
+    # The database file isn't checked on every access
+    mock_monotonic = mocker.patch("sqlmesh.utils.cache.time.monotonic", return_value=0)
+    exists_spy = mocker.spy(os.path, "exists")
+    assert cache_b.get("name") is None
+    assert cache_b.get("name") is None
+    assert not exists_spy.called
+
+    # The database is recreated if it was removed along with the cache folder
+    connection = cache_b._sqlite_store._connection  # type: ignore
+    (tmp_path / "cache.db").unlink()
+    mock_monotonic.return_value = float("inf")
+    assert cache_b.get("name") is None
+    with pytest.raises(sqlite3.ProgrammingError):
+        connection.execute("SELECT 1")
+    cache_b.put("name", value="value_b")
+    assert cache_b.get("name") == "value_b"
+
+
+def test_sqlite_cache_store_evicts_least_recently_accessed(tmp_path: Path, mocker: MockerFixture):
+    store = SQLiteCacheStore(tmp_path / "cache.db", max_size=1000)
+    mock_time = mocker.patch("sqlmesh.utils.cache.time.time")
+
+    for i in range(8):
+        mock_time.return_value = i * 10_000
+        store.put("", f"key_{i}", "version", b"x" * 100)
+
+    # Accessing an entry makes it the most recently used one
+    mock_time.return_value = 100_000
+    assert store.get("", "key_0") is not None
+
+    mock_time.return_value = 200_000
+    store.put("", "key_8", "version", b"x" * 300)
+
+    assert store.exists("", "key_0")
+    assert not any(store.exists("", f"key_{i}") for i in range(1, 4))
+    assert all(store.exists("", f"key_{i}") for i in range(4, 9))
+
 
 def test_optimized_query_cache(tmp_path: Path, mocker: MockerFixture):
     model = SqlModel(
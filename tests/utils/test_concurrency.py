@@ -1,12 +1,17 @@
+import threading
+
 import pytest
 from pytest_mock.plugin import MockerFixture
 
 from sqlmesh.core.snapshot import SnapshotId
 from sqlmesh.utils.concurrency import (
     NodeExecutionFailedError,
+    concurrent_apply_to_dag,
     concurrent_apply_to_snapshots,
     concurrent_apply_to_values,
+    critical_path_priority,
 )
+from sqlmesh.utils.dag import DAG
 
 
 @pytest.mark.parametrize("tasks_num", [1, 2])
@@ -147,3 +152,78 @@ def test_concurrent_apply(tasks_num: int):
     values = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
     results = concurrent_apply_to_values(values, lambda x: x * 2, tasks_num)
     assert results == [x * 2 for x in values]
+
+
+def test_concurrent_apply_to_dag_priority():
+    dag: DAG[str] = DAG({"a": set(), "b": set(), "c": set(), "d": set(), "e": {"a", "b", "c", "d"}})
+    priorities = {"a": 3, "b": 2, "c": 1, "d": 0, "e": 0}
+
+    processed_nodes = []
+    barrier = threading.Barrier(2)
+
+    def process(node: str) -> None:
+        processed_nodes.append(node)
+        if node in ("c", "d"):
+            barrier.wait(timeout=5)
+
+    errors, skipped = concurrent_apply_to_dag(dag, process, 2, priority=lambda n: priorities[n])
+
+    assert not errors
+    assert not skipped
+    # The two nodes with the lowest keys are submitted before any other node
+    assert set(processed_nodes[:2]) == {"c", "d"}
+    assert processed_nodes[-1] == "e"
+
+
+def test_concurrent_apply_to_dag_large_chain():
+    num_nodes = 5000
+    dag: DAG[int] = DAG({i: {i - 1} if i else set() for i in range(num_nodes)})
+
+    processed_nodes = []
+    errors, skipped = concurrent_apply_to_dag(dag, lambda n: processed_nodes.append(n), 4)
+
+    assert not errors
+    assert not skipped
+    assert processed_nodes == list(range(num_nodes))
+
+
+def test_concurrent_apply_to_dag_skip_only_downstream():
+    dag: DAG[str] = DAG(
+        {
+            "a": set(),
+            "b": {"a"},
+            "c": {"b"},
+            "d": {"a", "c"},
+            "e": set(),
+            "f": {"e"},
+        }
+    )
+
+    def raise_(node: str) -> None:
+        if node == "b":
+            raise RuntimeError("fail")
+
+    errors, skipped = concurrent_apply_to_dag(dag, raise_, 2, raise_on_error=False)
+
+    assert [e.node for e in errors] == ["b"]
+    assert skipped == ["c", "d"]
+
+
+def test_critical_path_priority():
+    dag: DAG[str] = DAG(
+        {
+            "a": set(),
+            "b": {"a"},
+            "c": {"b"},
+            "d": set(),
+            "e": {"d"},
+        }
+    )
+
+    priority = critical_path_priority(dag)
+    assert [priority(n) for n in "abcde"] == [-3, -2, -1, -2, -1]
+
+    costs = {"a": 1, "b": 1, "c": 1, "d": 10, "e": 1}
+    priority = critical_path_priority(dag, cost=lambda n: costs[n])
+    assert [priority(n) for n in "abcde"] == [-3, -2, -1, -11, -1]
+    assert sorted("abcde", key=priority)[0] == "d"
@@ -0,0 +1,133 @@
+import random
+import typing as t
+
+import pytest
+from pytest_mock.plugin import MockerFixture
+
+from sqlmesh.core.node import IntervalUnit
+from sqlmesh.core.snapshot.definition import (
+    Interval,
+    _contiguous_intervals,
+    compute_missing_intervals,
+    merge_intervals,
+    remove_interval,
+)
+from sqlmesh.utils import intervals as vectorized
+from sqlmesh.utils.date import to_timestamp
+
+
+def _random_intervals(rng: random.Random, num: int, max_ts: int = 1000) -> t.List[Interval]:
+    intervals = []
+    for _ in range(num):
+        start = rng.randint(0, max_ts)
+        intervals.append((start, start + rng.randint(0, 50)))
+    return intervals
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_merge_intervals(seed: int):
+    rng = random.Random(seed)
+    intervals = _random_intervals(rng, rng.randint(1, 200))
+    expected = _python_merge_intervals(intervals)
+    assert vectorized.merge_intervals(intervals) == expected
+    assert merge_intervals(intervals) == expected
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_remove_interval(seed: int):
+    rng = random.Random(seed)
+    intervals = merge_intervals(_random_intervals(rng, rng.randint(1, 200)))
+    remove_start = rng.randint(0, 1000)
+    remove_end = remove_start + rng.randint(0, 300)
+
+    expected = _python_remove_interval(intervals, remove_start, remove_end)
+    assert vectorized.remove_interval(intervals, remove_start, remove_end) == expected
+    assert remove_interval(intervals, remove_start, remove_end) == expected
+
+
+def test_contiguous_intervals_vectorized():
+    intervals = [(i, i + 1) for i in range(100)] + [(i, i + 1) for i in range(200, 300)]
+    result = _contiguous_intervals(intervals)
+    assert len(result) == 2
+    assert result[0] == intervals[:100]
+    assert result[1] == intervals[100:]
+
+
+@pytest.mark.parametrize(
+    "interval_unit, num_intervals",
+    [
+        (IntervalUnit.HOUR, 24 * 30),
+        (IntervalUnit.FIVE_MINUTE, 12 * 24 * 3),
+        (IntervalUnit.QUARTER_HOUR, 4 * 24 * 7),
+    ],
+)
+@pytest.mark.parametrize("lookback", [0, 2])
+@pytest.mark.parametrize("with_model_end", [False, True])
+def test_compute_missing_intervals_matches_python(
+    mocker: MockerFixture,
+    interval_unit: IntervalUnit,
+    num_intervals: int,
+    lookback: int,
+    with_model_end: bool,
+):
+    rng = random.Random(num_intervals + lookback)
+    start_ts = to_timestamp("2024-01-01")
+    unit_ms = interval_unit.milliseconds
+    end_ts = start_ts + num_intervals * unit_ms
+    model_end_ts = start_ts + (num_intervals // 2) * unit_ms + 1 if with_model_end else None
+
+    stored = merge_intervals(
+        [
+            (start_ts + i * unit_ms, start_ts + (i + rng.randint(1, 5)) * unit_ms)
+            for i in sorted(rng.sample(range(num_intervals), num_intervals // 3))
+        ]
+    )
+
+    compute_missing_intervals.cache_clear()
+    actual = compute_missing_intervals(
+        interval_unit, tuple(stored), start_ts, end_ts, lookback, model_end_ts
+    )
+
+    mocker.patch.object(vectorized, "VECTORIZE_THRESHOLD", 10**9)
+    compute_missing_intervals.cache_clear()
+    expected = compute_missing_intervals(
+        interval_unit, tuple(stored), start_ts, end_ts, lookback, model_end_ts
+    )
+    compute_missing_intervals.cache_clear()
+
+    assert actual == expected
+    assert all(isinstance(ts, int) for interval in actual for ts in interval)
+
+
+def test_missing_mask_unsorted_intervals():
+    import numpy as np
+
+    timestamps = np.arange(0, 10, dtype=np.int64)
+    assert vectorized.missing_mask(timestamps, [(5, 6), (0, 1)]) is None
+    assert vectorized.missing_mask(timestamps, [(0, 5), (3, 8)]).tolist() == [False] * 8 + [True]
+
+
+def _python_merge_intervals(intervals: t.List[Interval]) -> t.List[Interval]:
+    intervals = sorted(intervals)
+    merged = [intervals[0]]
+    for interval in intervals[1:]:
+        current = merged[-1]
+        if interval[0] <= current[1]:
+            merged[-1] = (current[0], max(current[1], interval[1]))
+        else:
+            merged.append(interval)
+    return merged
+
+
+def _python_remove_interval(
+    intervals: t.List[Interval], remove_start: int, remove_end: int
+) -> t.List[Interval]:
+    modified = []
+    for start, end in intervals:
+        if remove_start > start and remove_end < end:
+            modified.extend(((start, remove_start), (remove_end, end)))
+        elif remove_start > start:
+            modified.append((start, min(remove_start, end)))
+        elif remove_end < end:
+            modified.append((max(remove_end, start), end))
+    return modified
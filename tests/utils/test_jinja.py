@@ -114,6 +114,56 @@ def test_macro_registry_render_different_vars():
     assert rendered == "test_b"
 
 
+def test_macro_registry_reuses_environment(mocker):
+    from jinja2 import Environment
+
+    package_a = "{% macro macro_a_a() %}{{ external() }}{% endmacro %}"
+
+    local_macros = "{% macro local_macro() %}{{ package_a.macro_a_a() }}{% endmacro %}"
+
+    extractor = MacroExtractor()
+    registry = JinjaMacroRegistry()
+
+    registry.add_macros(extractor.extract(local_macros))
+    registry.add_macros(extractor.extract(package_a), package="package_a")
+
+    env_a = registry.build_environment(external=lambda: "test_a")
+    env_b = registry.build_environment(external=lambda: "test_b")
+
+    # Macros are shared, but each environment renders them with its own globals
+    assert env_a.globals["local_macro"] is env_b.globals["local_macro"]
+    assert env_a.globals["package_a"]["macro_a_a"] is env_b.globals["package_a"]["macro_a_a"]
+    assert env_a.linked_to is env_b.linked_to
+
+    compile_spy = mocker.spy(Environment, "compile")
+    source = "{{ local_macro() }} -- reuses_environment"
+    assert env_b.from_string(source).render() == "test_b -- reuses_environment"
+    assert env_a.from_string(source).render() == "test_a -- reuses_environment"
+    assert [call.args[1] for call in compile_spy.call_args_list].count(source) == 1
+
+    macro = registry.build_macro(
+        MacroReference(name="macro_a_a", package="package_a"), external=lambda: "test_c"
+    )
+    assert macro() == "test_c"
+
+    registry.add_macros(
+        extractor.extract("{% macro local_macro() %}updated{% endmacro %}"),
+    )
+    env = registry.build_environment(external=lambda: "test_a")
+    assert env.globals["local_macro"] is not env_a.globals["local_macro"]
+
+
+def test_macro_registry_root_package_name_assigned():
+    extractor = MacroExtractor()
+    registry = JinjaMacroRegistry()
+    registry.add_macros(extractor.extract("{% macro foo() %}foo{% endmacro %}"))
+
+    assert registry.build_environment().from_string("{{ foo() }}").render() == "foo"
+
+    registry.root_package_name = "proj"
+    assert registry.build_environment().from_string("{{ proj.foo() }}").render() == "foo"
+
+
 def test_macro_registry_trim():
     package_a = """
 {% macro macro_a_a() %}macro_a_a{% endmacro %}
@@ -460,6 +460,36 @@ def test_serialize_env_with_enum_import_appearing_in_two_functions() -> None:
     assert serialized_env == expected_env
 
 
+def test_prepare_env_reuses_compiled_code() -> None:
+    from sqlmesh.utils.metaprogramming import _compile_payload
+
+    python_env = {
+        "counter": Executable(
+            name="counter",
+            payload="""def counter():
+    global calls
+    calls = globals().get("calls", 0) + 1
+    return calls""",
+            path="/test/path.py",
+        ),
+        "values": Executable.value({"a": [1, 2]}),
+    }
+
+    _compile_payload.cache_clear()
+    env_a = prepare_env(python_env)
+    env_b = prepare_env(python_env)
+    assert _compile_payload.cache_info().hits == 2
+
+    # Environments don't share state even though they've been prepared from the same compiled code
+    assert env_a["counter"]() == 1
+    assert env_a["counter"]() == 2
+    assert env_b["counter"]() == 1
+    assert env_a["counter"] is not env_b["counter"]
+
+    env_a["values"]["a"].append(3)
+    assert env_b["values"] == {"a": [1, 2]}
+
+
 def test_dict_sort_basic_types():
     """Test dict_sort with basic Python types."""
     # Test basic types that should use standard repr